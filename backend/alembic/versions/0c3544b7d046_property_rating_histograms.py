@@ -0,0 +1,51 @@
+"""property rating histograms
+
+Revision ID: 0c3544b7d046
+Revises: e8a24aa7b888
+Create Date: 2026-10-17 12:58:20.114307
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import numpy as np
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0c3544b7d046'
+down_revision: Union[str, None] = 'e8a24aa7b888'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+RATING_FIELDS = [
+    'rating_plumbing', 'rating_electricity', 'rating_water', 'rating_it_cabling',
+    'rating_hvac', 'rating_amenity_stove', 'rating_amenity_washer', 'rating_amenity_fridge',
+    'rating_infra_water_tank', 'rating_infra_irrigation', 'rating_health_dust',
+    'rating_health_breathing', 'rating_health_sewage',
+]
+
+
+def upgrade() -> None:
+    op.add_column('property_rating_stats', sa.Column('histogram', sa.LargeBinary(), nullable=True))
+
+    # Backfill: one (categories x 5) little-endian int32 matrix per property
+    conn = op.get_bind()
+    rows = conn.execute(sa.text(
+        f"SELECT property_id, {', '.join(RATING_FIELDS)} FROM property_reviews "
+        "WHERE status = 'published' ORDER BY property_id"
+    ))
+    histograms: dict = {}
+    for property_id, *ratings in rows:
+        hist = histograms.setdefault(property_id, np.zeros((len(RATING_FIELDS), 5), dtype='<i4'))
+        for i, value in enumerate(ratings):
+            if value is not None:
+                hist[i, value - 1] += 1
+    update = sa.text(
+        "UPDATE property_rating_stats SET histogram = :histogram WHERE property_id = :property_id"
+    )
+    for property_id, hist in histograms.items():
+        conn.execute(update, {'property_id': property_id, 'histogram': hist.tobytes()})
+
+
+def downgrade() -> None:
+    op.drop_column('property_rating_stats', 'histogram')
@@ -0,0 +1,49 @@
+"""review near-duplicate index
+
+Revision ID: 12c96b0fd754
+Revises: 60bd09877262
+Create Date: 2026-10-17 16:31:08.214590
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '12c96b0fd754'
+down_revision: Union[str, None] = '60bd09877262'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing reviews are indexed by `python -m app.index_reviews`
+    op.create_table(
+        'review_signatures',
+        sa.Column('review_type', sa.String(length=20), nullable=False),
+        sa.Column('review_id', sa.UUID(), nullable=False),
+        sa.Column('signature', sa.LargeBinary(), nullable=False),
+        sa.Column(
+            'created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True
+        ),
+        sa.PrimaryKeyConstraint('review_type', 'review_id'),
+    )
+    op.create_table(
+        'review_lsh_bands',
+        sa.Column('review_type', sa.String(length=20), nullable=False),
+        sa.Column('review_id', sa.UUID(), nullable=False),
+        sa.Column('band_index', sa.SmallInteger(), nullable=False),
+        sa.Column('band_hash', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('review_type', 'review_id', 'band_index'),
+    )
+    op.create_index(
+        'ix_review_lsh_bands_lookup', 'review_lsh_bands',
+        ['review_type', 'band_index', 'band_hash'], unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_review_lsh_bands_lookup', table_name='review_lsh_bands')
+    op.drop_table('review_lsh_bands')
+    op.drop_table('review_signatures')
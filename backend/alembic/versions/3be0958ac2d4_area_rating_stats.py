@@ -0,0 +1,93 @@
+"""community and city rating stats
+
+Revision ID: 3be0958ac2d4
+Revises: 618ed5ea153d
+Create Date: 2026-10-17 15:20:33.618402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '3be0958ac2d4'
+down_revision: Union[str, None] = '618ed5ea153d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CATEGORIES = [
+    'plumbing', 'electricity', 'water', 'it_cabling', 'hvac', 'amenity_stove',
+    'amenity_washer', 'amenity_fridge', 'infra_water_tank', 'infra_irrigation',
+    'health_dust', 'health_breathing', 'health_sewage',
+]
+SUM_COLUMNS = ['review_count', 'overall_sum'] + [
+    f'{cat}_{kind}' for cat in CATEGORIES for kind in ('sum', 'count')
+]
+
+
+def _sum_columns() -> list[sa.Column]:
+    return [
+        sa.Column('review_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column(
+            'overall_sum', sa.Numeric(precision=12, scale=2), nullable=False, server_default='0'
+        ),
+    ] + [
+        sa.Column(f'{cat}_{kind}', sa.Integer(), nullable=False, server_default='0')
+        for cat in CATEGORIES for kind in ('sum', 'count')
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        'community_rating_stats',
+        sa.Column('community_id', sa.UUID(), nullable=False),
+        sa.Column('city_id', sa.UUID(), nullable=False),
+        *_sum_columns(),
+        sa.Column(
+            'updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True
+        ),
+        sa.ForeignKeyConstraint(['community_id'], ['communities.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['city_id'], ['cities.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('community_id'),
+    )
+    op.create_index(
+        op.f('ix_community_rating_stats_city_id'),
+        'community_rating_stats',
+        ['city_id'],
+        unique=False,
+    )
+    op.create_table(
+        'city_rating_stats',
+        sa.Column('city_id', sa.UUID(), nullable=False),
+        *_sum_columns(),
+        sa.Column(
+            'updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True
+        ),
+        sa.ForeignKeyConstraint(['city_id'], ['cities.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('city_id'),
+    )
+
+    # Backfill by rolling up the property-level stats
+    columns = ', '.join(SUM_COLUMNS)
+    sums = ', '.join(f'SUM(s.{c})' for c in SUM_COLUMNS)
+    op.execute(f"""
+        INSERT INTO community_rating_stats (community_id, city_id, {columns})
+        SELECT c.id, c.city_id, {sums}
+        FROM property_rating_stats s
+        JOIN properties p ON p.id = s.property_id
+        JOIN communities c ON c.id = p.community_id
+        GROUP BY c.id, c.city_id
+    """)
+    op.execute(f"""
+        INSERT INTO city_rating_stats (city_id, {columns})
+        SELECT s.city_id, {sums}
+        FROM community_rating_stats s
+        GROUP BY s.city_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('city_rating_stats')
+    op.drop_index(op.f('ix_community_rating_stats_city_id'), table_name='community_rating_stats')
+    op.drop_table('community_rating_stats')
@@ -0,0 +1,28 @@
+"""property review count index
+
+Revision ID: 461776927d1c
+Revises: b51d93cee3cd
+Create Date: 2026-10-18 16:02:41.227315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '461776927d1c'
+down_revision: Union[str, None] = 'b51d93cee3cd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_properties_review_count_id', 'properties',
+        [sa.text('review_count DESC'), 'id'], unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_properties_review_count_id', table_name='properties')
@@ -0,0 +1,64 @@
+"""property rating monthly buckets
+
+Revision ID: 60bd09877262
+Revises: 3be0958ac2d4
+Create Date: 2026-10-17 15:54:12.047731
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '60bd09877262'
+down_revision: Union[str, None] = '3be0958ac2d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CATEGORIES = [
+    'plumbing', 'electricity', 'water', 'it_cabling', 'hvac', 'amenity_stove',
+    'amenity_washer', 'amenity_fridge', 'infra_water_tank', 'infra_irrigation',
+    'health_dust', 'health_breathing', 'health_sewage',
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        'property_rating_monthly',
+        sa.Column('property_id', sa.UUID(), nullable=False),
+        sa.Column('month', sa.Date(), nullable=False),
+        sa.Column('review_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column(
+            'overall_sum', sa.Numeric(precision=12, scale=2), nullable=False, server_default='0'
+        ),
+        *[
+            sa.Column(f'{cat}_{kind}', sa.Integer(), nullable=False, server_default='0')
+            for cat in CATEGORIES for kind in ('sum', 'count')
+        ],
+        sa.Column(
+            'updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True
+        ),
+        sa.ForeignKeyConstraint(['property_id'], ['properties.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('property_id', 'month'),
+    )
+
+    # Backfill from the reviews that are currently published
+    targets = ', '.join(f'{cat}_sum, {cat}_count' for cat in CATEGORIES)
+    sources = ', '.join(
+        f'COALESCE(SUM(rating_{cat}), 0), COUNT(rating_{cat})' for cat in CATEGORIES
+    )
+    op.execute(f"""
+        INSERT INTO property_rating_monthly
+            (property_id, month, review_count, overall_sum, {targets})
+        SELECT property_id,
+               date_trunc('month', COALESCE(published_at, created_at) AT TIME ZONE 'UTC')::date,
+               COUNT(*), SUM(overall_rating), {sources}
+        FROM property_reviews
+        WHERE status = 'published'
+        GROUP BY 1, 2
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('property_rating_monthly')
@@ -0,0 +1,56 @@
+"""review text search
+
+Revision ID: 618ed5ea153d
+Revises: b539faa77923
+Create Date: 2026-10-17 14:02:45.907136
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '618ed5ea153d'
+down_revision: Union[str, None] = 'b539faa77923'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'property_reviews', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True)
+    )
+    # Weighted so searches can be restricted to the public excerpt ('A')
+    op.execute("""
+        CREATE FUNCTION property_reviews_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('simple', coalesce(NEW.public_excerpt, '')), 'A') ||
+                setweight(to_tsvector('simple', NEW.review_text), 'B');
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER property_reviews_search_vector_update
+        BEFORE INSERT OR UPDATE OF public_excerpt, review_text ON property_reviews
+        FOR EACH ROW EXECUTE FUNCTION property_reviews_search_vector_update()
+    """)
+    op.execute("""
+        UPDATE property_reviews SET search_vector =
+            setweight(to_tsvector('simple', coalesce(public_excerpt, '')), 'A') ||
+            setweight(to_tsvector('simple', review_text), 'B')
+    """)
+    op.create_index(
+        'ix_property_reviews_search_vector', 'property_reviews', ['search_vector'],
+        unique=False, postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_property_reviews_search_vector', table_name='property_reviews')
+    op.execute("DROP TRIGGER IF EXISTS property_reviews_search_vector_update ON property_reviews")
+    op.execute("DROP FUNCTION IF EXISTS property_reviews_search_vector_update()")
+    op.drop_column('property_reviews', 'search_vector')
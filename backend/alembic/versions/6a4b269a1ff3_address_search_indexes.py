@@ -0,0 +1,52 @@
+"""address search indexes
+
+Revision ID: 6a4b269a1ff3
+Revises: 84d2a1f10ef3
+Create Date: 2026-10-17 10:03:41.771920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '6a4b269a1ff3'
+down_revision: Union[str, None] = '84d2a1f10ef3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.add_column('properties', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+    op.execute("""
+        CREATE TRIGGER properties_search_vector_update
+        BEFORE INSERT OR UPDATE OF address_line ON properties
+        FOR EACH ROW EXECUTE FUNCTION
+        tsvector_update_trigger(search_vector, 'pg_catalog.simple', address_line)
+    """)
+    op.execute("UPDATE properties SET search_vector = to_tsvector('simple', address_line)")
+
+    op.create_index(
+        'ix_properties_search_vector', 'properties', ['search_vector'],
+        unique=False, postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_properties_address_line_trgm', 'properties', ['address_line'],
+        unique=False, postgresql_using='gin', postgresql_ops={'address_line': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_communities_name_trgm', 'communities', ['name'],
+        unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_communities_name_trgm', table_name='communities')
+    op.drop_index('ix_properties_address_line_trgm', table_name='properties')
+    op.drop_index('ix_properties_search_vector', table_name='properties')
+    op.execute("DROP TRIGGER IF EXISTS properties_search_vector_update ON properties")
+    op.drop_column('properties', 'search_vector')
@@ -0,0 +1,45 @@
+"""property-scoped unlocks
+
+Revision ID: 749cc66a8087
+Revises: 12c96b0fd754
+Create Date: 2026-10-17 17:12:40.583216
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '749cc66a8087'
+down_revision: Union[str, None] = '12c96b0fd754'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'unlocks',
+        sa.Column('scope', sa.String(length=20), nullable=False, server_default='review'),
+    )
+    op.add_column('unlocks', sa.Column('property_id', sa.UUID(), nullable=True))
+    op.create_foreign_key(
+        'unlocks_property_id_fkey', 'unlocks', 'properties', ['property_id'], ['id']
+    )
+    op.alter_column('unlocks', 'review_id', existing_type=sa.UUID(), nullable=True)
+    op.create_check_constraint(
+        'ck_unlocks_scope_target', 'unlocks',
+        "(scope = 'review' AND review_id IS NOT NULL AND property_id IS NULL)"
+        " OR (scope = 'property' AND property_id IS NOT NULL AND review_id IS NULL)",
+    )
+    op.create_index('ix_unlocks_user_property', 'unlocks', ['user_id', 'property_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_unlocks_user_property', table_name='unlocks')
+    op.drop_constraint('ck_unlocks_scope_target', 'unlocks', type_='check')
+    op.execute("DELETE FROM unlocks WHERE scope = 'property'")
+    op.alter_column('unlocks', 'review_id', existing_type=sa.UUID(), nullable=False)
+    op.drop_constraint('unlocks_property_id_fkey', 'unlocks', type_='foreignkey')
+    op.drop_column('unlocks', 'property_id')
+    op.drop_column('unlocks', 'scope')
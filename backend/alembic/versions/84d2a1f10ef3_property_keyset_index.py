@@ -0,0 +1,24 @@
+"""property keyset index
+
+Revision ID: 84d2a1f10ef3
+Revises: e6b316fcf5b6
+Create Date: 2026-10-17 09:12:05.418207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '84d2a1f10ef3'
+down_revision: Union[str, None] = 'e6b316fcf5b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_properties_created_at_id', 'properties', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_properties_created_at_id', table_name='properties')
@@ -0,0 +1,26 @@
+"""property geo index
+
+Revision ID: ab6ea8aa8de5
+Revises: 6a4b269a1ff3
+Create Date: 2026-10-17 11:26:09.530114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'ab6ea8aa8de5'
+down_revision: Union[str, None] = '6a4b269a1ff3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_properties_latitude_longitude', 'properties', ['latitude', 'longitude'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_properties_latitude_longitude', table_name='properties')
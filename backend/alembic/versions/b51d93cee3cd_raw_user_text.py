@@ -0,0 +1,35 @@
+"""keep user text as written next to the masked copy
+
+Revision ID: b51d93cee3cd
+Revises: 2a684a3d51de
+Create Date: 2026-10-18 14:21:37.905114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b51d93cee3cd'
+down_revision: Union[str, None] = '2a684a3d51de'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+RAW_COLUMNS = [
+    ('property_reviews', 'review_text_raw'),
+    ('property_reviews', 'public_excerpt_raw'),
+    ('landlord_reviews', 'review_text_raw'),
+    ('messages', 'body_raw'),
+    ('landlord_responses', 'response_text_raw'),
+]
+
+
+def upgrade() -> None:
+    for table, column in RAW_COLUMNS:
+        op.add_column(table, sa.Column(column, sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    for table, column in reversed(RAW_COLUMNS):
+        op.drop_column(table, column)
@@ -0,0 +1,63 @@
+"""landlord rating stats
+
+Revision ID: b539faa77923
+Revises: 0c3544b7d046
+Create Date: 2026-10-17 13:31:07.482915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b539faa77923'
+down_revision: Union[str, None] = '0c3544b7d046'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CATEGORIES = [
+    'responsiveness', 'demeanor', 'repair_payments', 'availability', 'payment_flexibility',
+]
+
+
+def upgrade() -> None:
+    category_columns = []
+    for cat in CATEGORIES:
+        category_columns += [
+            sa.Column(f'{cat}_sum', sa.Integer(), nullable=False, server_default='0'),
+            sa.Column(f'{cat}_count', sa.Integer(), nullable=False, server_default='0'),
+        ]
+    op.create_table(
+        'landlord_rating_stats',
+        sa.Column('landlord_id', sa.UUID(), nullable=False),
+        sa.Column('review_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column(
+            'overall_sum', sa.Numeric(precision=12, scale=2), nullable=False, server_default='0'
+        ),
+        *category_columns,
+        sa.Column('last_review_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            'updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True
+        ),
+        sa.ForeignKeyConstraint(['landlord_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('landlord_id'),
+    )
+
+    # Backfill from the reviews that are currently published
+    targets = ', '.join(f'{cat}_sum, {cat}_count' for cat in CATEGORIES)
+    sources = ', '.join(
+        f'COALESCE(SUM(rating_{cat}), 0), COUNT(rating_{cat})' for cat in CATEGORIES
+    )
+    op.execute(f"""
+        INSERT INTO landlord_rating_stats
+            (landlord_id, review_count, overall_sum, {targets}, last_review_at)
+        SELECT landlord_id, COUNT(*), SUM(overall_rating), {sources}, MAX(published_at)
+        FROM landlord_reviews
+        WHERE status = 'published'
+        GROUP BY landlord_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('landlord_rating_stats')
@@ -0,0 +1,70 @@
+"""property rating stats
+
+Revision ID: e8a24aa7b888
+Revises: ab6ea8aa8de5
+Create Date: 2026-10-17 12:14:52.305518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8a24aa7b888'
+down_revision: Union[str, None] = 'ab6ea8aa8de5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CATEGORIES = [
+    'plumbing', 'electricity', 'water', 'it_cabling', 'hvac', 'amenity_stove',
+    'amenity_washer', 'amenity_fridge', 'infra_water_tank', 'infra_irrigation',
+    'health_dust', 'health_breathing', 'health_sewage',
+]
+
+
+def upgrade() -> None:
+    category_columns = []
+    for cat in CATEGORIES:
+        category_columns += [
+            sa.Column(f'{cat}_sum', sa.Integer(), nullable=False, server_default='0'),
+            sa.Column(f'{cat}_count', sa.Integer(), nullable=False, server_default='0'),
+        ]
+    op.create_table(
+        'property_rating_stats',
+        sa.Column('property_id', sa.UUID(), nullable=False),
+        sa.Column('review_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column(
+            'overall_sum', sa.Numeric(precision=12, scale=2), nullable=False, server_default='0'
+        ),
+        *category_columns,
+        sa.Column(
+            'updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True
+        ),
+        sa.ForeignKeyConstraint(['property_id'], ['properties.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('property_id'),
+    )
+
+    # Backfill from the reviews that are currently published
+    targets = ', '.join(f'{cat}_sum, {cat}_count' for cat in CATEGORIES)
+    sources = ', '.join(
+        f'COALESCE(SUM(rating_{cat}), 0), COUNT(rating_{cat})' for cat in CATEGORIES
+    )
+    op.execute(f"""
+        INSERT INTO property_rating_stats (property_id, review_count, overall_sum, {targets})
+        SELECT property_id, COUNT(*), SUM(overall_rating), {sources}
+        FROM property_reviews
+        WHERE status = 'published'
+        GROUP BY property_id
+    """)
+    op.execute("""
+        UPDATE properties p
+        SET review_count = s.review_count,
+            avg_property_rating = ROUND(s.overall_sum / NULLIF(s.review_count, 0), 2)
+        FROM property_rating_stats s
+        WHERE s.property_id = p.id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('property_rating_stats')
@@ -12,6 +12,7 @@ from app.models.review import LandlordReview, PropertyReview
 from app.models.user import User
 from app.schemas.dispute import DisputeResolveRequest, DisputeResponse
 from app.schemas.message import ReportResponse
+from app.schemas.review import BulkModerationRequest, BulkModerationResponse
 from app.schemas.verification import AdminVerificationUpdateRequest, VerificationDocumentResponse
 from app.services import dispute_service, message_service, review_service, verification_service
 
@@ -76,6 +77,20 @@ async def admin_publish_review(
     return {"status": "published", "review_id": str(review.id)}
 
 
+@router.post("/reviews/bulk", response_model=BulkModerationResponse)
+async def admin_bulk_moderate_reviews(
+    data: BulkModerationRequest,
+    current_user: User = Depends(require_role(UserRole.ADMIN)),
+    db: AsyncSession = Depends(get_db),
+):
+    """Publish or reject up to 500 submitted reviews, with an outcome per review."""
+    outcomes = await review_service.bulk_moderate_reviews(data.review_ids, data.action, db)
+    return {
+        "updated": sum(outcome in ("published", "removed") for _, outcome in outcomes),
+        "results": [{"review_id": rid, "outcome": outcome} for rid, outcome in outcomes],
+    }
+
+
 @router.get("/reports", response_model=list[ReportResponse])
 async def get_reports(
     current_user: User = Depends(require_role(UserRole.ADMIN)),
@@ -1,3 +1,4 @@
+import json
 from uuid import UUID
 
 import stripe
@@ -10,10 +11,14 @@ from app.database import get_db
 from app.dependencies import get_current_user
 from app.models.user import User
 from app.schemas.payment import (
+    BatchUnlockItem,
+    BatchUnlockRequest,
+    BatchUnlockResponse,
     ContactRequestPaymentResponse,
     CreateContactRequestPayment,
     CreditPricingResponse,
     LedgerEntryResponse,
+    PurchasePropertyPassRequest,
     PurchaseUnlockRequest,
     PurchaseUnlockResponse,
     TopupCheckoutResponse,
@@ -21,11 +26,21 @@ from app.schemas.payment import (
     UnlockCheckResponse,
     WalletResponse,
 )
-from app.services import payment_service
+from app.services import entitlement_service, payment_service, webhook_service
 
 router = APIRouter()
 
 
+async def _commit_unlocks(db: AsyncSession) -> None:
+    """Commit a purchase and wait for its entitlement grants before responding.
+
+    ``get_db`` commits after the response is sent, so without this the
+    buyer's next request could still find the review locked.
+    """
+    await db.commit()
+    await entitlement_service.wait_for_grants(db)
+
+
 @router.get("/wallet", response_model=WalletResponse)
 async def get_wallet(
     current_user: User = Depends(get_current_user),
@@ -54,14 +69,17 @@ async def stripe_webhook(
     payload = await request.body()
 
     try:
-        event = stripe.Webhook.construct_event(
+        stripe.Webhook.construct_event(
             payload, stripe_signature, settings.STRIPE_WEBHOOK_SECRET
         )
     except (ValueError, stripe.error.SignatureVerificationError):
         raise BadRequestError("Invalid webhook signature")
 
-    if event["type"] == "checkout.session.completed":
-        await payment_service.handle_topup_completed(event["data"]["object"], db)
+    # Store the event and acknowledge; the webhook worker applies it. Commit
+    # here so that an acknowledged event is always durable.
+    if await webhook_service.record_event(json.loads(payload), db):
+        await db.commit()
+        webhook_service.wake_worker()
 
     return {"status": "ok"}
 
@@ -75,11 +93,49 @@ async def purchase_unlock(
     unlock_id, credits_charged, new_balance = await payment_service.purchase_unlock(
         current_user, data.review_id, data.tier, db
     )
+    await _commit_unlocks(db)
     return PurchaseUnlockResponse(
         unlock_id=unlock_id, credits_charged=credits_charged, new_balance=new_balance
     )
 
 
+@router.post("/unlock/property", response_model=PurchaseUnlockResponse)
+async def purchase_property_pass(
+    data: PurchasePropertyPassRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    unlock_id, credits_charged, new_balance = await payment_service.purchase_property_pass(
+        current_user, data.property_id, data.tier, db
+    )
+    await _commit_unlocks(db)
+    return PurchaseUnlockResponse(
+        unlock_id=unlock_id, credits_charged=credits_charged, new_balance=new_balance
+    )
+
+
+@router.post("/unlock/batch", response_model=BatchUnlockResponse)
+async def purchase_unlocks(
+    data: BatchUnlockRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    lines, credits_charged, new_balance = await payment_service.purchase_unlocks(
+        current_user, [(item.review_id, item.tier) for item in data.items], db
+    )
+    await _commit_unlocks(db)
+    return BatchUnlockResponse(
+        unlocks=[
+            BatchUnlockItem(
+                review_id=review_id, tier=tier, unlock_id=unlock_id, credits_charged=charge
+            )
+            for review_id, tier, unlock_id, charge in lines
+        ],
+        credits_charged=credits_charged,
+        new_balance=new_balance,
+    )
+
+
 @router.post("/contact-request", response_model=ContactRequestPaymentResponse)
 async def purchase_contact_request(
     data: CreateContactRequestPayment,
@@ -124,6 +180,9 @@ async def get_pricing():
         unlock_detailed=settings.CREDIT_PRICE_UNLOCK_DETAILED,
         unlock_full=settings.CREDIT_PRICE_UNLOCK_FULL,
         contact_request=settings.CREDIT_PRICE_CONTACT_REQUEST,
+        property_pass_summary=settings.CREDIT_PRICE_PROPERTY_PASS_SUMMARY,
+        property_pass_detailed=settings.CREDIT_PRICE_PROPERTY_PASS_DETAILED,
+        property_pass_full=settings.CREDIT_PRICE_PROPERTY_PASS_FULL,
         topup_small_cents=settings.CREDIT_TOPUP_SMALL_CENTS,
         topup_small_credits=settings.CREDIT_TOPUP_SMALL_CREDITS,
         topup_medium_cents=settings.CREDIT_TOPUP_MEDIUM_CENTS,
@@ -5,9 +5,9 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.constants import PropertyType, UserRole
+from app.core.exceptions import BadRequestError, NotFoundError
 from app.database import get_db
 from app.dependencies import get_current_user, get_current_user_optional
-from app.models.location import City, Community
 from app.models.property import Property, PropertyOwnershipClaim
 from app.models.user import User
 from app.schemas.common import MessageResponse
@@ -18,11 +18,30 @@ from app.schemas.property import (
     PropertySearchParams,
     PropertyUpdateRequest,
 )
-from app.services import property_service
+from app.services import location_service, property_service
+from app.services.location_service import gazetteer
 
 router = APIRouter()
 
 
+async def _to_list_items(
+    properties: list[Property], db: AsyncSession, distances: list[float] | None = None
+) -> list[dict]:
+    # Community/city names come from the in-memory gazetteer
+    places = await gazetteer.get_index(db)
+
+    items = []
+    for i, p in enumerate(properties):
+        item = PropertyListResponse.model_validate(p)
+        names = places.community_names(p.community_id)
+        if names:
+            item.community_name, item.city_name = names
+        if distances is not None:
+            item.distance_km = round(distances[i], 3)
+        items.append(item.model_dump())
+    return items
+
+
 @router.get("", response_model=dict)
 async def search_properties(
     q: str | None = None,
@@ -33,37 +52,69 @@ async def search_properties(
     bedrooms_max: int | None = None,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    include_total: bool | None = None,
+    facets: bool = False,
     db: AsyncSession = Depends(get_db),
 ):
+    """Property search.
+
+    Pass the returned ``next_cursor`` back as ``cursor`` for keyset paging;
+    ``page`` is ignored in that mode and ``total`` is only counted when
+    ``include_total=true``. ``facets=true`` adds per-type, bedroom and city
+    counts for the same filters.
+    """
     params = PropertySearchParams(
         q=q, community_id=community_id, city_id=city_id,
         property_type=property_type, bedrooms_min=bedrooms_min,
         bedrooms_max=bedrooms_max, page=page, page_size=page_size,
+        cursor=cursor, include_total=include_total,
     )
-    properties, total = await property_service.search_properties(params, db)
+    properties, total, next_cursor = await property_service.search_properties(params, db)
 
-    items = []
-    for p in properties:
-        item = PropertyListResponse.model_validate(p)
-        # Enrich with community/city names
-        if p.community_id:
-            comm_result = await db.execute(select(Community).where(Community.id == p.community_id))
-            comm = comm_result.scalar_one_or_none()
-            if comm:
-                item.community_name = comm.name
-                city_result = await db.execute(select(City).where(City.id == comm.city_id))
-                city = city_result.scalar_one_or_none()
-                if city:
-                    item.city_name = city.name
-        items.append(item)
+    items = await _to_list_items(properties, db)
 
-    return {
-        "items": [i.model_dump() for i in items],
+    response = {
+        "items": items,
         "total": total,
         "page": page,
         "page_size": page_size,
-        "total_pages": (total + page_size - 1) // page_size if total else 0,
+        "total_pages": (total + page_size - 1) // page_size if total is not None else None,
+        "next_cursor": next_cursor,
     }
+    if facets:
+        response["facets"] = await property_service.get_search_facets(params, db)
+    return response
+
+
+@router.get("/nearby", response_model=list[PropertyListResponse])
+async def search_nearby_properties(
+    lat: float = Query(ge=-90, le=90),
+    lng: float = Query(ge=-180, le=180),
+    radius_km: float = Query(2.0, gt=0, le=50),
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_db),
+):
+    hits = await property_service.search_nearby(lat, lng, radius_km, limit, db)
+    return await _to_list_items([p for p, _ in hits], db, [d for _, d in hits])
+
+
+@router.get("/within", response_model=list[PropertyListResponse])
+async def search_properties_within(
+    min_lat: float = Query(ge=-90, le=90),
+    max_lat: float = Query(ge=-90, le=90),
+    min_lng: float = Query(ge=-180, le=180),
+    max_lng: float = Query(ge=-180, le=180),
+    limit: int = Query(500, ge=1, le=2000),
+    db: AsyncSession = Depends(get_db),
+):
+    """Map viewport search. ``min_lng > max_lng`` means the box crosses the antimeridian."""
+    if min_lat > max_lat:
+        raise BadRequestError("min_lat must not exceed max_lat")
+    properties = await property_service.search_within_bounds(
+        min_lat, max_lat, min_lng, max_lng, limit, db
+    )
+    return await _to_list_items(properties, db)
 
 
 @router.get("/{property_id}", response_model=PropertyResponse)
@@ -125,10 +176,30 @@ async def search_communities(
     q: str = Query(min_length=2),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(
-        select(Community)
-        .where(Community.name.ilike(f"%{q}%"), Community.is_active.is_(True))
-        .limit(20)
-    )
-    communities = result.scalars().all()
-    return [{"id": str(c.id), "name": c.name, "slug": c.slug} for c in communities]
+    places, communities = await location_service.search_communities(q, db, limit=20)
+    return [
+        {
+            "id": str(c.id),
+            "name": c.name,
+            "slug": c.slug,
+            "city_name": places.community_names(c.id)[1],
+        }
+        for c in communities
+    ]
+
+
+@router.get("/locations/communities/{slug}")
+async def get_community_by_slug(slug: str, db: AsyncSession = Depends(get_db)):
+    places = await gazetteer.get_index(db)
+    community = places.by_slug.get(slug)
+    if community is None or not community.is_active:
+        raise NotFoundError("Community not found")
+    return {
+        "id": str(community.id),
+        "name": community.name,
+        "slug": community.slug,
+        "parents": [
+            {"id": str(p.id), "kind": p.kind, "name": p.name}
+            for p in places.parent_chain(community.id)[1:]
+        ],
+    }
@@ -1,19 +1,23 @@
+import json
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.constants import UserRole
 from app.database import get_db
-from app.dependencies import get_current_user, get_current_user_optional, get_review_unlock_tier, require_role
+from app.dependencies import get_current_user, get_current_user_optional, require_role
 from app.models.user import User
 from app.schemas.review import (
+    CityHeatmapResponse,
     LandlordReviewCreateRequest,
     LandlordReviewResponse,
+    LandlordScorecardResponse,
     PropertyReviewCreateRequest,
     PropertyReviewResponse,
-    PropertyReviewSnippetResponse,
     PropertyReviewSummaryResponse,
+    PropertyTrendResponse,
+    ReviewSearchHit,
 )
 from app.services import review_service
 
@@ -38,6 +42,41 @@ async def create_landlord_review(
     return await review_service.create_landlord_review(data, current_user, db)
 
 
+@router.get("/search", response_model=dict)
+async def search_reviews(
+    q: str = Query(min_length=2, max_length=100),
+    property_id: UUID | None = None,
+    community_id: UUID | None = None,
+    city_id: UUID | None = None,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    current_user: User | None = Depends(get_current_user_optional),
+    db: AsyncSession = Depends(get_db),
+):
+    """Search published review text within a property, community or city.
+
+    Matches and highlights respect the same unlock tiers as the listing:
+    without an unlock only the public excerpt is searched.
+    """
+    hits, total = await review_service.search_reviews(
+        q,
+        current_user.id if current_user else None,
+        db,
+        property_id=property_id,
+        community_id=community_id,
+        city_id=city_id,
+        page=page,
+        page_size=page_size,
+    )
+    return {
+        "items": [ReviewSearchHit.model_validate(h).model_dump() for h in hits],
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": (total + page_size - 1) // page_size if total else 0,
+    }
+
+
 @router.get("/property/{property_id}/summary", response_model=PropertyReviewSummaryResponse)
 async def get_property_review_summary(
     property_id: UUID,
@@ -47,6 +86,34 @@ async def get_property_review_summary(
     return await review_service.get_property_review_summary(property_id, db)
 
 
+@router.get("/property/{property_id}/trend", response_model=PropertyTrendResponse)
+async def get_property_trend(
+    property_id: UUID,
+    months: int = Query(24, ge=1, le=120),
+    db: AsyncSession = Depends(get_db),
+):
+    """Free tier: monthly rating averages over the last ``months`` months."""
+    return await review_service.get_property_trend(property_id, months, db)
+
+
+@router.get("/city/{city_id}/heatmap", response_model=CityHeatmapResponse)
+async def get_city_heatmap(
+    city_id: UUID,
+    db: AsyncSession = Depends(get_db),
+):
+    """Free tier: category averages for a city and each of its communities."""
+    return await review_service.get_city_heatmap(city_id, db)
+
+
+@router.get("/landlord/{landlord_id}/summary", response_model=LandlordScorecardResponse)
+async def get_landlord_scorecard(
+    landlord_id: UUID,
+    db: AsyncSession = Depends(get_db),
+):
+    """Free tier: a landlord's ratings across their whole portfolio."""
+    return await review_service.get_landlord_scorecard(landlord_id, db)
+
+
 @router.get("/property/{property_id}", response_model=dict)
 async def get_property_reviews(
     property_id: UUID,
@@ -62,43 +129,19 @@ async def get_property_reviews(
     - Detailed unlock: full review text + all category ratings
     - Full unlock: everything including photos and evidence metadata
     """
-    reviews, total = await review_service.get_property_reviews(property_id, db, page, page_size)
-
-    items = []
-    for r in reviews:
-        # Determine unlock tier for this specific review
-        unlock_tier = None
-        if current_user:
-            unlock_tier = await get_review_unlock_tier(r.id, current_user.id, db)
-
-        if unlock_tier == "full":
-            # Full: everything
-            items.append(PropertyReviewResponse.model_validate(r).model_dump())
-        elif unlock_tier == "detailed":
-            # Detailed: full text + ratings, no photos
-            data = PropertyReviewResponse.model_validate(r).model_dump()
-            data["photos"] = []
-            items.append(data)
-        elif unlock_tier == "summary":
-            # Summary: truncated text + overall rating, no category ratings
-            data = PropertyReviewResponse.model_validate(r).model_dump()
-            data["review_text"] = data["review_text"][:200] + "..." if len(data["review_text"]) > 200 else data["review_text"]
-            data["photos"] = []
-            for key in list(data.keys()):
-                if key.startswith("rating_") and key != "overall_rating":
-                    data[key] = None
-            items.append(data)
-        else:
-            # No unlock: snippet only
-            items.append(PropertyReviewSnippetResponse.model_validate(r).model_dump())
+    fragments, total = await review_service.get_property_reviews(
+        property_id, db, page, page_size, user_id=current_user.id if current_user else None
+    )
 
-    return {
-        "items": items,
+    # Items are pre-rendered JSON; splice them into the envelope as bytes
+    meta = json.dumps({
         "total": total,
         "page": page,
         "page_size": page_size,
         "total_pages": (total + page_size - 1) // page_size if total else 0,
-    }
+    })
+    body = b'{"items":[' + b",".join(fragments) + b"]," + meta[1:].encode()
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/my", response_model=dict)
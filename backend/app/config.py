@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
@@ -15,6 +17,13 @@ class Settings(BaseSettings):
     STRIPE_SECRET_KEY: str = ""
     STRIPE_PUBLISHABLE_KEY: str = ""
     STRIPE_WEBHOOK_SECRET: str = ""
+    STRIPE_API_BASE: str = ""  # e.g. http://localhost:12111 for stripe-mock; empty = api.stripe.com
+    STRIPE_TIMEOUT_SECONDS: float = 10.0
+    STRIPE_MAX_NETWORK_RETRIES: int = 2
+    WEBHOOK_WORKER_ENABLED: bool = True
+    WEBHOOK_BATCH_SIZE: int = 100
+    WEBHOOK_POLL_INTERVAL_SECONDS: float = 5.0
+    WEBHOOK_MAX_ATTEMPTS: int = 5
 
     # Storage
     STORAGE_BACKEND: str = "local"
@@ -32,6 +41,25 @@ class Settings(BaseSettings):
     FRONTEND_URL: str = "http://localhost:3001"
     CORS_ORIGINS: list[str] = ["http://localhost:3001"]
     ENVIRONMENT: str = "development"
+    # Worker processes per host; uvicorn --workers and gunicorn read the same variable
+    WEB_CONCURRENCY: int = 1
+
+    # Search
+    FACET_CACHE_TTL_SECONDS: int = 60
+    GAZETTEER_MAX_AGE_SECONDS: int = 300
+    REVIEW_FRAGMENT_CACHE_TTL_SECONDS: int = 300
+
+    # Moderation: estimated Jaccard similarity at which a review is a near-duplicate
+    DUPLICATE_SIMILARITY_THRESHOLD: float = 0.8
+
+    # Entitlements: per-user unlock cache, "redis" (shared between workers) or
+    # "memory", which is only correct with a single worker process
+    ENTITLEMENT_STORE: Literal["memory", "redis"] = "redis"
+    REDIS_URL: str = "redis://localhost:6380/0"
+    # Past this, a Redis call counts as an outage and the unlocks table is read instead
+    REDIS_TIMEOUT_SECONDS: float = 0.5
+    ENTITLEMENT_CACHE_MAX_USERS: int = 50_000
+    ENTITLEMENT_CACHE_TTL_SECONDS: int = 3600
 
     # Tenancy
     MIN_TENANCY_DAYS: int = 60
@@ -42,6 +70,11 @@ class Settings(BaseSettings):
     CREDIT_PRICE_UNLOCK_FULL: int = 30
     CREDIT_PRICE_CONTACT_REQUEST: int = 25
 
+    # Property pass: a tier for every review of a property, including future ones
+    CREDIT_PRICE_PROPERTY_PASS_SUMMARY: int = 20
+    CREDIT_PRICE_PROPERTY_PASS_DETAILED: int = 60
+    CREDIT_PRICE_PROPERTY_PASS_FULL: int = 120
+
     # Stripe top-up products (amount in cents, credits granted)
     CREDIT_TOPUP_SMALL_CENTS: int = 500
     CREDIT_TOPUP_SMALL_CREDITS: int = 20
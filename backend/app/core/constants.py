@@ -29,6 +29,16 @@ class ReviewStatus(str, Enum):
     REMOVED = "removed"
 
 
+class ReviewType(str, Enum):
+    PROPERTY = "property"
+    LANDLORD = "landlord"
+
+
+class ModerationAction(str, Enum):
+    PUBLISH = "publish"
+    REJECT = "reject"
+
+
 class VerificationStatus(str, Enum):
     UNVERIFIED = "unverified"
     PENDING = "pending"
@@ -60,6 +70,11 @@ class UnlockTier(str, Enum):
     FULL = "full"
 
 
+class UnlockScope(str, Enum):
+    REVIEW = "review"
+    PROPERTY = "property"
+
+
 class LedgerEntryType(str, Enum):
     TOPUP = "topup"
     CHARGE = "charge"
@@ -73,7 +88,26 @@ class ContactRequestStatus(str, Enum):
     EXPIRED = "expired"
 
 
+class WebhookEventStatus(str, Enum):
+    PENDING = "pending"
+    PROCESSED = "processed"
+    FAILED = "failed"
+
+
 class MessageStatus(str, Enum):
     SENT = "sent"
     DELIVERED = "delivered"
     READ = "read"
+
+
+PROPERTY_RATING_FIELDS = [
+    "rating_plumbing", "rating_electricity", "rating_water", "rating_it_cabling",
+    "rating_hvac", "rating_amenity_stove", "rating_amenity_washer", "rating_amenity_fridge",
+    "rating_infra_water_tank", "rating_infra_irrigation", "rating_health_dust",
+    "rating_health_breathing", "rating_health_sewage",
+]
+
+LANDLORD_RATING_FIELDS = [
+    "rating_responsiveness", "rating_demeanor", "rating_repair_payments",
+    "rating_availability", "rating_payment_flexibility",
+]
@@ -5,12 +5,12 @@ from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.constants import UnlockTier, UserRole
+from app.core.constants import UserRole
 from app.core.exceptions import ForbiddenError, UnauthorizedError
 from app.core.security import decode_access_token
 from app.database import get_db
-from app.models.payment import Unlock
 from app.models.user import User
+from app.services import payment_service
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login", auto_error=False)
 
@@ -26,8 +26,9 @@ async def get_current_user(
     if payload is None:
         raise UnauthorizedError("Invalid or expired token")
 
-    user_id = payload.get("sub")
-    if user_id is None:
+    try:
+        user_id = UUID(payload["sub"])
+    except (KeyError, TypeError, ValueError):
         raise UnauthorizedError("Invalid token payload")
 
     result = await db.execute(select(User).where(User.id == user_id))
@@ -77,21 +78,5 @@ async def get_review_unlock_tier(
     db: AsyncSession,
 ) -> str | None:
     """Returns the highest unlock tier the user has for a review, or None."""
-    result = await db.execute(
-        select(Unlock).where(
-            Unlock.user_id == user_id,
-            Unlock.review_id == review_id,
-        )
-    )
-    unlocks = list(result.scalars().all())
-    if not unlocks:
-        return None
-
-    tiers = {u.tier for u in unlocks}
-    if UnlockTier.FULL.value in tiers:
-        return UnlockTier.FULL.value
-    if UnlockTier.DETAILED.value in tiers:
-        return UnlockTier.DETAILED.value
-    if UnlockTier.SUMMARY.value in tiers:
-        return UnlockTier.SUMMARY.value
-    return None
+    tiers = await payment_service.resolve_unlock_tiers(user_id, [review_id], db)
+    return tiers.get(review_id)
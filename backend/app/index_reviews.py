@@ -0,0 +1,64 @@
+"""Backfill the near-duplicate index for reviews written before it existed.
+
+Usage: python -m app.index_reviews [--batch-size N]
+
+Reviews are indexed oldest first, so of two near-identical reviews the later
+one is flagged. Each batch is committed on its own; re-running the command
+picks up wherever it stopped.
+"""
+import argparse
+import asyncio
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.constants import ReviewType
+from app.database import async_session_factory
+from app.models.review import LandlordReview, PropertyReview, ReviewSignature
+from app.services import duplicate_service
+
+REVIEW_MODELS = {
+    ReviewType.PROPERTY: PropertyReview,
+    ReviewType.LANDLORD: LandlordReview,
+}
+
+
+async def index_batch(review_type: ReviewType, batch_size: int, db: AsyncSession) -> int:
+    """Index up to ``batch_size`` unindexed reviews; returns how many were indexed."""
+    model = REVIEW_MODELS[review_type]
+    result = await db.execute(
+        select(model.id, model.review_text)
+        .outerjoin(
+            ReviewSignature,
+            (ReviewSignature.review_type == review_type.value)
+            & (ReviewSignature.review_id == model.id),
+        )
+        .where(ReviewSignature.review_id.is_(None))
+        .order_by(model.created_at, model.id)
+        .limit(batch_size)
+    )
+    rows = result.all()
+    flagged = []
+    for review_id, text in rows:
+        if await duplicate_service.index_review(review_type, review_id, text, db):
+            flagged.append(review_id)
+    if flagged:
+        await db.execute(update(model).where(model.id.in_(flagged)).values(is_flagged=True))
+    return len(rows)
+
+
+async def main(batch_size: int):
+    async with async_session_factory() as db:
+        for review_type in REVIEW_MODELS:
+            total = 0
+            while count := await index_batch(review_type, batch_size, db):
+                await db.commit()
+                total += count
+                print(f"Indexed {total} {review_type.value} reviews...")
+    print("Indexing complete.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=500)
+    asyncio.run(main(parser.parse_args().batch_size))
@@ -1,17 +1,32 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.router import api_router
 from app.config import settings
+from app.database import async_session_factory
+from app.services import stripe_service, webhook_service
+from app.services.location_service import gazetteer
+from app.utils.query_counter import count_queries
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
+    async with async_session_factory() as session:
+        await gazetteer.load(session)
+    webhook_worker = None
+    if settings.WEBHOOK_WORKER_ENABLED:
+        webhook_worker = asyncio.create_task(webhook_service.run_worker())
     yield
     # Shutdown
+    if webhook_worker is not None:
+        webhook_worker.cancel()
+        with suppress(asyncio.CancelledError):
+            await webhook_worker
+    await stripe_service.close()
 
 
 app = FastAPI(
@@ -27,8 +42,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Query-Count"],
 )
 
+
+@app.middleware("http")
+async def query_count_header(request: Request, call_next):
+    with count_queries() as counter:
+        response = await call_next(request)
+    response.headers["X-Query-Count"] = str(counter.count)
+    return response
+
+
 app.include_router(api_router, prefix="/api/v1")
 
 
@@ -2,11 +2,24 @@ from app.models.base import Base
 from app.models.user import User, RefreshToken, EmailVerificationToken, PasswordResetToken
 from app.models.location import Country, City, Community, Building
 from app.models.property import Property, PropertyOwnershipClaim
-from app.models.review import PropertyReview, PropertyReviewPhoto, LandlordReview
+from app.models.review import (
+    LandlordReview,
+    PropertyReview,
+    PropertyReviewPhoto,
+    ReviewLshBand,
+    ReviewSignature,
+)
 from app.models.verification import TenancyRecord, VerificationDocument
 from app.models.dispute import ReviewDispute, LandlordResponse
-from app.models.payment import Wallet, LedgerEntry, Unlock, StripeTopup
+from app.models.payment import Wallet, LedgerEntry, Unlock, StripeTopup, WebhookEvent
 from app.models.message import ContactRequest, Thread, Message, Report
+from app.models.stats import (
+    CityRatingStats,
+    CommunityRatingStats,
+    LandlordRatingStats,
+    PropertyRatingMonthly,
+    PropertyRatingStats,
+)
 
 __all__ = [
     "Base",
@@ -25,14 +38,22 @@ __all__ = [
     "PropertyReview",
     "PropertyReviewPhoto",
     "LandlordReview",
+    "ReviewSignature",
+    "ReviewLshBand",
     "ReviewDispute",
     "LandlordResponse",
     "Wallet",
     "LedgerEntry",
     "Unlock",
     "StripeTopup",
+    "WebhookEvent",
     "ContactRequest",
     "Thread",
     "Message",
     "Report",
+    "PropertyRatingStats",
+    "PropertyRatingMonthly",
+    "LandlordRatingStats",
+    "CommunityRatingStats",
+    "CityRatingStats",
 ]
@@ -3,7 +3,7 @@ from datetime import datetime
 
 from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text, func
 from sqlalchemy.dialects.postgresql import ARRAY, UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, deferred, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDMixin
 
@@ -46,6 +46,8 @@ class LandlordResponse(Base, UUIDMixin, TimestampMixin):
     )
     landlord_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     response_text: Mapped[str] = mapped_column(Text, nullable=False)
+    # As written, when the contact filter masked response_text
+    response_text_raw: Mapped[str | None] = deferred(mapped_column(Text, nullable=True))
     is_published: Mapped[bool] = mapped_column(Boolean, default=True)
 
     # Relationships
@@ -1,7 +1,17 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import (
+    CheckConstraint,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -42,14 +52,31 @@ class LedgerEntry(Base, UUIDMixin):
 
 
 class Unlock(Base, UUIDMixin):
-    """Tracks which reviews a user has unlocked at which tier."""
+    """Tracks which reviews a user has unlocked at which tier.
+
+    A ``review`` scoped row covers one review; a ``property`` scoped row (a
+    property pass) covers every review of the property, present and future.
+    """
     __tablename__ = "unlocks"
+    __table_args__ = (
+        CheckConstraint(
+            "(scope = 'review' AND review_id IS NOT NULL AND property_id IS NULL)"
+            " OR (scope = 'property' AND property_id IS NOT NULL AND review_id IS NULL)",
+            name="ck_unlocks_scope_target",
+        ),
+        Index("ix_unlocks_user_property", "user_id", "property_id"),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True
     )
-    review_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("property_reviews.id"), nullable=False, index=True
+    # review, property
+    scope: Mapped[str] = mapped_column(String(20), default="review", nullable=False)
+    review_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("property_reviews.id"), nullable=True, index=True
+    )
+    property_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("properties.id"), nullable=True
     )
     tier: Mapped[str] = mapped_column(String(20), nullable=False)  # summary, detailed, full
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -76,3 +103,26 @@ class StripeTopup(Base, UUIDMixin, TimestampMixin):
 
     user: Mapped["User"] = relationship()
 
+
+class WebhookEvent(Base):
+    """Inbox of verified Stripe webhook events, applied by the webhook worker."""
+    __tablename__ = "webhook_events"
+    __table_args__ = (
+        Index(
+            "ix_webhook_events_pending",
+            "received_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
+
+    id: Mapped[str] = mapped_column(String(255), primary_key=True)  # Stripe event id
+    event_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    # pending, processed, failed
+    status: Mapped[str] = mapped_column(String(20), default="pending", nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    received_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    processed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
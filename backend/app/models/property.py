@@ -1,15 +1,40 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, Numeric, SmallInteger, String, func
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    SmallInteger,
+    String,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import Mapped, deferred, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDMixin
 
 
 class Property(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "properties"
+    __table_args__ = (
+        # Keyset pagination: ORDER BY created_at DESC, id DESC
+        Index("ix_properties_created_at_id", "created_at", "id"),
+        # Address search (see app.utils.search)
+        Index(
+            "ix_properties_address_line_trgm", "address_line",
+            postgresql_using="gin", postgresql_ops={"address_line": "gin_trgm_ops"},
+        ),
+        Index("ix_properties_search_vector", "search_vector", postgresql_using="gin"),
+        # Bounding-box prefilter for nearby/map search (see app.utils.geo)
+        Index("ix_properties_latitude_longitude", "latitude", "longitude"),
+        # Map viewport: ORDER BY review_count DESC, id stops after LIMIT rows
+        Index("ix_properties_review_count_id", text("review_count DESC"), "id"),
+    )
 
     building_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("buildings.id"), nullable=True, index=True
@@ -25,6 +50,8 @@ class Property(Base, UUIDMixin, TimestampMixin):
     size_sqft: Mapped[int | None] = mapped_column(Integer, nullable=True)
     year_built: Mapped[int | None] = mapped_column(Integer, nullable=True)
     address_line: Mapped[str] = mapped_column(String(500), nullable=False)
+    # Maintained from address_line by a database trigger
+    search_vector: Mapped[str | None] = deferred(mapped_column(TSVECTOR, nullable=True))
     latitude: Mapped[float | None] = mapped_column(Numeric(10, 7), nullable=True)
     longitude: Mapped[float | None] = mapped_column(Numeric(10, 7), nullable=True)
     avg_property_rating: Mapped[float] = mapped_column(Numeric(3, 2), default=0)
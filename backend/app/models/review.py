@@ -1,9 +1,22 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Numeric, SmallInteger, String, Text, UniqueConstraint, func
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    LargeBinary,
+    Numeric,
+    SmallInteger,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import Mapped, deferred, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDMixin
 
@@ -12,6 +25,8 @@ class PropertyReview(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "property_reviews"
     __table_args__ = (
         UniqueConstraint("property_id", "tenant_id", name="uq_property_review_tenant"),
+        # Review text search (see review_service.search_reviews)
+        Index("ix_property_reviews_search_vector", "search_vector", postgresql_using="gin"),
     )
 
     property_id: Mapped[uuid.UUID] = mapped_column(
@@ -42,6 +57,11 @@ class PropertyReview(Base, UUIDMixin, TimestampMixin):
     overall_rating: Mapped[float] = mapped_column(Numeric(3, 2), nullable=False)
     review_text: Mapped[str] = mapped_column(Text, nullable=False)
     public_excerpt: Mapped[str | None] = mapped_column(String(300), nullable=True)
+    # As written, when the contact/profanity filter masked review_text or public_excerpt
+    review_text_raw: Mapped[str | None] = deferred(mapped_column(Text, nullable=True))
+    public_excerpt_raw: Mapped[str | None] = deferred(mapped_column(Text, nullable=True))
+    # public_excerpt weighted 'A', review_text 'B'; maintained by a database trigger
+    search_vector: Mapped[str | None] = deferred(mapped_column(TSVECTOR, nullable=True))
 
     # Status workflow: draft -> submitted -> published / disputed / removed
     status: Mapped[str] = mapped_column(String(20), default="draft", nullable=False, index=True)
@@ -101,6 +121,8 @@ class LandlordReview(Base, UUIDMixin, TimestampMixin):
 
     overall_rating: Mapped[float] = mapped_column(Numeric(3, 2), nullable=False)
     review_text: Mapped[str] = mapped_column(Text, nullable=False)
+    # As written, when the contact/profanity filter masked review_text
+    review_text_raw: Mapped[str | None] = deferred(mapped_column(Text, nullable=True))
 
     # Status workflow: draft -> submitted -> published / disputed / removed
     status: Mapped[str] = mapped_column(String(20), default="draft", nullable=False, index=True)
@@ -119,3 +141,29 @@ class LandlordReview(Base, UUIDMixin, TimestampMixin):
     from app.models.property import Property
     from app.models.user import User
     from app.models.verification import TenancyRecord
+
+
+class ReviewSignature(Base):
+    """MinHash signature of a review's text (see duplicate_service)."""
+
+    __tablename__ = "review_signatures"
+
+    # "property" or "landlord"; review_id points into the matching table
+    review_type: Mapped[str] = mapped_column(String(20), primary_key=True)
+    review_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    signature: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
+class ReviewLshBand(Base):
+    """One LSH band hash of a review signature; equal hashes mark candidate duplicates."""
+
+    __tablename__ = "review_lsh_bands"
+    __table_args__ = (
+        Index("ix_review_lsh_bands_lookup", "review_type", "band_index", "band_hash"),
+    )
+
+    review_type: Mapped[str] = mapped_column(String(20), primary_key=True)
+    review_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    band_index: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    band_hash: Mapped[int] = mapped_column(BigInteger, nullable=False)
@@ -0,0 +1,171 @@
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+
+import numpy as np
+from sqlalchemy import Date, DateTime, ForeignKey, Integer, LargeBinary, Numeric, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import TypeDecorator
+
+from app.core.constants import PROPERTY_RATING_FIELDS
+from app.models.base import Base
+from app.utils.histogram import empty_histogram
+
+
+class RatingHistogram(TypeDecorator):
+    """A (categories x 5) int32 count matrix stored as little-endian bytes.
+
+    NULL reads back as an all-zero histogram.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self, rows: int):
+        super().__init__()
+        self.rows = rows
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return np.ascontiguousarray(value, dtype="<i4").tobytes()
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return empty_histogram(self.rows)
+        return np.frombuffer(value, dtype="<i4").reshape(self.rows, -1).astype(np.int32)
+
+
+class PropertyRatingSumsMixin:
+    """Review count and per-category running sums over published property reviews."""
+
+    review_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    overall_sum: Mapped[Decimal] = mapped_column(Numeric(12, 2), default=0, nullable=False)
+
+    # Per category: sum of ratings and number of reviews that rated it
+    plumbing_sum: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    plumbing_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    electricity_sum: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    electricity_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    water_sum: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    water_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    it_cabling_sum: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    it_cabling_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    hvac_sum: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    hvac_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    amenity_stove_sum: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    amenity_stove_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    amenity_washer_sum: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    amenity_washer_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    amenity_fridge_sum: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    amenity_fridge_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    infra_water_tank_sum: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    infra_water_tank_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    infra_irrigation_sum: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    infra_irrigation_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    health_dust_sum: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    health_dust_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    health_breathing_sum: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    health_breathing_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    health_sewage_sum: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    health_sewage_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+
+class PropertyRatingStats(Base, PropertyRatingSumsMixin):
+    """Running sums and counts over a property's published reviews.
+
+    Maintained by ``stats_service`` on every review status transition, so the
+    review summary and ``Property.avg_property_rating`` read one row.
+    """
+
+    __tablename__ = "property_rating_stats"
+
+    property_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("properties.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    # Star counts per category, rows in PROPERTY_RATING_FIELDS order
+    histogram: Mapped[np.ndarray] = mapped_column(
+        RatingHistogram(len(PROPERTY_RATING_FIELDS)), nullable=True
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+
+class PropertyRatingMonthly(Base, PropertyRatingSumsMixin):
+    """A property's review sums bucketed by the month each review was published."""
+
+    __tablename__ = "property_rating_monthly"
+
+    property_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("properties.id", ondelete="CASCADE"), primary_key=True
+    )
+    # First day of the month
+    month: Mapped[date] = mapped_column(Date, primary_key=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+
+class CommunityRatingStats(Base, PropertyRatingSumsMixin):
+    """Property review sums rolled up to a community, for neighbourhood heatmaps."""
+
+    __tablename__ = "community_rating_stats"
+
+    community_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("communities.id", ondelete="CASCADE"), primary_key=True
+    )
+    # Denormalised so a whole city's communities are one indexed read
+    city_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("cities.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+
+class CityRatingStats(Base, PropertyRatingSumsMixin):
+    """Property review sums rolled up to a city."""
+
+    __tablename__ = "city_rating_stats"
+
+    city_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("cities.id", ondelete="CASCADE"), primary_key=True
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+
+class LandlordRatingStats(Base):
+    """Running sums and counts over a landlord's published reviews.
+
+    Spans the landlord's whole portfolio and backs the landlord scorecard.
+    """
+
+    __tablename__ = "landlord_rating_stats"
+
+    landlord_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    review_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    overall_sum: Mapped[Decimal] = mapped_column(Numeric(12, 2), default=0, nullable=False)
+
+    responsiveness_sum: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    responsiveness_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    demeanor_sum: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    demeanor_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    repair_payments_sum: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    repair_payments_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    availability_sum: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    availability_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    payment_flexibility_sum: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    payment_flexibility_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    last_review_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
@@ -33,6 +33,28 @@ class PurchaseUnlockResponse(BaseModel):
     new_balance: int
 
 
+class PurchasePropertyPassRequest(BaseModel):
+    property_id: UUID
+    tier: UnlockTier
+
+
+class BatchUnlockRequest(BaseModel):
+    items: list[PurchaseUnlockRequest] = Field(min_length=1, max_length=100)
+
+
+class BatchUnlockItem(BaseModel):
+    review_id: UUID
+    tier: UnlockTier
+    unlock_id: UUID
+    credits_charged: int
+
+
+class BatchUnlockResponse(BaseModel):
+    unlocks: list[BatchUnlockItem]
+    credits_charged: int
+    new_balance: int
+
+
 class CreateContactRequestPayment(BaseModel):
     tenant_id: UUID
     property_id: UUID
@@ -62,7 +84,9 @@ class LedgerEntryResponse(BaseModel):
 class UnlockResponse(BaseModel):
     id: UUID
     user_id: UUID
-    review_id: UUID
+    scope: str
+    review_id: UUID | None
+    property_id: UUID | None
     tier: str
     created_at: datetime
 
@@ -81,6 +105,9 @@ class CreditPricingResponse(BaseModel):
     unlock_detailed: int
     unlock_full: int
     contact_request: int
+    property_pass_summary: int
+    property_pass_detailed: int
+    property_pass_full: int
     topup_small_cents: int
     topup_small_credits: int
     topup_medium_cents: int
@@ -17,6 +17,8 @@ class PropertyCreateRequest(BaseModel):
     size_sqft: int | None = Field(None, ge=0)
     year_built: int | None = Field(None, ge=1900, le=2030)
     address_line: str = Field(min_length=5, max_length=500)
+    latitude: float | None = Field(None, ge=-90, le=90)
+    longitude: float | None = Field(None, ge=-180, le=180)
 
 
 class PropertyUpdateRequest(BaseModel):
@@ -27,6 +29,8 @@ class PropertyUpdateRequest(BaseModel):
     size_sqft: int | None = None
     year_built: int | None = None
     address_line: str | None = None
+    latitude: float | None = Field(None, ge=-90, le=90)
+    longitude: float | None = Field(None, ge=-180, le=180)
 
 
 class PropertyResponse(BaseModel):
@@ -41,6 +45,8 @@ class PropertyResponse(BaseModel):
     size_sqft: int | None
     year_built: int | None
     address_line: str
+    latitude: float | None = None
+    longitude: float | None = None
     avg_property_rating: float
     avg_landlord_rating: float
     review_count: int
@@ -58,11 +64,14 @@ class PropertyListResponse(BaseModel):
     bathrooms: int | None
     size_sqft: int | None
     address_line: str
+    latitude: float | None = None
+    longitude: float | None = None
     avg_property_rating: float
     avg_landlord_rating: float
     review_count: int
     community_name: str | None = None
     city_name: str | None = None
+    distance_km: float | None = None
 
     model_config = {"from_attributes": True}
 
@@ -76,3 +85,5 @@ class PropertySearchParams(BaseModel):
     bedrooms_max: int | None = None
     page: int = 1
     page_size: int = 20
+    cursor: str | None = None
+    include_total: bool | None = None
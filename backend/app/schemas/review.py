@@ -1,8 +1,10 @@
-from datetime import datetime
+from datetime import date, datetime
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from app.core.constants import ModerationAction
+
 
 def _rating_field():
     return Field(None, ge=1, le=5)
@@ -28,6 +30,14 @@ class PropertyReviewCreateRequest(BaseModel):
     public_excerpt: str | None = Field(None, max_length=300)
 
 
+class ReviewLandlordReply(BaseModel):
+    """The landlord's published reply, shown with the review at every tier."""
+    id: UUID
+    landlord_id: UUID
+    response_text: str
+    created_at: datetime
+
+
 class PropertyReviewResponse(BaseModel):
     id: UUID
     property_id: UUID
@@ -54,6 +64,7 @@ class PropertyReviewResponse(BaseModel):
     published_at: datetime | None
     created_at: datetime
     photos: list["PhotoResponse"] = []
+    landlord_response: ReviewLandlordReply | None = None
 
     model_config = {"from_attributes": True}
 
@@ -67,10 +78,30 @@ class PropertyReviewSnippetResponse(BaseModel):
     status: str
     verification_status: str
     created_at: datetime
+    landlord_response: ReviewLandlordReply | None = None
 
     model_config = {"from_attributes": True}
 
 
+class ReviewSearchHit(BaseModel):
+    """A review matching a text search; ``highlight`` marks matches with <b> tags."""
+    id: UUID
+    property_id: UUID
+    overall_rating: float
+    public_excerpt: str | None
+    created_at: datetime
+    highlight: str
+
+
+class RatingDistribution(BaseModel):
+    """Star counts (1-5) for one category, with median and 95% CI of the mean."""
+    histogram: list[int]
+    count: int
+    median: float | None
+    ci_low: float | None
+    ci_high: float | None
+
+
 class PropertyReviewSummaryResponse(BaseModel):
     """Free tier: just averages and count."""
     property_id: UUID
@@ -89,6 +120,7 @@ class PropertyReviewSummaryResponse(BaseModel):
     avg_health_dust: float | None
     avg_health_breathing: float | None
     avg_health_sewage: float | None
+    distributions: dict[str, RatingDistribution] = {}
 
 
 class LandlordReviewCreateRequest(BaseModel):
@@ -124,6 +156,77 @@ class LandlordReviewResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class BulkModerationRequest(BaseModel):
+    review_ids: list[UUID] = Field(min_length=1, max_length=500)
+    action: ModerationAction
+
+
+class BulkModerationResult(BaseModel):
+    review_id: UUID
+    outcome: str  # published, removed, not_found, not_submitted
+
+
+class BulkModerationResponse(BaseModel):
+    updated: int
+    results: list[BulkModerationResult]
+
+
+class CategoryAverages(BaseModel):
+    review_count: int
+    avg_overall: float
+    avg_plumbing: float
+    avg_electricity: float
+    avg_water: float
+    avg_it_cabling: float
+    avg_hvac: float
+    avg_amenity_stove: float
+    avg_amenity_washer: float
+    avg_amenity_fridge: float
+    avg_infra_water_tank: float
+    avg_infra_irrigation: float
+    avg_health_dust: float
+    avg_health_breathing: float
+    avg_health_sewage: float
+
+
+class TrendPoint(CategoryAverages):
+    month: date  # first day of the month
+
+
+class PropertyTrendResponse(BaseModel):
+    """Monthly averages, oldest first; months with no published reviews are omitted."""
+    property_id: UUID
+    months: int
+    points: list[TrendPoint]
+
+
+class CommunityRatingSummary(CategoryAverages):
+    community_id: UUID
+    name: str
+    slug: str
+    latitude: float | None
+    longitude: float | None
+
+
+class CityHeatmapResponse(CategoryAverages):
+    """A city's rating averages with one entry per reviewed community."""
+    city_id: UUID
+    communities: list[CommunityRatingSummary]
+
+
+class LandlordScorecardResponse(BaseModel):
+    """Landlord reputation rolled up across all of their properties."""
+    landlord_id: UUID
+    review_count: int
+    avg_overall: float
+    avg_responsiveness: float
+    avg_demeanor: float
+    avg_repair_payments: float
+    avg_availability: float
+    avg_payment_flexibility: float
+    last_review_at: datetime | None
+
+
 class PhotoResponse(BaseModel):
     id: UUID
     file_url: str
@@ -8,7 +8,8 @@ from app.core.constants import DisputeStatus, ReviewStatus
 from app.core.exceptions import BadRequestError, ConflictError, NotFoundError
 from app.models.dispute import LandlordResponse, ReviewDispute
 from app.models.review import LandlordReview, PropertyReview
-from app.utils.profanity import check_profanity
+from app.services import review_service
+from app.utils.profanity import censor_keeping_original, check_profanity
 
 
 async def create_dispute(
@@ -37,12 +38,12 @@ async def create_dispute(
         rev_result = await db.execute(select(PropertyReview).where(PropertyReview.id == property_review_id))
         review = rev_result.scalar_one_or_none()
         if review and review.status == ReviewStatus.PUBLISHED.value:
-            review.status = ReviewStatus.DISPUTED.value
+            await review_service.set_property_review_status(review, ReviewStatus.DISPUTED.value, db)
     elif landlord_review_id:
         rev_result = await db.execute(select(LandlordReview).where(LandlordReview.id == landlord_review_id))
         review = rev_result.scalar_one_or_none()
         if review and review.status == ReviewStatus.PUBLISHED.value:
-            review.status = ReviewStatus.DISPUTED.value
+            await review_service.set_landlord_review_status(review, ReviewStatus.DISPUTED.value, db)
 
     dispute = ReviewDispute(
         property_review_id=property_review_id,
@@ -77,7 +78,9 @@ async def resolve_dispute(
             )
             review = rev_result.scalar_one_or_none()
             if review:
-                review.status = ReviewStatus.REMOVED.value
+                await review_service.set_property_review_status(
+                    review, ReviewStatus.REMOVED.value, db
+                )
                 review.is_flagged = True
         elif dispute.landlord_review_id:
             rev_result = await db.execute(
@@ -85,7 +88,9 @@ async def resolve_dispute(
             )
             review = rev_result.scalar_one_or_none()
             if review:
-                review.status = ReviewStatus.REMOVED.value
+                await review_service.set_landlord_review_status(
+                    review, ReviewStatus.REMOVED.value, db
+                )
                 review.is_flagged = True
 
     # rejected -> restore the review to published
@@ -96,14 +101,18 @@ async def resolve_dispute(
             )
             review = rev_result.scalar_one_or_none()
             if review:
-                review.status = ReviewStatus.PUBLISHED.value
+                await review_service.set_property_review_status(
+                    review, ReviewStatus.PUBLISHED.value, db
+                )
         elif dispute.landlord_review_id:
             rev_result = await db.execute(
                 select(LandlordReview).where(LandlordReview.id == dispute.landlord_review_id)
             )
             review = rev_result.scalar_one_or_none()
             if review:
-                review.status = ReviewStatus.PUBLISHED.value
+                await review_service.set_landlord_review_status(
+                    review, ReviewStatus.PUBLISHED.value, db
+                )
 
     # partially_upheld -> some fields hidden (keep as disputed with notes)
     elif status == DisputeStatus.PARTIALLY_UPHELD.value:
@@ -138,14 +147,19 @@ async def create_landlord_response(
     if existing.scalar_one_or_none():
         raise ConflictError("You have already responded to this review")
 
+    # Contact details are masked; contact goes through paid contact requests
+    masked_text, response_text_raw = censor_keeping_original(response_text)
     response = LandlordResponse(
         property_review_id=property_review_id,
         landlord_review_id=landlord_review_id,
         landlord_id=landlord_id,
-        response_text=response_text,
+        response_text=masked_text,
+        response_text_raw=response_text_raw,
     )
     db.add(response)
     await db.flush()
+    if property_review_id:
+        review_service.invalidate_review_fragments(property_review_id, db)
     return response
 
 
@@ -0,0 +1,85 @@
+"""Near-duplicate review detection.
+
+Each indexed review stores a MinHash signature and its LSH band hashes
+(see ``app.utils.minhash``). A new review is compared only against reviews
+that share at least one band hash with it, found through the
+``(review_type, band_index, band_hash)`` index, so the check costs the same
+however many reviews exist.
+"""
+
+from uuid import UUID
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.constants import ReviewType
+from app.models.review import ReviewLshBand, ReviewSignature
+from app.utils import minhash
+
+
+async def find_near_duplicates(
+    review_type: ReviewType, text: str, db: AsyncSession, exclude_id: UUID | None = None
+) -> list[tuple[UUID, float]]:
+    """Indexed reviews of ``review_type`` whose text is a near-duplicate of ``text``.
+
+    Returns ``(review_id, similarity)`` pairs at or above
+    ``DUPLICATE_SIMILARITY_THRESHOLD``, most similar first.
+    """
+    sig = minhash.signature(text)
+    return await _probe(review_type, sig, minhash.band_hashes(sig), db, exclude_id)
+
+
+async def _probe(
+    review_type: ReviewType,
+    sig,
+    bands: list[int],
+    db: AsyncSession,
+    exclude_id: UUID | None,
+) -> list[tuple[UUID, float]]:
+    candidates = (
+        select(ReviewLshBand.review_id)
+        .where(
+            ReviewLshBand.review_type == review_type.value,
+            tuple_(ReviewLshBand.band_index, ReviewLshBand.band_hash).in_(list(enumerate(bands))),
+        )
+        .distinct()
+    )
+    stmt = select(ReviewSignature.review_id, ReviewSignature.signature).where(
+        ReviewSignature.review_type == review_type.value,
+        ReviewSignature.review_id.in_(candidates),
+    )
+    if exclude_id is not None:
+        stmt = stmt.where(ReviewSignature.review_id != exclude_id)
+
+    matches = []
+    for review_id, stored in await db.execute(stmt):
+        score = minhash.similarity(sig, minhash.from_bytes(stored))
+        if score >= settings.DUPLICATE_SIMILARITY_THRESHOLD:
+            matches.append((review_id, score))
+    return sorted(matches, key=lambda m: m[1], reverse=True)
+
+
+async def index_review(
+    review_type: ReviewType, review_id: UUID, text: str, db: AsyncSession
+) -> list[tuple[UUID, float]]:
+    """Store the signature of a review and return its near-duplicates.
+
+    The probe runs before the review's own bands are written, so a review is
+    never reported as a duplicate of itself.
+    """
+    sig = minhash.signature(text)
+    bands = minhash.band_hashes(sig)
+    duplicates = await _probe(review_type, sig, bands, db, review_id)
+
+    db.add(ReviewSignature(
+        review_type=review_type.value, review_id=review_id, signature=minhash.to_bytes(sig)
+    ))
+    db.add_all([
+        ReviewLshBand(
+            review_type=review_type.value, review_id=review_id, band_index=i, band_hash=h
+        )
+        for i, h in enumerate(bands)
+    ])
+    await db.flush()
+    return duplicates
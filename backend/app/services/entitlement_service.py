@@ -0,0 +1,206 @@
+"""Per-user cache of review entitlements (unlocks and property passes).
+
+A user's entitlements are a set of 18-byte members: scope, target id and
+tier. The set is filled from the ``unlocks`` table on first use and grown in
+place after each purchase commits. Unlocks are never revoked, so the only
+operation is set union: a fill racing a purchase merges with its grant
+instead of overwriting it, and a set only counts as loaded once it holds the
+``COMPLETE`` marker written by a fill.
+
+The store is a Redis-compatible server shared between workers by default.
+``ENTITLEMENT_STORE=memory`` keeps it in-process (``LRUCache``) instead,
+which is only correct with one worker: a purchase grows the set of the worker
+that handled it, and other workers would deny the unlock until their copy
+expires. Startup refuses that store when ``WEB_CONCURRENCY`` is above 1.
+
+The store is only a cache: while Redis is unreachable, reads fall back to the
+``unlocks`` table and writes are dropped.
+"""
+
+import asyncio
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.constants import UnlockScope, UnlockTier
+from app.models.payment import Unlock
+from app.utils.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+COMPLETE = b"*"
+_SCOPE_CODES = {UnlockScope.REVIEW.value: b"r", UnlockScope.PROPERTY.value: b"p"}
+_TIERS = [UnlockTier.SUMMARY.value, UnlockTier.DETAILED.value, UnlockTier.FULL.value]
+
+
+# Strong references to scheduled store writes until they finish
+_background_tasks: set[asyncio.Task] = set()
+
+
+def encode(scope: str, target_id: UUID, tier: str) -> bytes:
+    return _SCOPE_CODES[scope] + target_id.bytes + bytes([_TIERS.index(tier)])
+
+
+@dataclass
+class Entitlements:
+    """Tiers held per review and per property (passes)."""
+
+    reviews: dict[UUID, set[str]] = field(default_factory=dict)
+    properties: dict[UUID, set[str]] = field(default_factory=dict)
+
+    @classmethod
+    def decode(cls, members: Iterable[bytes]) -> "Entitlements":
+        entitlements = cls()
+        for member in members:
+            if member == COMPLETE:
+                continue
+            target = entitlements.reviews if member[:1] == b"r" else entitlements.properties
+            target.setdefault(UUID(bytes=member[1:17]), set()).add(_TIERS[member[17]])
+        return entitlements
+
+
+class MemoryEntitlementStore:
+    def __init__(self, max_users: int, ttl_seconds: float | None):
+        self._cache = LRUCache(max_users, ttl_seconds)
+
+    async def get(self, user_id: UUID) -> set[bytes] | None:
+        return self._cache.get(user_id)
+
+    async def add(self, user_id: UUID, members: Iterable[bytes]) -> None:
+        self.add_soon(user_id, members)
+
+    def add_soon(self, user_id: UUID, members: Iterable[bytes]) -> None:
+        """Synchronous ``add``, for use from session event hooks."""
+        current = self._cache.get(user_id)
+        if current is None:
+            self._cache.set(user_id, set(members))
+        else:
+            current.update(members)
+
+
+class RedisEntitlementStore:
+    """One Redis set per user; ``client`` is a ``redis.asyncio`` client or compatible.
+
+    ``errors`` are the client's exceptions for an unreachable or timed-out server.
+    """
+
+    def __init__(self, client, ttl_seconds: int, errors: tuple[type[Exception], ...]):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.errors = errors
+
+    @staticmethod
+    def _key(user_id: UUID) -> str:
+        return f"entitlements:{user_id}"
+
+    async def get(self, user_id: UUID) -> set[bytes] | None:
+        try:
+            return await self.client.smembers(self._key(user_id)) or None
+        except self.errors:
+            logger.warning("Entitlement store unavailable, reading unlocks", exc_info=True)
+            return None
+
+    async def add(self, user_id: UUID, members: Iterable[bytes]) -> None:
+        key = self._key(user_id)
+        try:
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.sadd(key, *members)
+                pipe.expire(key, self.ttl_seconds)
+                await pipe.execute()
+        except self.errors:
+            logger.warning("Entitlement store unavailable, write dropped", exc_info=True)
+
+    def add_soon(self, user_id: UUID, members: Iterable[bytes]) -> asyncio.Task:
+        """Schedule ``add`` on the running loop, for use from session event hooks."""
+        task = asyncio.get_running_loop().create_task(self.add(user_id, members))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+        return task
+
+
+def _build_store():
+    if settings.ENTITLEMENT_STORE == "redis":
+        import redis.asyncio as redis
+
+        client = redis.from_url(
+            settings.REDIS_URL,
+            socket_timeout=settings.REDIS_TIMEOUT_SECONDS,
+            socket_connect_timeout=settings.REDIS_TIMEOUT_SECONDS,
+        )
+        return RedisEntitlementStore(
+            client, settings.ENTITLEMENT_CACHE_TTL_SECONDS, errors=(redis.RedisError,)
+        )
+    if settings.WEB_CONCURRENCY > 1:
+        raise RuntimeError(
+            "ENTITLEMENT_STORE=memory is per process and would serve stale unlocks with "
+            f"WEB_CONCURRENCY={settings.WEB_CONCURRENCY}; use ENTITLEMENT_STORE=redis"
+        )
+    return MemoryEntitlementStore(
+        settings.ENTITLEMENT_CACHE_MAX_USERS, settings.ENTITLEMENT_CACHE_TTL_SECONDS
+    )
+
+
+store = _build_store()
+
+
+async def get_entitlements(user_id: UUID, db: AsyncSession) -> Entitlements:
+    """The user's entitlements; reads ``unlocks`` only when the store has no full set."""
+    members = await store.get(user_id)
+    if members is None or COMPLETE not in members:
+        result = await db.execute(
+            select(Unlock.scope, Unlock.review_id, Unlock.property_id, Unlock.tier).where(
+                Unlock.user_id == user_id
+            )
+        )
+        loaded = {
+            encode(scope, review_id or property_id, tier)
+            for scope, review_id, property_id, tier in result.all()
+        }
+        loaded.add(COMPLETE)
+        await store.add(user_id, loaded)
+        members = loaded | (members or set())
+    return Entitlements.decode(members)
+
+
+def grant_on_commit(
+    db: AsyncSession, user_id: UUID, scope: UnlockScope, target_id: UUID, tier: UnlockTier
+) -> None:
+    """Add an entitlement to the store once the purchase's transaction commits.
+
+    The write runs in the background; ``wait_for_grants`` waits for it.
+    """
+    grants = db.sync_session.info.setdefault("entitlement_grants", [])
+    grants.append((user_id, encode(scope.value, target_id, tier.value)))
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_grants_on_commit(session):
+    by_user: dict[UUID, set[bytes]] = {}
+    for user_id, member in session.info.pop("entitlement_grants", ()):
+        by_user.setdefault(user_id, set()).add(member)
+    for user_id, members in by_user.items():
+        # Growing a set that was never filled is harmless: it stays incomplete
+        write = store.add_soon(user_id, members)
+        if write is not None:
+            session.info.setdefault("entitlement_writes", []).append(write)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_grants_on_rollback(session, previous_transaction):
+    session.info.pop("entitlement_grants", None)
+
+
+async def wait_for_grants(db: AsyncSession) -> None:
+    """Wait until the store holds the grants of the session's committed purchases.
+
+    Without this a buyer's next request can reach the store first and find
+    the review still locked.
+    """
+    writes = db.sync_session.info.pop("entitlement_writes", [])
+    await asyncio.gather(*writes)
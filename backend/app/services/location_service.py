@@ -0,0 +1,196 @@
+"""Process-local gazetteer of the country/city/community/building hierarchy.
+
+Location rows are few and rarely change, so the whole hierarchy is held in an
+immutable in-memory snapshot: id and slug lookups, parent chains and prefix
+autocomplete never touch the database. The snapshot is loaded at startup,
+dropped whenever a session commits a change to a location row, and reloaded
+after ``GAZETTEER_MAX_AGE_SECONDS`` to pick up changes made by other workers.
+A load that overlaps an invalidation is used once but not kept, since it may
+have read the rows from before the commit.
+
+Community search tries the in-memory word prefixes first and falls back to
+the ``pg_trgm`` index only when they find nothing, so typos still match.
+"""
+
+import asyncio
+import time
+from bisect import bisect_left
+from dataclasses import dataclass
+from types import MappingProxyType
+from uuid import UUID
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.location import Building, City, Community, Country
+from app.utils.search import text_search
+
+LOCATION_MODELS = (Country, City, Community, Building)
+
+
+@dataclass(frozen=True, slots=True)
+class Place:
+    id: UUID
+    kind: str  # country, city, community, building
+    name: str
+    parent_id: UUID | None = None
+    slug: str | None = None
+    is_active: bool = True
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+class GazetteerIndex:
+    """Immutable snapshot of the location hierarchy."""
+
+    def __init__(self, places: list[Place]):
+        self.by_id = MappingProxyType({p.id: p for p in places})
+        self.by_slug = MappingProxyType({p.slug: p for p in places if p.slug})
+
+        # Autocomplete keys: the full community name and every word suffix of
+        # it, so "mar" finds "Dubai Marina" as well as "Marina Gate".
+        keys = []
+        for p in places:
+            if p.kind != "community" or not p.is_active:
+                continue
+            words = _normalize(p.name).split()
+            for i in range(len(words)):
+                keys.append((" ".join(words[i:]), i, p.name, p.id))
+        keys.sort()
+        self._keys = tuple(k[0] for k in keys)
+        self._key_ids = tuple(k[3] for k in keys)
+
+    def get(self, place_id: UUID) -> Place | None:
+        return self.by_id.get(place_id)
+
+    def parent_chain(self, place_id: UUID) -> list[Place]:
+        """The place followed by its ancestors, up to the country."""
+        chain = []
+        place = self.by_id.get(place_id)
+        while place is not None:
+            chain.append(place)
+            place = self.by_id.get(place.parent_id) if place.parent_id else None
+        return chain
+
+    def community_names(self, community_id: UUID) -> tuple[str, str | None] | None:
+        """(community_name, city_name) for a community, or None if unknown."""
+        community = self.by_id.get(community_id)
+        if community is None:
+            return None
+        city = self.by_id.get(community.parent_id)
+        return community.name, city.name if city else None
+
+    def autocomplete(self, prefix: str, limit: int = 20) -> list[Place]:
+        prefix = _normalize(prefix)
+        matches: list[Place] = []
+        seen: set[UUID] = set()
+        i = bisect_left(self._keys, prefix)
+        while i < len(self._keys) and self._keys[i].startswith(prefix) and len(matches) < limit:
+            place_id = self._key_ids[i]
+            if place_id not in seen:
+                seen.add(place_id)
+                matches.append(self.by_id[place_id])
+            i += 1
+        return matches
+
+
+class Gazetteer:
+    """Holds the current snapshot and reloads it when stale."""
+
+    def __init__(self, max_age_seconds: float):
+        self.max_age_seconds = max_age_seconds
+        self._index: GazetteerIndex | None = None
+        self._loaded_at = 0.0
+        self._generation = 0  # Bumped by every invalidation
+        self._lock = asyncio.Lock()
+
+    def is_stale(self) -> bool:
+        return self._index is None or time.monotonic() - self._loaded_at > self.max_age_seconds
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        self._index = None
+
+    async def load(self, db: AsyncSession) -> GazetteerIndex:
+        """Reads a fresh snapshot; it is only installed if no invalidation happened meanwhile."""
+        generation = self._generation
+        places: list[Place] = []
+        for c in (await db.execute(select(Country))).scalars():
+            places.append(Place(id=c.id, kind="country", name=c.name, is_active=c.is_active))
+        for c in (await db.execute(select(City))).scalars():
+            places.append(
+                Place(
+                    id=c.id, kind="city", name=c.name, parent_id=c.country_id,
+                    is_active=c.is_active,
+                )
+            )
+        for c in (await db.execute(select(Community))).scalars():
+            places.append(
+                Place(
+                    id=c.id, kind="community", name=c.name, parent_id=c.city_id,
+                    slug=c.slug, is_active=c.is_active,
+                )
+            )
+        for b in (await db.execute(select(Building))).scalars():
+            places.append(Place(id=b.id, kind="building", name=b.name, parent_id=b.community_id))
+
+        index = GazetteerIndex(places)
+        if generation == self._generation:
+            self._index, self._loaded_at = index, time.monotonic()
+        return index
+
+    async def get_index(self, db: AsyncSession) -> GazetteerIndex:
+        """The current snapshot, loading it through ``db`` first if needed."""
+        if not self.is_stale():
+            return self._index
+        async with self._lock:
+            if self.is_stale():
+                return await self.load(db)
+            return self._index
+
+
+gazetteer = Gazetteer(max_age_seconds=settings.GAZETTEER_MAX_AGE_SECONDS)
+
+
+async def search_communities(
+    term: str, db: AsyncSession, limit: int = 20
+) -> tuple[GazetteerIndex, list[Place]]:
+    """Active communities matching ``term``, with the snapshot they were resolved in.
+
+    Word-prefix matches come from the snapshot without a query; only when
+    there are none is ``Community.name`` searched in SQL, where trigram
+    similarity finds misspellings ("marnia" -> "Dubai Marina").
+    """
+    index = await gazetteer.get_index(db)
+    matches = index.autocomplete(term, limit)
+    if matches:
+        return index, matches
+
+    match, rank = text_search(db, term, Community.name)
+    query = select(Community.id).where(Community.is_active.is_(True), match)
+    if rank is not None:
+        query = query.order_by(rank.desc())
+    result = await db.execute(query.order_by(Community.name).limit(limit))
+    return index, [index.by_id[cid] for cid in result.scalars() if cid in index.by_id]
+
+
+@event.listens_for(Session, "before_flush")
+def _track_location_changes(session, flush_context, instances):
+    changed = (*session.new, *session.dirty, *session.deleted)
+    if any(isinstance(obj, LOCATION_MODELS) for obj in changed):
+        session.info["gazetteer_stale"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session):
+    if session.info.pop("gazetteer_stale", False):
+        gazetteer.invalidate()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_on_rollback(session, previous_transaction):
+    session.info.pop("gazetteer_stale", None)
@@ -9,6 +9,7 @@ from app.core.exceptions import BadRequestError, ForbiddenError, NotFoundError
 from app.models.message import ContactRequest, Message, Report, Thread
 from app.models.user import User
 from app.services.payment_service import refund_contact_request
+from app.utils.profanity import censor_keeping_original
 
 
 async def get_user_contact_requests(user_id: UUID, db: AsyncSession) -> list[ContactRequest]:
@@ -122,7 +123,8 @@ async def send_message(
         db.add(thread)
         await db.flush()
 
-    message = Message(thread_id=thread.id, sender_id=sender_id, body=body)
+    body, body_raw = censor_keeping_original(body)
+    message = Message(thread_id=thread.id, sender_id=sender_id, body=body, body_raw=body_raw)
     db.add(message)
     await db.flush()
     return message
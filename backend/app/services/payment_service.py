@@ -1,18 +1,20 @@
+import uuid
 from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
-import stripe
-from sqlalchemy import select
+from sqlalchemy import and_, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.core.constants import ContactRequestStatus, LedgerEntryType, UnlockTier
+from app.core.constants import ContactRequestStatus, LedgerEntryType, UnlockScope, UnlockTier
 from app.core.exceptions import BadRequestError, ConflictError, NotFoundError
 from app.models.message import ContactRequest
 from app.models.payment import LedgerEntry, StripeTopup, Unlock, Wallet
+from app.models.property import Property
+from app.models.review import PropertyReview
 from app.models.user import User
-
-stripe.api_key = settings.STRIPE_SECRET_KEY
+from app.services import entitlement_service, stripe_service
+from app.utils.cache import LRUCache
 
 TOPUP_TIERS = {
     "small": (settings.CREDIT_TOPUP_SMALL_CENTS, settings.CREDIT_TOPUP_SMALL_CREDITS),
@@ -26,6 +28,12 @@ UNLOCK_PRICES = {
     UnlockTier.FULL: settings.CREDIT_PRICE_UNLOCK_FULL,
 }
 
+PROPERTY_PASS_PRICES = {
+    UnlockTier.SUMMARY: settings.CREDIT_PRICE_PROPERTY_PASS_SUMMARY,
+    UnlockTier.DETAILED: settings.CREDIT_PRICE_PROPERTY_PASS_DETAILED,
+    UnlockTier.FULL: settings.CREDIT_PRICE_PROPERTY_PASS_FULL,
+}
+
 TIER_HIERARCHY = [UnlockTier.SUMMARY, UnlockTier.DETAILED, UnlockTier.FULL]
 
 
@@ -43,6 +51,43 @@ async def get_wallet_balance(user_id: UUID, db: AsyncSession) -> Wallet:
     return await get_or_create_wallet(user_id, db)
 
 
+async def debit_wallet(user_id: UUID, amount: int, db: AsyncSession) -> int:
+    """Take ``amount`` credits from a wallet and return the new balance.
+
+    The balance check and the debit are one conditional UPDATE, so
+    concurrent purchases can never overdraw a wallet or lose an update.
+    """
+    result = await db.execute(
+        update(Wallet)
+        .where(Wallet.user_id == user_id, Wallet.balance_credits >= amount)
+        .values(balance_credits=Wallet.balance_credits - amount)
+        .returning(Wallet.balance_credits)
+        .execution_options(synchronize_session="fetch")
+    )
+    balance = result.scalar_one_or_none()
+    if balance is None:
+        current = await db.scalar(select(Wallet.balance_credits).where(Wallet.user_id == user_id))
+        raise BadRequestError(f"Insufficient credits. Need {amount}, have {current or 0}")
+    return balance
+
+
+async def credit_wallet(user_id: UUID, amount: int, db: AsyncSession) -> int:
+    """Add ``amount`` credits to a wallet, creating it if needed; returns the new balance."""
+    result = await db.execute(
+        update(Wallet)
+        .where(Wallet.user_id == user_id)
+        .values(balance_credits=Wallet.balance_credits + amount)
+        .returning(Wallet.balance_credits)
+        .execution_options(synchronize_session="fetch")
+    )
+    balance = result.scalar_one_or_none()
+    if balance is None:
+        db.add(Wallet(user_id=user_id, balance_credits=amount))
+        await db.flush()
+        balance = amount
+    return balance
+
+
 async def create_topup_checkout(user: User, tier: str, db: AsyncSession) -> tuple[str, UUID]:
     if tier not in TOPUP_TIERS:
         raise BadRequestError(f"Invalid top-up tier: {tier}. Must be small, medium, or large")
@@ -59,8 +104,8 @@ async def create_topup_checkout(user: User, tier: str, db: AsyncSession) -> tupl
     db.add(topup)
     await db.flush()
 
-    session = stripe.checkout.Session.create(
-        line_items=[{
+    session = await stripe_service.create_checkout_session({
+        "line_items": [{
             "price_data": {
                 "currency": "usd",
                 "product_data": {"name": f"TenantTruth Credits ({credits_amount} credits)"},
@@ -68,16 +113,16 @@ async def create_topup_checkout(user: User, tier: str, db: AsyncSession) -> tupl
             },
             "quantity": 1,
         }],
-        mode="payment",
-        success_url=f"{settings.FRONTEND_URL}/wallet?topup=success",
-        cancel_url=f"{settings.FRONTEND_URL}/wallet?topup=cancelled",
-        metadata={
+        "mode": "payment",
+        "success_url": f"{settings.FRONTEND_URL}/wallet?topup=success",
+        "cancel_url": f"{settings.FRONTEND_URL}/wallet?topup=cancelled",
+        "metadata": {
             "topup_id": str(topup.id),
             "user_id": str(user.id),
             "credits_amount": str(credits_amount),
         },
-        client_reference_id=str(topup.id),
-    )
+        "client_reference_id": str(topup.id),
+    })
 
     topup.stripe_checkout_session_id = session.id
     await db.flush()
@@ -86,22 +131,30 @@ async def create_topup_checkout(user: User, tier: str, db: AsyncSession) -> tupl
 
 
 async def handle_topup_completed(session_data: dict, db: AsyncSession) -> None:
-    topup_id = session_data["metadata"].get("topup_id")
+    """Credit a completed checkout; safe to call again for the same session."""
+    topup_id = (session_data.get("metadata") or {}).get("topup_id")
     if not topup_id:
         return
 
-    result = await db.execute(select(StripeTopup).where(StripeTopup.id == topup_id))
-    topup = result.scalar_one_or_none()
-    if not topup or topup.status == "completed":
-        return  # Idempotent
-
-    topup.status = "completed"
-    topup.stripe_payment_intent_id = session_data.get("payment_intent")
-    topup.completed_at = datetime.now(timezone.utc)
+    # Claim the top-up with one conditional UPDATE, so redelivered events and
+    # concurrent workers can never credit it twice
+    result = await db.execute(
+        update(StripeTopup)
+        .where(StripeTopup.id == UUID(topup_id), StripeTopup.status != "completed")
+        .values(
+            status="completed",
+            stripe_payment_intent_id=session_data.get("payment_intent"),
+            completed_at=datetime.now(timezone.utc),
+        )
+        .returning(StripeTopup.id, StripeTopup.user_id, StripeTopup.credits_amount)
+        .execution_options(synchronize_session="fetch")
+    )
+    topup = result.one_or_none()
+    if topup is None:
+        return  # Unknown or already completed
 
     # Credit the wallet
-    wallet = await get_or_create_wallet(topup.user_id, db)
-    wallet.balance_credits += topup.credits_amount
+    await credit_wallet(topup.user_id, topup.credits_amount, db)
 
     # Ledger entry
     entry = LedgerEntry(
@@ -116,61 +169,213 @@ async def handle_topup_completed(session_data: dict, db: AsyncSession) -> None:
     await db.flush()
 
 
-async def purchase_unlock(
-    user: User, review_id: UUID, tier: UnlockTier, db: AsyncSession
-) -> tuple[UUID, int, int]:
-    """Spend credits to unlock a review at a given tier. Returns (unlock_id, credits_charged, new_balance)."""
-    # Check if already unlocked at this tier or higher
-    result = await db.execute(
-        select(Unlock).where(Unlock.user_id == user.id, Unlock.review_id == review_id)
-    )
-    existing_unlocks = list(result.scalars().all())
-    existing_tiers = {u.tier for u in existing_unlocks}
+def _unlock_charge(
+    tier: UnlockTier,
+    paid_tiers: set[str],
+    held_tiers: set[str],
+    prices: dict[UnlockTier, int] = UNLOCK_PRICES,
+) -> int:
+    """Credits due to reach ``tier`` given the tiers already bought.
 
+    Upgrades only cost the difference over ``paid_tiers``; raises if
+    ``tier`` or higher is among ``held_tiers``, which also includes access
+    granted another way (a property pass, for a single review).
+    """
     # If they already have this tier or higher, reject
     tier_idx = TIER_HIERARCHY.index(tier)
-    for existing_tier in existing_tiers:
+    for existing_tier in held_tiers:
         if existing_tier in [t.value for t in TIER_HIERARCHY]:
             existing_idx = TIER_HIERARCHY.index(UnlockTier(existing_tier))
             if existing_idx >= tier_idx:
                 raise ConflictError(f"You already have {existing_tier} access or higher for this review")
 
     # Calculate price (only charge the difference if upgrading)
-    full_price = UNLOCK_PRICES[tier]
+    full_price = prices[tier]
     already_paid = sum(
-        UNLOCK_PRICES[UnlockTier(t)]
-        for t in existing_tiers
+        prices[UnlockTier(t)]
+        for t in paid_tiers
         if t in [tt.value for tt in TIER_HIERARCHY]
     )
-    charge = max(0, full_price - already_paid)
+    return max(0, full_price - already_paid)
 
-    # Check balance
-    wallet = await get_or_create_wallet(user.id, db)
-    if wallet.balance_credits < charge:
-        raise BadRequestError(f"Insufficient credits. Need {charge}, have {wallet.balance_credits}")
 
-    # Debit wallet
-    wallet.balance_credits -= charge
+async def _review_entitlements(
+    user_id: UUID, review_ids: list[UUID], db: AsyncSession
+) -> dict[UUID, tuple[set[str], set[str]]]:
+    """Per review: (tiers unlocked for that review, tiers of passes for its property).
 
-    # Create unlock
-    unlock = Unlock(user_id=user.id, review_id=review_id, tier=tier.value)
-    db.add(unlock)
-    await db.flush()
+    One query however many reviews; every existing review is present, so
+    unknown ids are the ones missing from the result.
+    """
+    result = await db.execute(
+        select(PropertyReview.id, Unlock.scope, Unlock.tier)
+        .outerjoin(
+            Unlock,
+            and_(
+                Unlock.user_id == user_id,
+                or_(
+                    Unlock.review_id == PropertyReview.id,
+                    Unlock.property_id == PropertyReview.property_id,
+                ),
+            ),
+        )
+        .where(PropertyReview.id.in_(review_ids))
+    )
+    entitlements: dict[UUID, tuple[set[str], set[str]]] = {}
+    for review_id, scope, tier in result.all():
+        own, passes = entitlements.setdefault(review_id, (set(), set()))
+        if tier is not None:
+            (passes if scope == UnlockScope.PROPERTY.value else own).add(tier)
+    return entitlements
 
-    # Ledger entry
+
+def _require_reviews(review_ids: list[UUID], entitlements: dict) -> None:
+    missing = [str(review_id) for review_id in review_ids if review_id not in entitlements]
+    if missing:
+        raise NotFoundError(f"Reviews not found: {', '.join(missing)}")
+
+
+async def purchase_unlock(
+    user: User, review_id: UUID, tier: UnlockTier, db: AsyncSession
+) -> tuple[UUID, int, int]:
+    """Spend credits to unlock a review at a given tier.
+
+    Returns (unlock_id, credits_charged, new_balance).
+    """
+    entitlements = await _review_entitlements(user.id, [review_id], db)
+    _require_reviews([review_id], entitlements)
+    own, passes = entitlements[review_id]
+    charge = _unlock_charge(tier, own, own | passes)
+
+    # Debit wallet (fails without side effects if the balance is too low)
     if charge > 0:
-        entry = LedgerEntry(
+        balance = await debit_wallet(user.id, charge, db)
+    else:
+        balance = (await get_or_create_wallet(user.id, db)).balance_credits
+
+    # Create unlock and ledger entry; ids are assigned here so both go out in one flush
+    unlock = Unlock(id=uuid.uuid4(), user_id=user.id, review_id=review_id, tier=tier.value)
+    db.add(unlock)
+    entitlement_service.grant_on_commit(db, user.id, UnlockScope.REVIEW, review_id, tier)
+    if charge > 0:
+        db.add(LedgerEntry(
             user_id=user.id,
             amount=-charge,
             entry_type=LedgerEntryType.CHARGE.value,
             ref_type="unlock",
             ref_id=unlock.id,
             description=f"Unlock review ({tier.value}): {charge} credits",
+        ))
+    await db.flush()
+
+    return unlock.id, charge, balance
+
+
+async def purchase_unlocks(
+    user: User, items: list[tuple[UUID, UnlockTier]], db: AsyncSession
+) -> tuple[list[tuple[UUID, UnlockTier, UUID, int]], int, int]:
+    """Unlock several reviews at once, priced as if bought one by one.
+
+    The whole cart is one wallet debit plus one multi-row insert each for
+    the unlocks and their ledger entries, whatever its size. Each paid
+    unlock gets its own ledger entry referencing it, as with single unlocks,
+    so a charge can be traced or refunded per review. Any unknown,
+    unaffordable or already-held item fails the cart.
+    Returns ([(review_id, tier, unlock_id, charge)], total_charged, new_balance).
+    """
+    review_ids = [review_id for review_id, _ in items]
+    if len(set(review_ids)) != len(review_ids):
+        raise BadRequestError("Each review can only appear once per cart")
+
+    entitlements = await _review_entitlements(user.id, review_ids, db)
+    _require_reviews(review_ids, entitlements)
+
+    lines = []
+    unlocks = []
+    for review_id, tier in items:
+        own, passes = entitlements[review_id]
+        charge = _unlock_charge(tier, own, own | passes)
+        unlock = Unlock(id=uuid.uuid4(), user_id=user.id, review_id=review_id, tier=tier.value)
+        unlocks.append(unlock)
+        lines.append((review_id, tier, unlock.id, charge))
+    total = sum(charge for *_, charge in lines)
+
+    if total > 0:
+        balance = await debit_wallet(user.id, total, db)
+    else:
+        balance = (await get_or_create_wallet(user.id, db)).balance_credits
+
+    db.add_all(unlocks)
+    for review_id, tier, unlock_id, charge in lines:
+        entitlement_service.grant_on_commit(db, user.id, UnlockScope.REVIEW, review_id, tier)
+        if charge > 0:
+            db.add(LedgerEntry(
+                user_id=user.id,
+                amount=-charge,
+                entry_type=LedgerEntryType.CHARGE.value,
+                ref_type="unlock",
+                ref_id=unlock_id,
+                description=f"Unlock review ({tier.value}): {charge} credits",
+            ))
+    await db.flush()
+
+    return lines, total, balance
+
+
+async def purchase_property_pass(
+    user: User, property_id: UUID, tier: UnlockTier, db: AsyncSession
+) -> tuple[UUID, int, int]:
+    """Spend credits for a tier on every review of a property, including future ones.
+
+    Stored as a single property-scoped ``Unlock`` row. Upgrading a pass costs
+    the price difference. Returns (unlock_id, credits_charged, new_balance).
+    """
+    # The property and any passes already held for it, in one query
+    result = await db.execute(
+        select(Unlock.tier)
+        .select_from(Property)
+        .outerjoin(
+            Unlock,
+            and_(
+                Unlock.user_id == user.id,
+                Unlock.scope == UnlockScope.PROPERTY.value,
+                Unlock.property_id == Property.id,
+            ),
         )
-        db.add(entry)
-        await db.flush()
+        .where(Property.id == property_id, Property.is_active.is_(True))
+    )
+    rows = result.scalars().all()
+    if not rows:
+        raise NotFoundError("Property not found")
+    held = {t for t in rows if t is not None}
+    charge = _unlock_charge(tier, held, held, PROPERTY_PASS_PRICES)
+
+    if charge > 0:
+        balance = await debit_wallet(user.id, charge, db)
+    else:
+        balance = (await get_or_create_wallet(user.id, db)).balance_credits
+
+    unlock = Unlock(
+        id=uuid.uuid4(),
+        user_id=user.id,
+        scope=UnlockScope.PROPERTY.value,
+        property_id=property_id,
+        tier=tier.value,
+    )
+    db.add(unlock)
+    entitlement_service.grant_on_commit(db, user.id, UnlockScope.PROPERTY, property_id, tier)
+    if charge > 0:
+        db.add(LedgerEntry(
+            user_id=user.id,
+            amount=-charge,
+            entry_type=LedgerEntryType.CHARGE.value,
+            ref_type="property_pass",
+            ref_id=unlock.id,
+            description=f"Property pass ({tier.value}): {charge} credits",
+        ))
+    await db.flush()
 
-    return unlock.id, charge, wallet.balance_credits
+    return unlock.id, charge, balance
 
 
 async def purchase_contact_request(
@@ -184,15 +389,11 @@ async def purchase_contact_request(
     """Spend credits to create a contact request. Charged upfront, refunded on decline."""
     charge = settings.CREDIT_PRICE_CONTACT_REQUEST
 
-    wallet = await get_or_create_wallet(user.id, db)
-    if wallet.balance_credits < charge:
-        raise BadRequestError(f"Insufficient credits. Need {charge}, have {wallet.balance_credits}")
-
-    # Debit wallet
-    wallet.balance_credits -= charge
+    balance = await debit_wallet(user.id, charge, db)
 
-    # Create contact request
+    # Create contact request and ledger entry in one flush
     cr = ContactRequest(
+        id=uuid.uuid4(),
         requester_id=user.id,
         tenant_id=tenant_id,
         property_id=property_id,
@@ -202,28 +403,23 @@ async def purchase_contact_request(
         expires_at=datetime.now(timezone.utc) + timedelta(days=7),
     )
     db.add(cr)
-    await db.flush()
-
-    # Ledger entry
-    entry = LedgerEntry(
+    db.add(LedgerEntry(
         user_id=user.id,
         amount=-charge,
         entry_type=LedgerEntryType.CHARGE.value,
         ref_type="contact_request",
         ref_id=cr.id,
         description=f"Contact request: {charge} credits",
-    )
-    db.add(entry)
+    ))
     await db.flush()
 
-    return cr.id, charge, wallet.balance_credits
+    return cr.id, charge, balance
 
 
 async def refund_contact_request(contact_request_id: UUID, user_id: UUID, db: AsyncSession) -> None:
     """Refund credits when a contact request is declined."""
     charge = settings.CREDIT_PRICE_CONTACT_REQUEST
-    wallet = await get_or_create_wallet(user_id, db)
-    wallet.balance_credits += charge
+    await credit_wallet(user_id, charge, db)
 
     entry = LedgerEntry(
         user_id=user_id,
@@ -244,24 +440,90 @@ async def get_user_ledger(user_id: UUID, db: AsyncSession) -> list[LedgerEntry]:
     return list(result.scalars().all())
 
 
-async def check_review_unlock(user_id: UUID, review_id: UUID, db: AsyncSession) -> dict:
-    result = await db.execute(
-        select(Unlock).where(Unlock.user_id == user_id, Unlock.review_id == review_id)
+def highest_tier(tiers: set[str]) -> str | None:
+    """The highest of a set of tier values, or None."""
+    for tier in reversed(TIER_HIERARCHY):
+        if tier.value in tiers:
+            return tier.value
+    return None
+
+
+# Review -> property, to apply property passes; fixed once a review exists
+_review_property = LRUCache(100_000)
+
+
+async def _review_properties(review_ids: list[UUID], db: AsyncSession) -> dict[UUID, UUID]:
+    found = {}
+    missing = []
+    for review_id in review_ids:
+        property_id = _review_property.get(review_id)
+        if property_id is None:
+            missing.append(review_id)
+        else:
+            found[review_id] = property_id
+    if missing:
+        result = await db.execute(
+            select(PropertyReview.id, PropertyReview.property_id).where(
+                PropertyReview.id.in_(missing)
+            )
+        )
+        for review_id, property_id in result.all():
+            _review_property.set(review_id, property_id)
+            found[review_id] = property_id
+    return found
+
+
+async def resolve_unlock_tiers(
+    user_id: UUID, review_ids: list[UUID], db: AsyncSession
+) -> dict[UUID, str]:
+    """Highest unlocked tier per review, for any number of reviews.
+
+    Review unlocks and property passes both count. Served from the user's
+    cached entitlements, so it costs no query once they are loaded. Reviews
+    the user has no access to are absent from the result.
+    """
+    if not review_ids:
+        return {}
+    entitlements = await entitlement_service.get_entitlements(user_id, db)
+    properties = (
+        await _review_properties(review_ids, db) if entitlements.properties else {}
     )
-    unlocks = list(result.scalars().all())
-    tiers = {u.tier for u in unlocks}
-
-    has_full = UnlockTier.FULL.value in tiers
-    has_detailed = has_full or UnlockTier.DETAILED.value in tiers
-    has_summary = has_detailed or UnlockTier.SUMMARY.value in tiers
-
-    highest = None
-    if has_full:
-        highest = UnlockTier.FULL.value
-    elif has_detailed:
-        highest = UnlockTier.DETAILED.value
-    elif has_summary:
-        highest = UnlockTier.SUMMARY.value
+    tiers = {}
+    for review_id in review_ids:
+        held = entitlements.reviews.get(review_id, set()) | entitlements.properties.get(
+            properties.get(review_id), set()
+        )
+        if held:
+            tiers[review_id] = highest_tier(held)
+    return tiers
+
+
+def unlocked_at(user_id: UUID, tiers: list[UnlockTier]):
+    """SQL condition: the ``PropertyReview`` is unlocked for the user at one of ``tiers``.
+
+    For use inside review queries; covers review unlocks and property passes.
+    """
+    granted = select(Unlock).where(
+        Unlock.user_id == user_id, Unlock.tier.in_([t.value for t in tiers])
+    )
+    return or_(
+        PropertyReview.id.in_(
+            granted.with_only_columns(Unlock.review_id)
+            .where(Unlock.scope == UnlockScope.REVIEW.value)
+        ),
+        PropertyReview.property_id.in_(
+            granted.with_only_columns(Unlock.property_id)
+            .where(Unlock.scope == UnlockScope.PROPERTY.value)
+        ),
+    )
+
+
+async def check_review_unlock(user_id: UUID, review_id: UUID, db: AsyncSession) -> dict:
+    highest = (await resolve_unlock_tiers(user_id, [review_id], db)).get(review_id)
+
+    has_full = highest == UnlockTier.FULL.value
+    has_detailed = has_full or highest == UnlockTier.DETAILED.value
+    has_summary = has_detailed or highest == UnlockTier.SUMMARY.value
 
     return {
         "has_summary": has_summary,
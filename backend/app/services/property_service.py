@@ -1,14 +1,24 @@
+import math
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import ColumnElement, String, case, cast, func, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
-from app.core.exceptions import NotFoundError
+from app.config import settings
+from app.core.exceptions import BadRequestError, NotFoundError
 from app.models.location import Community
 from app.models.property import Property
 from app.models.user import User
 from app.schemas.property import PropertyCreateRequest, PropertySearchParams, PropertyUpdateRequest
+from app.services.location_service import gazetteer
+from app.utils.cache import LRUCache
+from app.utils.geo import bounding_box, haversine_km
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.search import text_search
+
+# Facet counts for recently seen filter combinations
+_facet_cache = LRUCache(max_entries=512, ttl_seconds=settings.FACET_CACHE_TTL_SECONDS)
 
 
 async def create_property(data: PropertyCreateRequest, user: User, db: AsyncSession) -> Property:
@@ -23,6 +33,8 @@ async def create_property(data: PropertyCreateRequest, user: User, db: AsyncSess
         size_sqft=data.size_sqft,
         year_built=data.year_built,
         address_line=data.address_line,
+        latitude=data.latitude,
+        longitude=data.longitude,
         created_by=user.id,
     )
     db.add(prop)
@@ -42,45 +54,205 @@ async def get_property(property_id: UUID, db: AsyncSession) -> Property:
     return prop
 
 
-async def search_properties(params: PropertySearchParams, db: AsyncSession) -> tuple[list[Property], int]:
-    query = select(Property).where(Property.is_active.is_(True))
-    count_query = select(func.count()).select_from(Property).where(Property.is_active.is_(True))
+def _search_filters(
+    params: PropertySearchParams, db: AsyncSession
+) -> tuple[list, ColumnElement | None]:
+    """WHERE conditions for a search, plus the text-relevance rank when ``q`` is set."""
+    conditions = [Property.is_active.is_(True)]
 
     if params.community_id:
-        query = query.where(Property.community_id == params.community_id)
-        count_query = count_query.where(Property.community_id == params.community_id)
+        conditions.append(Property.community_id == params.community_id)
 
     if params.property_type:
-        query = query.where(Property.property_type == params.property_type.value)
-        count_query = count_query.where(Property.property_type == params.property_type.value)
+        conditions.append(Property.property_type == params.property_type.value)
 
     if params.bedrooms_min is not None:
-        query = query.where(Property.bedrooms >= params.bedrooms_min)
-        count_query = count_query.where(Property.bedrooms >= params.bedrooms_min)
+        conditions.append(Property.bedrooms >= params.bedrooms_min)
 
     if params.bedrooms_max is not None:
-        query = query.where(Property.bedrooms <= params.bedrooms_max)
-        count_query = count_query.where(Property.bedrooms <= params.bedrooms_max)
+        conditions.append(Property.bedrooms <= params.bedrooms_max)
 
+    rank = None
     if params.q:
-        search_term = f"%{params.q}%"
-        query = query.where(Property.address_line.ilike(search_term))
-        count_query = count_query.where(Property.address_line.ilike(search_term))
+        match, rank = text_search(db, params.q, Property.address_line, Property.search_vector)
+        conditions.append(match)
 
     if params.city_id:
-        query = query.join(Community).where(Community.city_id == params.city_id)
-        count_query = count_query.join(Community).where(Community.city_id == params.city_id)
+        conditions.append(
+            Property.community_id.in_(
+                select(Community.id).where(Community.city_id == params.city_id)
+            )
+        )
+
+    return conditions, rank
+
+
+async def search_properties(
+    params: PropertySearchParams, db: AsyncSession
+) -> tuple[list[Property], int | None, str | None]:
+    """Returns (properties, total, next_cursor).
 
-    total_result = await db.execute(count_query)
-    total = total_result.scalar()
+    With a cursor the page is read by keyset on (created_at, id) instead of
+    OFFSET; text searches rank by relevance first and carry the rank in the
+    cursor, so every page follows the same order. The total is counted in
+    offset mode by default and in cursor mode only when ``include_total`` is
+    set.
+    """
+    conditions, rank = _search_filters(params, db)
+    if rank is None:
+        query = select(Property)
+        keyset = [Property.created_at, Property.id]
+    else:
+        query = select(Property, rank.label("rank")).order_by(rank.desc())
+        keyset = [rank, Property.created_at, Property.id]
+    query = query.where(*conditions)
+    count_query = select(func.count()).select_from(Property).where(*conditions)
 
-    offset = (params.page - 1) * params.page_size
-    query = query.order_by(Property.created_at.desc()).offset(offset).limit(params.page_size)
+    include_total = params.include_total
+    if include_total is None:
+        include_total = params.cursor is None
+    total = None
+    if include_total:
+        total_result = await db.execute(count_query)
+        total = total_result.scalar()
+
+    query = query.order_by(Property.created_at.desc(), Property.id.desc())
+    if params.cursor:
+        created_at, last_id, last_rank = decode_cursor(params.cursor)
+        position = [created_at, last_id]
+        if rank is not None:
+            if last_rank is None:
+                raise BadRequestError("Invalid cursor")
+            position.insert(0, last_rank)
+        query = query.where(tuple_(*keyset) < tuple_(*position))
+    else:
+        query = query.offset((params.page - 1) * params.page_size)
+    query = query.limit(params.page_size)
 
     result = await db.execute(query)
-    properties = list(result.scalars().all())
+    rows = result.all()
+    properties = [row[0] for row in rows]
+
+    next_cursor = None
+    if len(rows) == params.page_size:
+        last = rows[-1]
+        last_rank = last.rank if rank is not None else None
+        next_cursor = encode_cursor(last[0].created_at, last[0].id, last_rank)
+
+    return properties, total, next_cursor
+
+
+async def get_search_facets(params: PropertySearchParams, db: AsyncSession) -> dict:
+    """Counts per property type, bedroom bucket and city under the active filters.
+
+    Every facet comes from one grouped scan at (type, bucket, community) grain
+    that is rolled up here, with cities resolved through the gazetteer, so the
+    cost does not grow with the number of facets.
+    """
+    cache_key = params.model_dump_json(exclude={"page", "page_size", "cursor", "include_total"})
+    facets = _facet_cache.get(cache_key)
+    if facets is not None:
+        return facets
+
+    conditions, _ = _search_filters(params, db)
+    bedroom_bucket = case(
+        (Property.bedrooms.is_(None), "unknown"),
+        (Property.bedrooms >= 5, "5+"),
+        else_=cast(Property.bedrooms, String),
+    )
+    result = await db.execute(
+        select(Property.property_type, bedroom_bucket, Property.community_id, func.count())
+        .where(*conditions)
+        .group_by(Property.property_type, bedroom_bucket, Property.community_id)
+    )
+    places = await gazetteer.get_index(db)
 
-    return properties, total
+    by_type: dict[str, int] = {}
+    by_bedrooms: dict[str, int] = {}
+    by_city: dict[UUID, list] = {}
+    for property_type, bucket, community_id, count in result.all():
+        by_type[property_type] = by_type.get(property_type, 0) + count
+        by_bedrooms[bucket] = by_bedrooms.get(bucket, 0) + count
+        community = places.get(community_id)
+        city = places.get(community.parent_id) if community else None
+        if city:
+            by_city.setdefault(city.id, [city.name, 0])[1] += count
+
+    facets = {
+        "property_type": [
+            {"value": value, "count": count}
+            for value, count in sorted(by_type.items(), key=lambda kv: -kv[1])
+        ],
+        "bedrooms": [
+            {"value": value, "count": count} for value, count in sorted(by_bedrooms.items())
+        ],
+        "city": [
+            {"value": str(city_id), "label": name, "count": count}
+            for city_id, (name, count) in sorted(by_city.items(), key=lambda kv: -kv[1][1])
+        ],
+    }
+    _facet_cache.set(cache_key, facets)
+    return facets
+
+
+async def search_nearby(
+    lat: float, lng: float, radius_km: float, limit: int, db: AsyncSession
+) -> list[tuple[Property, float]]:
+    """Properties within radius_km of a point, nearest first, as (property, distance_km).
+
+    The bounding box of the circle is matched against the (latitude, longitude)
+    index and the database keeps the candidates nearest by a flat-earth
+    squared distance; exact haversine distances are only computed for those.
+    The approximation is well under 1% off at these radii, so fetching twice
+    ``limit`` candidates leaves room for near-ties to swap places.
+    """
+    min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius_km)
+    dlat = Property.latitude - lat
+    dlng = (Property.longitude - lng) * math.cos(math.radians(lat))
+    result = await db.execute(
+        select(Property)
+        .where(
+            Property.is_active.is_(True),
+            Property.latitude.between(min_lat, max_lat),
+            Property.longitude.between(min_lng, max_lng),
+        )
+        .order_by(dlat * dlat + dlng * dlng, Property.id)
+        .limit(2 * limit)
+    )
+    hits = []
+    for prop in result.scalars():
+        distance = haversine_km(lat, lng, float(prop.latitude), float(prop.longitude))
+        if distance <= radius_km:
+            hits.append((prop, distance))
+    hits.sort(key=lambda hit: hit[1])
+    return hits[:limit]
+
+
+async def search_within_bounds(
+    min_lat: float, max_lat: float, min_lng: float, max_lng: float, limit: int, db: AsyncSession
+) -> list[Property]:
+    """Properties inside a map viewport, most reviewed first.
+
+    A viewport whose ``min_lng`` is east of its ``max_lng`` crosses the
+    antimeridian and is searched as two longitude ranges.
+    """
+    if min_lng <= max_lng:
+        in_lng = Property.longitude.between(min_lng, max_lng)
+    else:
+        in_lng = or_(
+            Property.longitude.between(min_lng, 180), Property.longitude.between(-180, max_lng)
+        )
+    result = await db.execute(
+        select(Property)
+        .where(
+            Property.is_active.is_(True),
+            Property.latitude.between(min_lat, max_lat),
+            in_lng,
+        )
+        .order_by(Property.review_count.desc(), Property.id)
+        .limit(limit)
+    )
+    return list(result.scalars().all())
 
 
 async def update_property(property_id: UUID, data: PropertyUpdateRequest, db: AsyncSession) -> Property:
@@ -1,29 +1,38 @@
+import json
+import uuid
 from datetime import date, datetime, timezone
 from uuid import UUID
 
-from sqlalchemy import func, select
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import case, event, false, func, literal_column, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 
 from app.config import settings
-from app.core.constants import ReviewStatus, VerificationStatus
+from app.core.constants import (
+    LANDLORD_RATING_FIELDS,
+    PROPERTY_RATING_FIELDS,
+    ModerationAction,
+    ReviewStatus,
+    ReviewType,
+    UnlockTier,
+    VerificationStatus,
+)
 from app.core.exceptions import BadRequestError, ConflictError, NotFoundError
+from app.models.dispute import LandlordResponse
+from app.models.location import Community
 from app.models.property import Property
-from app.models.review import LandlordReview, PropertyReview
+from app.models.review import LandlordReview, PropertyReview, PropertyReviewPhoto
 from app.models.user import User
 from app.models.verification import TenancyRecord
 from app.schemas.review import LandlordReviewCreateRequest, PropertyReviewCreateRequest
+from app.services import duplicate_service, payment_service, stats_service
+from app.utils.cache import LRUCache
+from app.utils.profanity import censor_keeping_original
+from app.utils.search import TS_CONFIG, highlight, is_postgres
 
-PROPERTY_RATING_FIELDS = [
-    "rating_plumbing", "rating_electricity", "rating_water", "rating_it_cabling",
-    "rating_hvac", "rating_amenity_stove", "rating_amenity_washer", "rating_amenity_fridge",
-    "rating_infra_water_tank", "rating_infra_irrigation", "rating_health_dust",
-    "rating_health_breathing", "rating_health_sewage",
-]
-
-LANDLORD_RATING_FIELDS = [
-    "rating_responsiveness", "rating_demeanor", "rating_repair_payments",
-    "rating_availability", "rating_payment_flexibility",
-]
+# Characters of review text visible with a summary unlock
+SUMMARY_TEXT_CHARS = 200
 
 
 def _compute_overall(data: dict, fields: list[str]) -> float:
@@ -78,22 +87,38 @@ async def create_property_review(
     overall = _compute_overall(review_data, PROPERTY_RATING_FIELDS)
 
     is_verified = tenancy.verification_status == VerificationStatus.VERIFIED.value
-    excerpt = data.public_excerpt or data.review_text[:200]
+    review_text, review_text_raw = censor_keeping_original(data.review_text)
+    excerpt, excerpt_raw = review_text[:200], None
+    if data.public_excerpt:
+        excerpt, excerpt_raw = censor_keeping_original(data.public_excerpt)
+        excerpt = excerpt[:300]  # Placeholders can outgrow the column
+
+    # Near-duplicates of existing reviews are flagged and held for moderation
+    review_id = uuid.uuid4()
+    duplicates = await duplicate_service.index_review(
+        ReviewType.PROPERTY, review_id, review_text, db
+    )
+    auto_publish = is_verified and not duplicates
 
     review = PropertyReview(
+        id=review_id,
         property_id=data.property_id,
         tenant_id=user.id,
         tenancy_record_id=data.tenancy_record_id,
         overall_rating=overall,
-        review_text=data.review_text,
+        review_text=review_text,
+        review_text_raw=review_text_raw,
         public_excerpt=excerpt,
+        public_excerpt_raw=excerpt_raw,
         status=ReviewStatus.SUBMITTED.value,
         verification_status=VerificationStatus.VERIFIED.value if is_verified else VerificationStatus.UNVERIFIED.value,
-        published_at=datetime.now(timezone.utc) if is_verified else None,
+        is_flagged=bool(duplicates),
+        published_at=datetime.now(timezone.utc) if auto_publish else None,
+        photos=[],
         **{f: review_data[f] for f in PROPERTY_RATING_FIELDS},
     )
     # Auto-publish if verified, otherwise stays as submitted pending moderation
-    if is_verified:
+    if auto_publish:
         review.status = ReviewStatus.PUBLISHED.value
 
     db.add(review)
@@ -101,7 +126,7 @@ async def create_property_review(
 
     # Update property aggregate ratings if published
     if review.status == ReviewStatus.PUBLISHED.value:
-        await _update_property_ratings(data.property_id, db)
+        await stats_service.apply_property_reviews([review], 1, db)
 
     return review
 
@@ -129,13 +154,80 @@ async def publish_review(review_id: UUID, db: AsyncSession) -> PropertyReview:
         raise NotFoundError("Review not found")
     if review.status != ReviewStatus.SUBMITTED.value:
         raise BadRequestError("Review must be in submitted state to publish")
-    review.status = ReviewStatus.PUBLISHED.value
-    review.published_at = datetime.now(timezone.utc)
+    await set_property_review_status(review, ReviewStatus.PUBLISHED.value, db)
     await db.flush()
-    await _update_property_ratings(review.property_id, db)
     return review
 
 
+async def bulk_moderate_reviews(
+    review_ids: list[UUID], action: ModerationAction, db: AsyncSession
+) -> list[tuple[UUID, str]]:
+    """Publish or reject many submitted reviews with one set-based UPDATE.
+
+    Rating aggregates are applied once per affected property. Returns an
+    outcome per requested id, in request order: ``published``, ``removed``,
+    ``not_found`` or ``not_submitted``.
+    """
+    review_ids = list(dict.fromkeys(review_ids))
+    if action == ModerationAction.PUBLISH:
+        new_status = ReviewStatus.PUBLISHED.value
+        values = {"status": new_status, "published_at": datetime.now(timezone.utc)}
+    else:
+        new_status = ReviewStatus.REMOVED.value
+        values = {"status": new_status}
+
+    rating_columns = [getattr(PropertyReview, f) for f in PROPERTY_RATING_FIELDS]
+    result = await db.execute(
+        update(PropertyReview)
+        .where(
+            PropertyReview.id.in_(review_ids),
+            PropertyReview.status == ReviewStatus.SUBMITTED.value,
+        )
+        .values(**values)
+        .returning(
+            PropertyReview.id,
+            PropertyReview.property_id,
+            PropertyReview.overall_rating,
+            PropertyReview.published_at,
+            PropertyReview.created_at,
+            *rating_columns,
+        ),
+        execution_options={"synchronize_session": "fetch"},
+    )
+    changed = result.all()
+    if new_status == ReviewStatus.PUBLISHED.value:
+        await stats_service.apply_property_reviews(changed, 1, db)
+    for row in changed:
+        invalidate_review_fragments(row.id, db)
+
+    outcomes = {row.id: new_status for row in changed}
+    rest = [rid for rid in review_ids if rid not in outcomes]
+    if rest:
+        existing = await db.execute(select(PropertyReview.id).where(PropertyReview.id.in_(rest)))
+        outcomes.update(dict.fromkeys(existing.scalars(), "not_submitted"))
+    return [(rid, outcomes.get(rid, "not_found")) for rid in review_ids]
+
+
+async def set_property_review_status(
+    review: PropertyReview, status: str, db: AsyncSession
+) -> None:
+    """Move a property review to ``status``, keeping the rating aggregates in step.
+
+    Every status change of a property review must go through here. The
+    first publication stamps ``published_at`` before the aggregates are
+    applied, so the monthly trend bucket matches the one a later unpublish
+    subtracts from.
+    """
+    was_published = review.status == ReviewStatus.PUBLISHED.value
+    review.status = status
+    invalidate_review_fragments(review.id, db)
+    is_published = status == ReviewStatus.PUBLISHED.value
+    if is_published and review.published_at is None:
+        review.published_at = datetime.now(timezone.utc)
+    if was_published != is_published:
+        await stats_service.apply_property_reviews([review], 1 if is_published else -1, db)
+
+
 async def create_landlord_review(
     data: LandlordReviewCreateRequest, user: User, db: AsyncSession
 ) -> LandlordReview:
@@ -155,104 +247,367 @@ async def create_landlord_review(
     overall = _compute_overall(review_data, LANDLORD_RATING_FIELDS)
 
     is_verified = tenancy.verification_status == VerificationStatus.VERIFIED.value
+    review_text, review_text_raw = censor_keeping_original(data.review_text)
+
+    review_id = uuid.uuid4()
+    duplicates = await duplicate_service.index_review(
+        ReviewType.LANDLORD, review_id, review_text, db
+    )
+    auto_publish = is_verified and not duplicates
 
     review = LandlordReview(
+        id=review_id,
         landlord_id=data.landlord_id,
         tenant_id=user.id,
         property_id=data.property_id,
         tenancy_record_id=data.tenancy_record_id,
         overall_rating=overall,
-        review_text=data.review_text,
+        review_text=review_text,
+        review_text_raw=review_text_raw,
         status=ReviewStatus.SUBMITTED.value,
         verification_status=VerificationStatus.VERIFIED.value if is_verified else VerificationStatus.UNVERIFIED.value,
-        published_at=datetime.now(timezone.utc) if is_verified else None,
+        is_flagged=bool(duplicates),
+        published_at=datetime.now(timezone.utc) if auto_publish else None,
         **{f: review_data[f] for f in LANDLORD_RATING_FIELDS},
     )
-    if is_verified:
+    if auto_publish:
         review.status = ReviewStatus.PUBLISHED.value
 
     db.add(review)
     await db.flush()
 
     if review.status == ReviewStatus.PUBLISHED.value:
+        await stats_service.apply_landlord_reviews([review], 1, db)
         await _update_landlord_ratings(data.property_id, db)
 
     return review
 
 
-async def get_property_review_summary(property_id: UUID, db: AsyncSession) -> dict:
-    """Free tier: aggregate ratings only."""
-    base = select(
-        func.count().label("review_count"),
-        func.avg(PropertyReview.overall_rating).label("avg_overall"),
-        *[func.avg(getattr(PropertyReview, f)).label(f"avg_{f.replace('rating_', '')}") for f in PROPERTY_RATING_FIELDS],
-    ).where(
-        PropertyReview.property_id == property_id,
-        PropertyReview.status == ReviewStatus.PUBLISHED.value,
-    )
+async def set_landlord_review_status(
+    review: LandlordReview, status: str, db: AsyncSession
+) -> None:
+    """Move a landlord review to ``status``, keeping the landlord aggregates in step.
+
+    Every status change of a landlord review must go through here; like
+    ``set_property_review_status`` it stamps ``published_at`` on first
+    publication.
+    """
+    was_published = review.status == ReviewStatus.PUBLISHED.value
+    review.status = status
+    is_published = status == ReviewStatus.PUBLISHED.value
+    if is_published and review.published_at is None:
+        review.published_at = datetime.now(timezone.utc)
+    if was_published != is_published:
+        await stats_service.apply_landlord_reviews([review], 1 if is_published else -1, db)
+        await _update_landlord_ratings(review.property_id, db)
 
-    result = await db.execute(base)
-    row = result.one()
 
-    return {
-        "property_id": property_id,
-        "review_count": row.review_count or 0,
-        "avg_overall": float(row.avg_overall or 0),
-        **{f"avg_{f.replace('rating_', '')}": float(getattr(row, f"avg_{f.replace('rating_', '')}") or 0) for f in PROPERTY_RATING_FIELDS},
-    }
+async def get_property_review_summary(property_id: UUID, db: AsyncSession) -> dict:
+    """Free tier: aggregate ratings only."""
+    return await stats_service.get_property_stats(property_id, db)
+
+
+async def get_property_trend(property_id: UUID, months: int, db: AsyncSession) -> dict:
+    """Monthly rating averages, to show whether a property is improving."""
+    points = await stats_service.get_property_trend(property_id, months, db)
+    return {"property_id": property_id, "months": months, "points": points}
+
+
+async def get_city_heatmap(city_id: UUID, db: AsyncSession) -> dict:
+    """Neighbourhood rating averages across a city, for the map heatmap."""
+    return await stats_service.get_city_heatmap(city_id, db)
+
+
+async def get_landlord_scorecard(landlord_id: UUID, db: AsyncSession) -> dict:
+    """Landlord reputation across all of their properties."""
+    return await stats_service.get_landlord_stats(landlord_id, db)
+
+
+# Listing tiers: the unlock tiers plus "snippet" for reviews the viewer has not unlocked
+SNIPPET_TIER = "snippet"
+FRAGMENT_TIERS = (SNIPPET_TIER, *(t.value for t in UnlockTier))
+DETAILED_TIERS = (UnlockTier.DETAILED.value, UnlockTier.FULL.value)
+
+# Rendered JSON per (review_id, tier). Published reviews only change through a
+# status transition, which invalidates them; the TTL bounds staleness across
+# worker processes.
+_fragment_cache = LRUCache(
+    max_entries=10_000, ttl_seconds=settings.REVIEW_FRAGMENT_CACHE_TTL_SECONDS
+)
+
+# Columns each access tier may see (see api/v1/reviews.get_property_reviews)
+SNIPPET_COLUMNS = (
+    PropertyReview.id,
+    PropertyReview.property_id,
+    PropertyReview.overall_rating,
+    PropertyReview.public_excerpt,
+    PropertyReview.status,
+    PropertyReview.verification_status,
+    PropertyReview.created_at,
+)
+UNLOCKED_COLUMNS = (
+    PropertyReview.id,
+    PropertyReview.tenant_id,
+    PropertyReview.is_flagged,
+    PropertyReview.published_at,
+)
+RESPONSE_COLUMNS = (
+    LandlordResponse.property_review_id,
+    LandlordResponse.id,
+    LandlordResponse.landlord_id,
+    LandlordResponse.response_text,
+    LandlordResponse.created_at,
+)
+PHOTO_COLUMNS = (
+    PropertyReviewPhoto.id,
+    PropertyReviewPhoto.file_url,
+    PropertyReviewPhoto.file_name,
+    PropertyReviewPhoto.sort_order,
+)
 
 
 async def get_property_reviews(
-    property_id: UUID, db: AsyncSession, page: int = 1, page_size: int = 20
-) -> tuple[list[PropertyReview], int]:
+    property_id: UUID,
+    db: AsyncSession,
+    page: int = 1,
+    page_size: int = 20,
+    user_id: UUID | None = None,
+) -> tuple[list[bytes], int]:
+    """A page of published reviews as JSON fragments, one per review.
+
+    Each fragment is the review projected to the viewer's unlock tier. Rendered
+    fragments are cached per (review, tier); on a miss only the columns that
+    tier may see are read, and the summary tier only reads the head of the
+    text. Returns (fragments, total).
+    """
+    published = [
+        PropertyReview.property_id == property_id,
+        PropertyReview.status == ReviewStatus.PUBLISHED.value,
+    ]
     count_result = await db.execute(
-        select(func.count()).select_from(PropertyReview).where(
-            PropertyReview.property_id == property_id,
-            PropertyReview.status == ReviewStatus.PUBLISHED.value,
-        )
+        select(func.count()).select_from(PropertyReview).where(*published)
     )
     total = count_result.scalar()
 
     offset = (page - 1) * page_size
     result = await db.execute(
-        select(PropertyReview)
-        .where(PropertyReview.property_id == property_id, PropertyReview.status == ReviewStatus.PUBLISHED.value)
+        select(PropertyReview.id)
+        .where(*published)
         .order_by(PropertyReview.created_at.desc())
         .offset(offset)
         .limit(page_size)
     )
-    reviews = list(result.scalars().all())
-
-    return reviews, total
+    review_ids = list(result.scalars())
+    tiers = {}
+    if review_ids and user_id is not None:
+        tiers = await payment_service.resolve_unlock_tiers(user_id, review_ids, db)
+
+    keys = [(rid, tiers.get(rid, SNIPPET_TIER)) for rid in review_ids]
+    fragments = {key: _fragment_cache.get(key) for key in keys}
+    missing = [key for key, fragment in fragments.items() if fragment is None]
+    if missing:
+        items = await _load_review_items(missing, db)
+        for key in missing:
+            fragment = json.dumps(jsonable_encoder(items[key[0]]), separators=(",", ":")).encode()
+            _fragment_cache.set(key, fragment)
+            fragments[key] = fragment
+    return [fragments[key] for key in keys], total
+
+
+async def _load_review_items(keys: list[tuple[UUID, str]], db: AsyncSession) -> dict[UUID, dict]:
+    """Loads each review's response dict, with only its tier's columns."""
+    summary_ids = [rid for rid, tier in keys if tier == UnlockTier.SUMMARY.value]
+    detailed_ids = [rid for rid, tier in keys if tier in DETAILED_TIERS]
+    full_ids = [rid for rid, tier in keys if tier == UnlockTier.FULL.value]
 
+    result = await db.execute(
+        select(*SNIPPET_COLUMNS).where(PropertyReview.id.in_([rid for rid, _ in keys]))
+    )
+    items = {row["id"]: dict(row) for row in result.mappings()}
+    for item in items.values():
+        item["overall_rating"] = float(item["overall_rating"])
+        item["landlord_response"] = None
 
-async def get_user_reviews(user_id: UUID, db: AsyncSession) -> tuple[list[PropertyReview], list[LandlordReview]]:
-    prop_result = await db.execute(
-        select(PropertyReview).where(PropertyReview.tenant_id == user_id).order_by(PropertyReview.created_at.desc())
+    # Landlord replies are public at every tier
+    result = await db.execute(
+        select(*RESPONSE_COLUMNS)
+        .where(
+            LandlordResponse.property_review_id.in_(items.keys()),
+            LandlordResponse.is_published.is_(True),
+        )
+        .order_by(LandlordResponse.created_at)
     )
-    landlord_result = await db.execute(
-        select(LandlordReview).where(LandlordReview.tenant_id == user_id).order_by(LandlordReview.created_at.desc())
+    for row in result.mappings():
+        response = dict(row)
+        items[response.pop("property_review_id")]["landlord_response"] = response
+
+    if summary_ids:
+        # Summary: truncated text + overall rating, no category ratings
+        head = func.substr(PropertyReview.review_text, 1, SUMMARY_TEXT_CHARS + 1)
+        result = await db.execute(
+            select(*UNLOCKED_COLUMNS, head.label("review_text"))
+            .where(PropertyReview.id.in_(summary_ids))
+        )
+        for row in result.mappings():
+            item = items[row["id"]]
+            item.update(row)
+            if len(item["review_text"]) > SUMMARY_TEXT_CHARS:
+                item["review_text"] = item["review_text"][:SUMMARY_TEXT_CHARS] + "..."
+            item.update(dict.fromkeys(PROPERTY_RATING_FIELDS), photos=[])
+
+    if detailed_ids:
+        # Detailed: full text + all category ratings; photos only for full
+        rating_columns = [getattr(PropertyReview, f) for f in PROPERTY_RATING_FIELDS]
+        result = await db.execute(
+            select(*UNLOCKED_COLUMNS, PropertyReview.review_text, *rating_columns)
+            .where(PropertyReview.id.in_(detailed_ids))
+        )
+        for row in result.mappings():
+            items[row["id"]].update(row, photos=[])
+
+    if full_ids:
+        result = await db.execute(
+            select(PropertyReviewPhoto.review_id, *PHOTO_COLUMNS)
+            .where(PropertyReviewPhoto.review_id.in_(full_ids))
+            .order_by(PropertyReviewPhoto.sort_order)
+        )
+        for row in result.mappings():
+            photo = dict(row)
+            items[photo.pop("review_id")]["photos"].append(photo)
+
+    return items
+
+
+def invalidate_review_fragments(review_id: UUID, db: AsyncSession) -> None:
+    """Drops a review's cached fragments now and again once ``db`` commits.
+
+    Call whenever a property review's status or visible content changes.
+    """
+    for tier in FRAGMENT_TIERS:
+        _fragment_cache.delete((review_id, tier))
+    db.sync_session.info.setdefault("stale_review_fragments", set()).add(review_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_fragments_on_commit(session):
+    # A request that read the old row before our commit may have re-cached it
+    for review_id in session.info.pop("stale_review_fragments", ()):
+        for tier in FRAGMENT_TIERS:
+            _fragment_cache.delete((review_id, tier))
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_fragments_on_rollback(session, previous_transaction):
+    session.info.pop("stale_review_fragments", None)
+
+
+async def search_reviews(
+    term: str,
+    user_id: UUID | None,
+    db: AsyncSession,
+    property_id: UUID | None = None,
+    community_id: UUID | None = None,
+    city_id: UUID | None = None,
+    page: int = 1,
+    page_size: int = 20,
+) -> tuple[list[dict], int]:
+    """Ranked full-text search over published property reviews.
+
+    A review only matches on the text the viewer may read: ``public_excerpt``
+    when locked, plus the first ``SUMMARY_TEXT_CHARS`` of the review with a
+    summary unlock, and the whole review with a detailed or full unlock.
+    Returns (hits, total); each hit carries a highlighted ``highlight`` snippet.
+    """
+    if user_id is not None:
+        is_unlocked = payment_service.unlocked_at(user_id, [UnlockTier.DETAILED, UnlockTier.FULL])
+        is_summarised = payment_service.unlocked_at(user_id, [UnlockTier.SUMMARY])
+    else:
+        is_unlocked = is_summarised = false()
+
+    excerpt = func.coalesce(PropertyReview.public_excerpt, "")
+    head = func.substr(PropertyReview.review_text, 1, SUMMARY_TEXT_CHARS)
+    visible_text = case(
+        (is_unlocked, PropertyReview.review_text), (is_summarised, head), else_=excerpt
     )
-    return list(prop_result.scalars().all()), list(landlord_result.scalars().all())
-
 
-async def _update_property_ratings(property_id: UUID, db: AsyncSession) -> None:
+    conditions = [PropertyReview.status == ReviewStatus.PUBLISHED.value]
+    if property_id:
+        conditions.append(PropertyReview.property_id == property_id)
+    if community_id or city_id:
+        in_scope = select(Property.id)
+        if community_id:
+            in_scope = in_scope.where(Property.community_id == community_id)
+        if city_id:
+            in_scope = in_scope.where(
+                Property.community_id.in_(select(Community.id).where(Community.city_id == city_id))
+            )
+        conditions.append(PropertyReview.property_id.in_(in_scope))
+
+    postgres = is_postgres(db)
+    if postgres:
+        # The GIN index narrows candidates on the whole document; the tier
+        # check then re-matches against only the visible part of it.
+        tsquery = func.websearch_to_tsquery(TS_CONFIG, term)
+        excerpt_vector = func.ts_filter(
+            PropertyReview.search_vector, literal_column("""'{a}'::"char"[]""")
+        )
+        visible_vector = case(
+            (is_unlocked, PropertyReview.search_vector),
+            (is_summarised, excerpt_vector.op("||")(func.to_tsvector(TS_CONFIG, head))),
+            else_=excerpt_vector,
+        )
+        conditions += [
+            PropertyReview.search_vector.op("@@")(tsquery),
+            visible_vector.op("@@")(tsquery),
+        ]
+        rank = func.ts_rank(visible_vector, tsquery)
+        snippet = func.ts_headline(
+            TS_CONFIG, visible_text, tsquery, "MaxFragments=2, MinWords=5, MaxWords=20"
+        )
+    else:
+        conditions.append(or_(excerpt.ilike(f"%{term}%"), visible_text.ilike(f"%{term}%")))
+        rank = None
+        snippet = visible_text
+
+    total = (
+        await db.execute(select(func.count()).select_from(PropertyReview).where(*conditions))
+    ).scalar()
+
+    order = [PropertyReview.created_at.desc(), PropertyReview.id.desc()]
+    if rank is not None:
+        order.insert(0, rank.desc())
     result = await db.execute(
         select(
-            func.avg(PropertyReview.overall_rating),
-            func.count(),
-        ).where(
-            PropertyReview.property_id == property_id,
-            PropertyReview.status == ReviewStatus.PUBLISHED.value,
+            PropertyReview.id,
+            PropertyReview.property_id,
+            PropertyReview.overall_rating,
+            PropertyReview.public_excerpt,
+            PropertyReview.created_at,
+            snippet.label("highlight"),
         )
+        .where(*conditions)
+        .order_by(*order)
+        .offset((page - 1) * page_size)
+        .limit(page_size)
     )
-    avg_rating, count = result.one()
+    hits = [dict(row) for row in result.mappings()]
+    if not postgres:
+        for hit in hits:
+            hit["highlight"] = highlight(hit["highlight"], term)
+    return hits, total
 
-    prop_result = await db.execute(select(Property).where(Property.id == property_id))
-    prop = prop_result.scalar_one_or_none()
-    if prop:
-        prop.avg_property_rating = float(avg_rating or 0)
-        prop.review_count = count or 0
+
+async def get_user_reviews(user_id: UUID, db: AsyncSession) -> tuple[list[PropertyReview], list[LandlordReview]]:
+    prop_result = await db.execute(
+        select(PropertyReview)
+        .options(selectinload(PropertyReview.photos))
+        .where(PropertyReview.tenant_id == user_id)
+        .order_by(PropertyReview.created_at.desc())
+    )
+    landlord_result = await db.execute(
+        select(LandlordReview).where(LandlordReview.tenant_id == user_id).order_by(LandlordReview.created_at.desc())
+    )
+    return list(prop_result.scalars().all()), list(landlord_result.scalars().all())
 
 
 async def _update_landlord_ratings(property_id: UUID, db: AsyncSession) -> None:
@@ -0,0 +1,328 @@
+"""Incrementally maintained rating aggregates.
+
+Every published review contributes its ratings to running-sum rows: one per
+property (rolled up again per calendar month, community and city) and one
+per landlord.
+Status transitions apply signed deltas through upserts in the caller's
+transaction, so summaries, rating histograms, heatmaps, landlord scorecards
+and the denormalised ``Property`` averages never rescan the review tables.
+"""
+
+from collections.abc import Callable, Iterable
+from datetime import date
+from decimal import Decimal
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import case, func, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.constants import LANDLORD_RATING_FIELDS, PROPERTY_RATING_FIELDS
+from app.models.location import Community
+from app.models.property import Property
+from app.models.review import LandlordReview, PropertyReview
+from app.models.stats import (
+    CityRatingStats,
+    CommunityRatingStats,
+    LandlordRatingStats,
+    PropertyRatingMonthly,
+    PropertyRatingStats,
+)
+from app.utils.histogram import add_ratings, distribution_stats, empty_histogram
+
+PROPERTY_CATEGORIES = [f.removeprefix("rating_") for f in PROPERTY_RATING_FIELDS]
+LANDLORD_CATEGORIES = [f.removeprefix("rating_") for f in LANDLORD_RATING_FIELDS]
+
+
+def dialect_insert(db: AsyncSession):
+    """The dialect's ``insert`` construct, which supports ON CONFLICT upserts."""
+    return postgresql.insert if db.bind.dialect.name == "postgresql" else sqlite.insert
+
+
+def _add_to_delta(deltas: dict, key: UUID, review, fields: list[str], sign: int) -> list:
+    """Accumulates one review into ``deltas[key]``; returns its category ratings."""
+    delta = deltas.get(key)
+    if delta is None:
+        delta = {"review_count": 0, "overall_sum": Decimal(0)}
+        for field in fields:
+            cat = field.removeprefix("rating_")
+            delta[f"{cat}_sum"] = delta[f"{cat}_count"] = 0
+        deltas[key] = delta
+    delta["review_count"] += sign
+    delta["overall_sum"] += sign * Decimal(str(review.overall_rating))
+    ratings = [getattr(review, field) for field in fields]
+    for field, value in zip(fields, ratings):
+        if value is not None:
+            cat = field.removeprefix("rating_")
+            delta[f"{cat}_sum"] += sign * value
+            delta[f"{cat}_count"] += sign
+    return ratings
+
+
+def _upsert_deltas(
+    db: AsyncSession,
+    model,
+    key_columns,
+    deltas: dict,
+    on_conflict_set: Callable[..., dict] | None = None,
+):
+    """INSERT ... ON CONFLICT statement adding ``deltas`` to the existing row.
+
+    ``key_columns`` is the primary key column, or a tuple of them when the
+    deltas are keyed by tuples. Every delta column is summed on conflict
+    unless ``on_conflict_set``, called with the ``excluded`` pseudo-row,
+    returns another expression for it.
+    """
+    if not isinstance(key_columns, tuple):
+        key_columns = (key_columns,)
+        deltas = {(k,): delta for k, delta in deltas.items()}
+    insert = dialect_insert(db)
+    stmt = insert(model).values([
+        {**{c.key: v for c, v in zip(key_columns, key)}, **delta}
+        for key, delta in deltas.items()
+    ])
+    set_ = on_conflict_set(stmt.excluded) if on_conflict_set else {}
+    for column in next(iter(deltas.values())):
+        if column not in set_:
+            set_[column] = getattr(model, column) + stmt.excluded[column]
+    set_["updated_at"] = func.now()
+    return stmt.on_conflict_do_update(index_elements=list(key_columns), set_=set_)
+
+
+async def apply_property_reviews(
+    reviews: Iterable[PropertyReview], sign: int, db: AsyncSession
+) -> None:
+    """Add (``sign=1``) or subtract (``sign=-1``) reviews from their properties' stats.
+
+    Callers pass reviews that are entering or leaving the published state.
+    Sums and counts are incremented atomically by the upsert; the histogram is
+    then read-modify-written while the upsert still holds the row lock.
+    """
+    deltas: dict[UUID, dict] = {}
+    monthly: dict[tuple[UUID, date], dict] = {}
+    histograms: dict[UUID, np.ndarray] = {}
+    for review in reviews:
+        ratings = _add_to_delta(deltas, review.property_id, review, PROPERTY_RATING_FIELDS, sign)
+        hist = histograms.setdefault(review.property_id, empty_histogram(len(ratings)))
+        add_ratings(hist, ratings, sign)
+        published_at = review.published_at or review.created_at
+        month = date(published_at.year, published_at.month, 1)
+        _add_to_delta(monthly, (review.property_id, month), review, PROPERTY_RATING_FIELDS, sign)
+    if not deltas:
+        return
+
+    stmt = _upsert_deltas(
+        db, PropertyRatingStats, PropertyRatingStats.property_id, deltas
+    ).returning(
+        PropertyRatingStats.property_id,
+        PropertyRatingStats.review_count,
+        PropertyRatingStats.overall_sum,
+        PropertyRatingStats.histogram,
+    )
+    totals = (await db.execute(stmt)).all()
+
+    for property_id, count, overall_sum, histogram in totals:
+        await db.execute(
+            update(PropertyRatingStats)
+            .where(PropertyRatingStats.property_id == property_id)
+            .values(histogram=histogram + histograms[property_id])
+        )
+        avg = round(Decimal(overall_sum) / count, 2) if count else Decimal(0)
+        await db.execute(
+            update(Property)
+            .where(Property.id == property_id)
+            .values(avg_property_rating=avg, review_count=count)
+        )
+
+    await db.execute(
+        _upsert_deltas(
+            db,
+            PropertyRatingMonthly,
+            (PropertyRatingMonthly.property_id, PropertyRatingMonthly.month),
+            monthly,
+        )
+    )
+    await _apply_area_rollups(deltas, db)
+
+
+def _merge_delta(deltas: dict, key: UUID, delta: dict) -> None:
+    target = deltas.setdefault(key, dict.fromkeys(delta, 0))
+    for column, value in delta.items():
+        target[column] += value
+
+
+async def _apply_area_rollups(property_deltas: dict[UUID, dict], db: AsyncSession) -> None:
+    """Adds property-level deltas into their communities' and cities' rows."""
+    result = await db.execute(
+        select(Property.id, Property.community_id, Community.city_id)
+        .join(Community, Community.id == Property.community_id)
+        .where(Property.id.in_(property_deltas))
+    )
+    community_deltas: dict[UUID, dict] = {}
+    city_deltas: dict[UUID, dict] = {}
+    community_city: dict[UUID, UUID] = {}
+    for property_id, community_id, city_id in result:
+        _merge_delta(community_deltas, community_id, property_deltas[property_id])
+        _merge_delta(city_deltas, city_id, property_deltas[property_id])
+        community_city[community_id] = city_id
+    if not community_deltas:
+        return
+
+    for community_id, delta in community_deltas.items():
+        delta["city_id"] = community_city[community_id]
+    await db.execute(
+        _upsert_deltas(
+            db, CommunityRatingStats, CommunityRatingStats.community_id, community_deltas,
+            lambda excluded: {"city_id": excluded.city_id},
+        )
+    )
+    await db.execute(_upsert_deltas(db, CityRatingStats, CityRatingStats.city_id, city_deltas))
+
+
+async def apply_landlord_reviews(
+    reviews: Iterable[LandlordReview], sign: int, db: AsyncSession
+) -> None:
+    """Add or subtract landlord reviews from their landlords' portfolio stats.
+
+    ``last_review_at`` only moves forward: it is the latest publication time
+    seen, and is not wound back when a review is later removed.
+    """
+    deltas: dict[UUID, dict] = {}
+    for review in reviews:
+        _add_to_delta(deltas, review.landlord_id, review, LANDLORD_RATING_FIELDS, sign)
+        delta = deltas[review.landlord_id]
+        latest = delta.get("last_review_at")
+        if sign > 0 and review.published_at and (latest is None or review.published_at > latest):
+            delta["last_review_at"] = review.published_at
+        else:
+            delta.setdefault("last_review_at", None)
+    if not deltas:
+        return
+
+    def keep_latest(excluded) -> dict:
+        current, incoming = LandlordRatingStats.last_review_at, excluded.last_review_at
+        return {
+            "last_review_at": case(
+                (current.is_(None), incoming),
+                (incoming > current, incoming),
+                else_=current,
+            )
+        }
+
+    await db.execute(
+        _upsert_deltas(
+            db, LandlordRatingStats, LandlordRatingStats.landlord_id, deltas, keep_latest
+        )
+    )
+
+
+def _avg(total, n) -> float:
+    return float(total) / n if n else 0.0
+
+
+def _property_averages(row) -> dict:
+    """review_count, avg_overall and avg_<category> from a property-sums row."""
+    count = row.get("review_count", 0)
+    return {
+        "review_count": count,
+        "avg_overall": _avg(row.get("overall_sum", 0), count),
+        **{
+            f"avg_{cat}": _avg(row.get(f"{cat}_sum", 0), row.get(f"{cat}_count", 0))
+            for cat in PROPERTY_CATEGORIES
+        },
+    }
+
+
+async def get_property_stats(property_id: UUID, db: AsyncSession) -> dict:
+    """Per-category averages and distributions for a property, from its stats row."""
+    result = await db.execute(
+        select(PropertyRatingStats.__table__).where(
+            PropertyRatingStats.property_id == property_id
+        )
+    )
+    row = result.mappings().one_or_none() or {}
+    histogram = row.get("histogram")
+    if histogram is None:
+        histogram = empty_histogram(len(PROPERTY_CATEGORIES))
+
+    return {
+        "property_id": property_id,
+        **_property_averages(row),
+        "distributions": dict(zip(PROPERTY_CATEGORIES, distribution_stats(histogram))),
+    }
+
+
+async def get_property_trend(property_id: UUID, months: int, db: AsyncSession) -> list[dict]:
+    """Monthly averages for the last ``months`` months, oldest first.
+
+    Months without a published review are omitted.
+    """
+    today = date.today()
+    start_index = today.year * 12 + today.month - 1 - (months - 1)
+    since = date(start_index // 12, start_index % 12 + 1, 1)
+    result = await db.execute(
+        select(PropertyRatingMonthly.__table__)
+        .where(
+            PropertyRatingMonthly.property_id == property_id,
+            PropertyRatingMonthly.month >= since,
+            PropertyRatingMonthly.review_count > 0,
+        )
+        .order_by(PropertyRatingMonthly.month)
+    )
+    return [{"month": row["month"], **_property_averages(row)} for row in result.mappings()]
+
+
+async def get_city_heatmap(city_id: UUID, db: AsyncSession) -> dict:
+    """A city's rating averages and those of each of its reviewed communities."""
+    city_result = await db.execute(
+        select(CityRatingStats.__table__).where(CityRatingStats.city_id == city_id)
+    )
+    city = city_result.mappings().one_or_none() or {}
+
+    result = await db.execute(
+        select(
+            CommunityRatingStats.__table__,
+            Community.name,
+            Community.slug,
+            Community.latitude,
+            Community.longitude,
+        )
+        .join(Community, Community.id == CommunityRatingStats.community_id)
+        .where(CommunityRatingStats.city_id == city_id, CommunityRatingStats.review_count > 0)
+        .order_by(Community.name)
+    )
+    communities = [
+        {
+            "community_id": row["community_id"],
+            "name": row["name"],
+            "slug": row["slug"],
+            "latitude": row["latitude"],
+            "longitude": row["longitude"],
+            **_property_averages(row),
+        }
+        for row in result.mappings()
+    ]
+    return {"city_id": city_id, **_property_averages(city), "communities": communities}
+
+
+async def get_landlord_stats(landlord_id: UUID, db: AsyncSession) -> dict:
+    """Portfolio-wide scorecard for a landlord, from their stats row."""
+    result = await db.execute(
+        select(LandlordRatingStats.__table__).where(
+            LandlordRatingStats.landlord_id == landlord_id
+        )
+    )
+    row = result.mappings().one_or_none() or {}
+    count = row.get("review_count", 0)
+
+    return {
+        "landlord_id": landlord_id,
+        "review_count": count,
+        "avg_overall": _avg(row.get("overall_sum", 0), count),
+        **{
+            f"avg_{cat}": _avg(row.get(f"{cat}_sum", 0), row.get(f"{cat}_count", 0))
+            for cat in LANDLORD_CATEGORIES
+        },
+        "last_review_at": row.get("last_review_at"),
+    }
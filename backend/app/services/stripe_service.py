@@ -0,0 +1,43 @@
+"""Non-blocking access to the Stripe API.
+
+Requests go through a ``StripeClient`` on the SDK's httpx transport, so they
+are awaited on the event loop over pooled connections instead of blocking the
+worker. Each request has a timeout and is retried on network errors and 5xx
+responses (the SDK adds an idempotency key, so retried POSTs are safe).
+
+``STRIPE_API_BASE`` points the client at another server, such as stripe-mock
+or a local fake for load tests.
+"""
+
+import stripe
+
+from app.config import settings
+
+_client: stripe.StripeClient | None = None
+# The client's transport, kept to close its connection pool
+_http_client: stripe.HTTPXClient | None = None
+
+
+def get_client() -> stripe.StripeClient:
+    global _client, _http_client
+    if _client is None:
+        _http_client = stripe.HTTPXClient(timeout=settings.STRIPE_TIMEOUT_SECONDS)
+        _client = stripe.StripeClient(
+            settings.STRIPE_SECRET_KEY,
+            http_client=_http_client,
+            max_network_retries=settings.STRIPE_MAX_NETWORK_RETRIES,
+            base_addresses={"api": settings.STRIPE_API_BASE} if settings.STRIPE_API_BASE else {},
+        )
+    return _client
+
+
+async def close() -> None:
+    """Release pooled connections; the next call creates a fresh client."""
+    global _client, _http_client
+    if _http_client is not None:
+        http_client, _client, _http_client = _http_client, None, None
+        await http_client.close_async()
+
+
+async def create_checkout_session(params: dict) -> stripe.checkout.Session:
+    return await get_client().v1.checkout.sessions.create_async(params)
@@ -9,6 +9,7 @@ from app.core.exceptions import BadRequestError, NotFoundError
 from app.models.property import PropertyOwnershipClaim
 from app.models.review import LandlordReview, PropertyReview
 from app.models.verification import TenancyRecord, VerificationDocument
+from app.services import review_service
 
 
 async def create_tenancy_record(
@@ -81,24 +82,28 @@ async def admin_review_verification(
                 tr.verified_at = datetime.now(timezone.utc)
                 tr.verified_by = admin_id
 
-                # Mark related reviews as verified and publish them
+                # Mark related reviews as verified and publish them; flagged
+                # reviews (e.g. near-duplicates) stay submitted for moderation
                 prop_reviews = await db.execute(
                     select(PropertyReview).where(PropertyReview.tenancy_record_id == tr.id)
                 )
                 for review in prop_reviews.scalars():
                     review.verification_status = VerificationStatus.VERIFIED.value
-                    if review.status == ReviewStatus.SUBMITTED.value:
-                        review.status = ReviewStatus.PUBLISHED.value
-                        review.published_at = datetime.now(timezone.utc)
+                    review_service.invalidate_review_fragments(review.id, db)
+                    if review.status == ReviewStatus.SUBMITTED.value and not review.is_flagged:
+                        await review_service.set_property_review_status(
+                            review, ReviewStatus.PUBLISHED.value, db
+                        )
 
                 landlord_reviews = await db.execute(
                     select(LandlordReview).where(LandlordReview.tenancy_record_id == tr.id)
                 )
                 for review in landlord_reviews.scalars():
                     review.verification_status = VerificationStatus.VERIFIED.value
-                    if review.status == ReviewStatus.SUBMITTED.value:
-                        review.status = ReviewStatus.PUBLISHED.value
-                        review.published_at = datetime.now(timezone.utc)
+                    if review.status == ReviewStatus.SUBMITTED.value and not review.is_flagged:
+                        await review_service.set_landlord_review_status(
+                            review, ReviewStatus.PUBLISHED.value, db
+                        )
 
         elif doc.ownership_claim_id:
             claim_result = await db.execute(
@@ -0,0 +1,103 @@
+"""Durable inbox for Stripe webhook events.
+
+The webhook endpoint only verifies, stores and acknowledges each event, so
+Stripe never waits on (or retries because of) the work it triggers. Events
+are deduplicated by Stripe's event id, and ``run_worker`` applies them in the
+background: batches are claimed with ``FOR UPDATE SKIP LOCKED``, so several
+workers can drain the inbox side by side, and each event's effects commit
+together with its ``processed`` mark. A batch that fails to commit is picked
+up again, so handlers must be idempotent.
+"""
+
+import asyncio
+import logging
+from contextlib import suppress
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.constants import WebhookEventStatus
+from app.database import async_session_factory
+from app.models.payment import WebhookEvent
+from app.services import payment_service
+from app.services.stats_service import dialect_insert
+
+logger = logging.getLogger(__name__)
+
+HANDLERS = {
+    "checkout.session.completed": payment_service.handle_topup_completed,
+}
+
+# Set by the webhook endpoint to cut the worker's poll sleep short
+_wakeup: asyncio.Event | None = None
+
+
+async def record_event(event: dict, db: AsyncSession) -> bool:
+    """Store a verified event; returns False if its id was already received."""
+    insert = dialect_insert(db)
+    result = await db.execute(
+        insert(WebhookEvent)
+        .values(id=event["id"], event_type=event["type"], payload=event)
+        .on_conflict_do_nothing(index_elements=["id"])
+    )
+    return result.rowcount == 1
+
+
+def wake_worker() -> None:
+    if _wakeup is not None:
+        _wakeup.set()
+
+
+async def process_batch(db: AsyncSession, batch_size: int | None = None) -> int:
+    """Apply up to ``batch_size`` pending events and commit; returns how many were claimed.
+
+    Each event runs in a savepoint: a failing one is rolled back alone,
+    counted against ``WEBHOOK_MAX_ATTEMPTS`` and left pending for a later
+    batch (or marked failed once out of attempts).
+    """
+    result = await db.scalars(
+        select(WebhookEvent)
+        .where(WebhookEvent.status == WebhookEventStatus.PENDING.value)
+        .order_by(WebhookEvent.received_at)
+        .limit(batch_size or settings.WEBHOOK_BATCH_SIZE)
+        .with_for_update(skip_locked=True)
+    )
+    events = result.all()
+
+    for event in events:
+        event.attempts += 1
+        handler = HANDLERS.get(event.event_type)
+        try:
+            async with db.begin_nested():
+                if handler is not None:
+                    await handler(event.payload["data"]["object"], db)
+        except Exception as exc:
+            logger.exception("Webhook event %s failed (attempt %d)", event.id, event.attempts)
+            event.last_error = repr(exc)
+            if event.attempts >= settings.WEBHOOK_MAX_ATTEMPTS:
+                event.status = WebhookEventStatus.FAILED.value
+            continue
+        event.status = WebhookEventStatus.PROCESSED.value
+        event.processed_at = datetime.now(timezone.utc)
+
+    await db.commit()
+    return len(events)
+
+
+async def run_worker() -> None:
+    """Drain the inbox until cancelled, sleeping between polls once it is empty."""
+    global _wakeup
+    _wakeup = asyncio.Event()
+    while True:
+        _wakeup.clear()
+        try:
+            async with async_session_factory() as db:
+                claimed = await process_batch(db)
+        except Exception:
+            logger.exception("Webhook batch failed")
+            claimed = 0
+        if claimed < settings.WEBHOOK_BATCH_SIZE:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(_wakeup.wait(), settings.WEBHOOK_POLL_INTERVAL_SECONDS)
@@ -0,0 +1,32 @@
+"""Great-circle helpers for latitude/longitude search."""
+
+import math
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance between two points in kilometres."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lng2 - lng1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bounding_box(lat: float, lng: float, radius_km: float) -> tuple[float, float, float, float]:
+    """Returns (min_lat, max_lat, min_lng, max_lng) enclosing the radius.
+
+    Near the poles or across the antimeridian the longitude range is widened
+    to the whole globe instead of being split into two boxes.
+    """
+    angular = radius_km / EARTH_RADIUS_KM
+    dlat = math.degrees(angular)
+    min_lat, max_lat = max(-90.0, lat - dlat), min(90.0, lat + dlat)
+    ratio = math.sin(angular) / math.cos(math.radians(lat)) if abs(lat) < 90 else 2.0
+    if min_lat == -90.0 or max_lat == 90.0 or ratio >= 1:
+        return min_lat, max_lat, -180.0, 180.0
+    dlng = math.degrees(math.asin(ratio))
+    if lng - dlng < -180.0 or lng + dlng > 180.0:
+        return min_lat, max_lat, -180.0, 180.0
+    return min_lat, max_lat, lng - dlng, lng + dlng
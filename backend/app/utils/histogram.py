@@ -0,0 +1,56 @@
+"""Rating histograms and the distribution statistics derived from them.
+
+A histogram is an int32 matrix with one row per rating category and one
+column per star value (1-5). All statistics are computed for every category
+at once, without going back to individual reviews.
+"""
+
+import numpy as np
+
+STAR_VALUES = np.arange(1, 6, dtype=np.float64)
+Z_95 = 1.959963984540054
+
+
+def empty_histogram(rows: int) -> np.ndarray:
+    return np.zeros((rows, len(STAR_VALUES)), dtype=np.int32)
+
+
+def add_ratings(hist: np.ndarray, ratings: list[int | None], weight: int = 1) -> None:
+    """Adds one review's category ratings (``None`` = not rated) in place."""
+    for row, value in enumerate(ratings):
+        if value is not None:
+            hist[row, value - 1] += weight
+
+
+def distribution_stats(hist: np.ndarray) -> list[dict]:
+    """Count, median and 95% confidence interval of the mean for each row.
+
+    The interval is the normal approximation, clipped to the 1-5 scale; it and
+    the median are ``None`` where there are too few ratings to compute them.
+    """
+    hist = hist.astype(np.int64)
+    n = hist.sum(axis=1)
+    cum = hist.cumsum(axis=1)
+
+    # Median: mean of the two middle order statistics (equal when n is odd)
+    lo = np.argmax(cum > ((n - 1) // 2)[:, None], axis=1) + 1
+    hi = np.argmax(cum > (n // 2)[:, None], axis=1) + 1
+    median = (lo + hi) / 2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = hist @ STAR_VALUES / n
+        var = (hist @ STAR_VALUES**2 - n * mean**2) / (n - 1)
+        half_width = Z_95 * np.sqrt(np.maximum(var, 0) / n)
+    ci_low = np.clip(mean - half_width, 1, 5)
+    ci_high = np.clip(mean + half_width, 1, 5)
+
+    return [
+        {
+            "histogram": hist[i].tolist(),
+            "count": int(n[i]),
+            "median": float(median[i]) if n[i] else None,
+            "ci_low": round(float(ci_low[i]), 2) if n[i] > 1 else None,
+            "ci_high": round(float(ci_high[i]), 2) if n[i] > 1 else None,
+        }
+        for i in range(hist.shape[0])
+    ]
@@ -0,0 +1,77 @@
+"""MinHash signatures and LSH banding for near-duplicate text detection.
+
+A signature is ``NUM_PERM`` 32-bit minimums over hashed word shingles; the
+fraction of equal positions between two signatures estimates the Jaccard
+similarity of their shingle sets. Signatures are cut into ``BANDS`` bands of
+``ROWS`` values, and texts sharing any band hash become candidates, so a
+lookup touches a handful of index rows instead of every stored text.
+"""
+
+import hashlib
+import re
+
+import numpy as np
+
+NUM_PERM = 128
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SHINGLE_WORDS = 3
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+# Fixed seed: signatures are stored, so the permutations must never change
+_rng = np.random.RandomState(1)
+_A = _rng.randint(1, int(_MERSENNE_PRIME), size=NUM_PERM, dtype=np.uint64)
+_B = _rng.randint(0, int(_MERSENNE_PRIME), size=NUM_PERM, dtype=np.uint64)
+
+_WORD = re.compile(r"\w+")
+
+
+def shingles(text: str) -> set[str]:
+    words = _WORD.findall(text.lower())
+    if len(words) <= SHINGLE_WORDS:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + SHINGLE_WORDS]) for i in range(len(words) - SHINGLE_WORDS + 1)}
+
+
+def signature(text: str) -> np.ndarray:
+    """The MinHash signature of ``text`` as ``NUM_PERM`` uint32 values."""
+    hashes = np.array(
+        [
+            int.from_bytes(hashlib.sha1(s.encode()).digest()[:4], "little")
+            for s in shingles(text)
+        ],
+        dtype=np.uint64,
+    )
+    if hashes.size == 0:
+        return np.full(NUM_PERM, _MAX_HASH, dtype=np.uint32)
+    # (a * h + b) mod p for every permutation and shingle at once; uint64
+    # overflow in the product is intended, as in the standard formulation.
+    with np.errstate(over="ignore"):
+        permuted = (np.outer(hashes, _A) + _B) % _MERSENNE_PRIME & _MAX_HASH
+    return permuted.min(axis=0).astype(np.uint32)
+
+
+def band_hashes(sig: np.ndarray) -> list[int]:
+    """One signed 64-bit hash per band, suitable for a BIGINT column."""
+    return [
+        int.from_bytes(
+            hashlib.blake2b(band.astype("<u4").tobytes(), digest_size=8).digest(),
+            "little",
+            signed=True,
+        )
+        for band in sig.reshape(BANDS, ROWS)
+    ]
+
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of the texts behind two signatures."""
+    return float(np.count_nonzero(a == b)) / NUM_PERM
+
+
+def to_bytes(sig: np.ndarray) -> bytes:
+    return sig.astype("<u4").tobytes()
+
+
+def from_bytes(data: bytes) -> np.ndarray:
+    return np.frombuffer(data, dtype="<u4")
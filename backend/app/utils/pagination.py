@@ -1,3 +1,11 @@
+import base64
+import json
+from datetime import datetime
+from uuid import UUID
+
+from app.core.exceptions import BadRequestError
+
+
 def paginate(total: int, page: int, page_size: int) -> dict:
     return {
         "total": total,
@@ -5,3 +13,24 @@ def paginate(total: int, page: int, page_size: int) -> dict:
         "page_size": page_size,
         "total_pages": (total + page_size - 1) // page_size if total else 0,
     }
+
+
+def encode_cursor(created_at: datetime, id: UUID, rank: float | None = None) -> str:
+    """Opaque keyset cursor for results ordered by ([rank,] created_at, id)."""
+    key = [created_at.isoformat(), str(id)]
+    if rank is not None:
+        key.append(rank)
+    raw = json.dumps(key).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID, float | None]:
+    """Returns (created_at, id, rank); rank is None for unranked cursors."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, id, *rank = json.loads(raw)
+        if len(rank) > 1 or (rank and not isinstance(rank[0], (int, float))):
+            raise ValueError(cursor)
+        return datetime.fromisoformat(created_at), UUID(id), (float(rank[0]) if rank else None)
+    except (ValueError, TypeError):
+        raise BadRequestError("Invalid cursor")
@@ -1,4 +1,23 @@
-"""Simple list-based profanity filter for MVP."""
+"""Profanity and contact-detail filter for user-written text.
+
+Every term is expanded into an obfuscation-tolerant pattern: common
+look-alike characters (``@`` for ``a``, ``0`` for ``o``, ...), repeated
+letters and single punctuation separators between letters (``f.u.c.k``) all
+match. Spaces are not separators: "a s s ignment" is an ordinary word.
+Those patterns and the email / phone number patterns are compiled into one
+regex. Letter repeats are possessive and a term is only tried at the start
+of a run of its first letter, so the regex never re-scans a run of
+look-alikes: checking time stays proportional to the text's length, even
+for input built to make it backtrack.
+
+Phone numbers must look like one: a ``+`` country code, or a leading ``0``
+with the digits written in groups (``050 123 4567``, ``(04) 123-4567``);
+8-15 digits, and not a date. Bare digit runs such as invoice and account
+numbers are kept, even when they start with ``0``.
+"""
+
+import re
+from itertools import groupby
 
 PROFANITY_LIST = {
     "fuck", "shit", "ass", "bitch", "bastard", "damn", "crap",
@@ -6,21 +25,152 @@ PROFANITY_LIST = {
     "bullshit", "dumbass", "jackass", "idiot", "moron", "retard",
 }
 
+# Characters commonly substituted for each letter
+_LOOKALIKES = {
+    "a": "a@4", "b": "b8", "e": "e3", "g": "g9", "i": "i1!|",
+    "l": "l1|", "o": "o0", "s": "s$5", "t": "t7",
+}
+_SEPARATOR = r"[._*\-]?"
+_SUFFIX = r"(?:s|es|ed|er|ers|ing|in)?"
+
+EMAIL_PLACEHOLDER = "[email removed]"
+PHONE_PLACEHOLDER = "[phone removed]"
+
+
+def _class(c: str) -> str:
+    return f"[{re.escape(_LOOKALIKES.get(c, c))}]"
+
+
+def _runs(term: str) -> tuple[tuple[str, int], ...]:
+    """``term`` as (letter, count) runs: ``ass`` -> ``(("a", 1), ("s", 2))``."""
+    return tuple((c, len(list(group))) for c, group in groupby(term))
+
+
+def _run(c: str, count: int, possessive: bool) -> str:
+    """At least ``count`` of letter ``c`` or its look-alikes.
+
+    The open-ended repeat is possessive: once a run is consumed the engine
+    never hands characters back to retry shorter runs, which is what made
+    ``a+s+s+`` quadratic on long runs of ``s``.
+    """
+    cls = _class(c)
+    more = f"(?:{_SEPARATOR}{cls})"
+    required = f"{more}{{{count - 1}}}" if count > 1 else ""
+    return f"{cls}{required}{more}{'*+' if possessive else '*'}"
+
+
+def _trie_pattern(terms) -> str:
+    """One pattern for all ``terms``, factored on shared prefixes of letter runs.
+
+    The regex engine then tests each run once per position instead of once
+    per term: ``ass`` and ``asshole`` share ``a`` and ``ss``, then ``hole``
+    is optional.
+    A term only starts at the beginning of a run of its first letter, so a
+    long run of look-alikes such as ``$$$$`` is tried once, not from every
+    character in it.
+    """
+    trie: dict = {}
+    for term in terms:
+        node = trie
+        for run in _runs(term):
+            node = node.setdefault(run, {})
+        node[None] = {}
+
+    def emit(node: dict, first: bool = False) -> str:
+        branches = []
+        for run in sorted(k for k in node if k):
+            child = node[run]
+            rest = {k: v for k, v in child.items() if k}
+            # A possessive run must not swallow the first letter of what follows
+            following = "".join(_LOOKALIKES.get(c, c) for c, _ in rest).lower()
+            possessive = not set(_LOOKALIKES.get(run[0], run[0])) & set(following)
+            pattern = _run(*run, possessive)
+            if first:
+                pattern = f"(?<!{_class(run[0])}){pattern}"
+            if rest:
+                optional = "?" if None in child else ""
+                pattern = f"{pattern}(?:{_SEPARATOR}{emit(rest)}){optional}"
+            branches.append(pattern)
+        return branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+
+    # Cheap first-character test before entering the trie
+    first = "".join(sorted({a for term in terms for a in _LOOKALIKES.get(term[0], term[0])}))
+    return f"(?=[{re.escape(first)}]){emit(trie, first=True)}"
+
+
+_PROFANITY = _trie_pattern(PROFANITY_LIST)
+_EMAIL = (
+    r"(?<![\w.+-])[\w.+-]+\s*(?:@|\(at\)|\[at\])\s*[\w-]+"
+    r"(?:\s*(?:\.|\(dot\)|\[dot\])\s*[a-z]{2,})+"
+)
+# A leading + or 0, then digit groups split by single spaces, dots, dashes
+# or brackets; _is_phone rules out bad digit counts, dates and bare runs.
+# Possessive quantifiers keep long digit runs from backtracking.
+_PHONE = r"(?<![\w+(.-])\(?(?:\+|0)\d{1,4}+\)?(?:[ .-]?\(?\d{1,4}+\)?){1,6}+(?![\w.-]?\d)"
+_DATE = re.compile(r"\d{1,4}([./-])\d{1,2}\1\d{1,4}")
+
+_FILTER = re.compile(
+    rf"(?P<profanity>(?<![a-z0-9])(?:{_PROFANITY}){_SUFFIX}(?![a-z0-9]))"
+    rf"|(?P<email>{_EMAIL})"
+    rf"|(?P<phone>{_PHONE})",
+    re.IGNORECASE,
+)
+
+
+def _is_phone(candidate: str) -> bool:
+    digits = sum(c.isdigit() for c in candidate)
+    if not 8 <= digits <= 15 or _DATE.fullmatch(candidate):
+        return False
+    # Without a country code or grouping it is a reference number
+    return not candidate.isdigit()
+
+
+def _kind(match: re.Match) -> str | None:
+    """The match's kind, or None for a phone-shaped match that is not a phone number."""
+    kind = match.lastgroup
+    if kind == "phone" and not _is_phone(match.group()):
+        return None
+    return kind
+
+
+def _replacement(match: re.Match) -> str:
+    kind = _kind(match)
+    if kind == "email":
+        return EMAIL_PLACEHOLDER
+    if kind == "phone":
+        return PHONE_PLACEHOLDER
+    if kind == "profanity":
+        return "*" * len(match.group())
+    return match.group()
+
 
 def check_profanity(text: str) -> bool:
     """Returns True if the text contains profanity."""
-    words = text.lower().split()
-    return any(word.strip(".,!?;:'\"") in PROFANITY_LIST for word in words)
+    return any(m.lastgroup == "profanity" for m in _FILTER.finditer(text))
+
+
+def find_violations(text: str) -> set[str]:
+    """The kinds of content found: ``profanity``, ``email`` and/or ``phone``."""
+    return {kind for m in _FILTER.finditer(text) if (kind := _kind(m))}
 
 
 def censor_profanity(text: str) -> str:
-    """Replace profane words with asterisks."""
-    words = text.split()
-    result = []
-    for word in words:
-        stripped = word.lower().strip(".,!?;:'\"")
-        if stripped in PROFANITY_LIST:
-            result.append("*" * len(word))
-        else:
-            result.append(word)
-    return " ".join(result)
+    """Replace profane words with asterisks, leaving everything else intact."""
+    return _FILTER.sub(
+        lambda m: _replacement(m) if m.lastgroup == "profanity" else m.group(), text
+    )
+
+
+def censor_text(text: str) -> str:
+    """Mask profanity with asterisks and replace emails and phone numbers."""
+    return _FILTER.sub(_replacement, text)
+
+
+def censor_keeping_original(text: str) -> tuple[str, str | None]:
+    """``censor_text`` plus the original, or None when nothing was masked.
+
+    Callers store the original next to the masked text, so masking never
+    destroys what the user wrote.
+    """
+    censored = censor_text(text)
+    return censored, (text if censored != text else None)
@@ -0,0 +1,54 @@
+"""Free-text matching helpers.
+
+On PostgreSQL a term matches through the ``pg_trgm`` GIN indexes (substring
+and typo-tolerant word similarity) and, when a ``tsvector`` column is given,
+through full-text search; matches come back with a relevance rank. Other
+dialects (the SQLite test harness) fall back to a plain ILIKE with no rank.
+"""
+
+import re
+
+from sqlalchemy import ColumnElement, func, literal, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+TS_CONFIG = "simple"
+
+
+def is_postgres(db: AsyncSession) -> bool:
+    return db.bind.dialect.name == "postgresql"
+
+
+def text_search(
+    db: AsyncSession,
+    term: str,
+    column: ColumnElement,
+    vector: ColumnElement | None = None,
+) -> tuple[ColumnElement[bool], ColumnElement[float] | None]:
+    """Returns (where_clause, rank) for ``term`` against ``column``."""
+    substring = column.ilike(f"%{term}%")
+    if not is_postgres(db):
+        return substring, None
+
+    # `<%` is pg_trgm word similarity: "marnia" still finds "Dubai Marina".
+    clauses = [substring, literal(term).op("<%")(column)]
+    rank = func.word_similarity(term, column)
+    if vector is not None:
+        tsquery = func.websearch_to_tsquery(TS_CONFIG, term)
+        clauses.append(vector.op("@@")(tsquery))
+        rank = rank + func.ts_rank(vector, tsquery)
+    return or_(*clauses), rank
+
+
+def highlight(text: str, term: str, max_chars: int = 160) -> str:
+    """A fragment of ``text`` around the first match, with matched words in <b> tags.
+
+    Python stand-in for PostgreSQL's ``ts_headline`` on other dialects.
+    """
+    words = [re.escape(w) for w in term.split()]
+    if not words:
+        return text[:max_chars]
+    pattern = re.compile("|".join(words), re.IGNORECASE)
+    match = pattern.search(text)
+    start = max(0, match.start() - max_chars // 3) if match else 0
+    fragment = text[start:start + max_chars]
+    return pattern.sub(lambda m: f"<b>{m.group(0)}</b>", fragment)
@@ -5,21 +5,38 @@ wired to the FastAPI app through dependency overrides, so that tests can
 run without a live PostgreSQL instance.
 """
 
-from collections.abc import AsyncGenerator
+import asyncio
+import os
+import socket
+from collections.abc import AsyncGenerator, Callable
+from urllib.parse import parse_qsl
 
 import pytest
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+# The suite runs in one process, so entitlements can stay in memory
+os.environ.setdefault("ENTITLEMENT_STORE", "memory")
+
 # ---------------------------------------------------------------------------
 # Make the PostgreSQL UUID type work on SQLite.
 # SQLAlchemy's postgresql.UUID dialect-specific type cannot be rendered on
 # SQLite, so we register a custom DDL compiler that emits CHAR(32) instead.
 # ---------------------------------------------------------------------------
+from sqlalchemy.dialects.postgresql import ARRAY as PG_ARRAY
+from sqlalchemy.dialects.postgresql import JSONB as PG_JSONB
+from sqlalchemy.dialects.postgresql import TSVECTOR as PG_TSVECTOR
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 
+from app.core.security import create_access_token
 from app.models import Base  # noqa: E402  (import order after dialect patch)
+from app.models.user import User
+from app.services.location_service import gazetteer
+from app.utils.cache import clear_all_caches
 
 # Compile PG UUID as CHAR(32) when the target dialect is SQLite.
 from sqlalchemy.ext.compiler import compiles
@@ -30,6 +47,19 @@ def _compile_pg_uuid_for_sqlite(type_, compiler, **kw):  # noqa: ARG001
     return "CHAR(32)"
 
 
+# ARRAY / JSONB columns are stored as JSON text on SQLite.
+@compiles(PG_ARRAY, "sqlite")
+@compiles(PG_JSONB, "sqlite")
+def _compile_pg_json_for_sqlite(type_, compiler, **kw):  # noqa: ARG001
+    return "JSON"
+
+
+# Full-text search vectors are unused on SQLite (search falls back to LIKE).
+@compiles(PG_TSVECTOR, "sqlite")
+def _compile_pg_tsvector_for_sqlite(type_, compiler, **kw):  # noqa: ARG001
+    return "TEXT"
+
+
 # ---------------------------------------------------------------------------
 # Test database engine & session factory (in-memory SQLite)
 # ---------------------------------------------------------------------------
@@ -58,6 +88,93 @@ def _set_sqlite_pragma(dbapi_conn, _connection_record):
     cursor.close()
 
 
+# ---------------------------------------------------------------------------
+# In-memory stand-in for the parts of redis.asyncio the app uses
+# ---------------------------------------------------------------------------
+
+
+class FakeRedis:
+    """In-memory sets; ``latency`` delays writes and ``down`` fails every call."""
+
+    def __init__(self):
+        self.sets: dict[str, set[bytes]] = {}
+        self.ttls: dict[str, int] = {}
+        self.latency = 0.0
+        self.down = False
+
+    def check_up(self):
+        if self.down:
+            raise ConnectionError("fake redis is down")
+
+    async def smembers(self, key: str) -> set[bytes]:
+        self.check_up()
+        return set(self.sets.get(key, ()))
+
+    def pipeline(self, transaction: bool = True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.commands.clear()
+
+    def sadd(self, key: str, *members: bytes):
+        self.commands.append(lambda: self.redis.sets.setdefault(key, set()).update(members))
+
+    def expire(self, key: str, seconds: int):
+        self.commands.append(lambda: self.redis.ttls.__setitem__(key, seconds))
+
+    async def execute(self):
+        self.redis.check_up()
+        await asyncio.sleep(self.redis.latency)
+        for command in self.commands:
+            command()
+        self.commands.clear()
+
+
+# ---------------------------------------------------------------------------
+# Local fake of the Stripe API, served over real HTTP
+# ---------------------------------------------------------------------------
+
+
+class FakeStripe:
+    """Answers checkout session creation after ``latency`` seconds.
+
+    The first ``fail_next`` requests get a 500, to exercise client retries.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.fail_next = 0
+        self.requests: list[dict] = []
+        self.app = FastAPI()
+        self.app.post("/v1/checkout/sessions")(self._create_checkout_session)
+
+    async def _create_checkout_session(self, request: Request):
+        await asyncio.sleep(self.latency)
+        if self.fail_next:
+            self.fail_next -= 1
+            return JSONResponse(
+                {"error": {"type": "api_error", "message": "boom"}}, status_code=500
+            )
+        params = dict(parse_qsl((await request.body()).decode()))
+        self.requests.append(params)
+        session_id = f"cs_test_{len(self.requests)}"
+        return {
+            "id": session_id,
+            "object": "checkout.session",
+            "client_reference_id": params.get("client_reference_id"),
+            "url": f"https://checkout.stripe.test/{session_id}",
+        }
+
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
@@ -66,6 +183,8 @@ def _set_sqlite_pragma(dbapi_conn, _connection_record):
 @pytest.fixture(autouse=True)
 async def _setup_database():
     """Create all tables before each test and drop them after."""
+    clear_all_caches()
+    gazetteer.invalidate()
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield
@@ -104,3 +223,52 @@ async def client() -> AsyncGenerator[AsyncClient, None]:
         yield ac
 
     app.dependency_overrides.clear()
+
+
+@pytest.fixture()
+def auth_headers() -> Callable[[User], dict]:
+    """Builds the bearer-token headers that authenticate a request as ``user``."""
+
+    def headers(user: User) -> dict:
+        return {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+
+    return headers
+
+
+@pytest.fixture()
+def fake_redis(monkeypatch) -> FakeRedis:
+    """Backs the entitlement store with a fake Redis for the test."""
+    from app.services import entitlement_service
+
+    redis = FakeRedis()
+    monkeypatch.setattr(
+        entitlement_service,
+        "store",
+        entitlement_service.RedisEntitlementStore(redis, 60, errors=(ConnectionError,)),
+    )
+    return redis
+
+
+@pytest.fixture()
+async def fake_stripe(monkeypatch) -> AsyncGenerator[FakeStripe, None]:
+    """Runs a FakeStripe server on a free local port and points the Stripe client at it."""
+    from app.config import settings
+    from app.services import stripe_service
+
+    fake = FakeStripe()
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    server = uvicorn.Server(uvicorn.Config(fake.app, log_level="warning", lifespan="off"))
+    task = asyncio.create_task(server.serve(sockets=[sock]))
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    monkeypatch.setattr(settings, "STRIPE_SECRET_KEY", "sk_test_fake")
+    monkeypatch.setattr(settings, "STRIPE_API_BASE", f"http://127.0.0.1:{sock.getsockname()[1]}")
+    monkeypatch.setattr(settings, "STRIPE_MAX_NETWORK_RETRIES", 1)
+    await stripe_service.close()
+    yield fake
+
+    await stripe_service.close()
+    server.should_exit = True
+    await task
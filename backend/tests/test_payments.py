@@ -0,0 +1,756 @@
+"""Tests for wallet debits, review unlocks, top-up checkout and webhooks."""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import time
+from datetime import date
+from uuid import UUID, uuid4
+
+import pytest
+from httpx import AsyncClient
+from pydantic import ValidationError
+from sqlalchemy import event, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import Settings, settings
+from app.core.constants import UnlockTier
+from app.core.exceptions import BadRequestError, ConflictError
+from app.models.location import City, Community, Country
+from app.models.payment import LedgerEntry, StripeTopup, Unlock, Wallet, WebhookEvent
+from app.models.property import Property
+from app.models.review import PropertyReview
+from app.models.user import User
+from app.models.verification import TenancyRecord
+from app.services import entitlement_service, payment_service, stripe_service, webhook_service
+from tests import conftest
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+PAYMENTS_URL = "/api/v1/payments"
+
+
+async def _seed_reviews(db: AsyncSession, count: int) -> tuple[Property, list[PropertyReview]]:
+    country = Country(name="United Arab Emirates", code="AE", currency_code="AED")
+    city = City(country=country, name="Dubai")
+    community = Community(city=city, name="Dubai Marina", slug="dubai-marina")
+    owner = User(email="owner@example.com", first_name="Olive", last_name="Owner", role="landlord")
+    db.add_all([country, city, community, owner])
+    await db.flush()
+    prop = Property(
+        community_id=community.id,
+        property_type="apartment",
+        address_line="Marina Gate 1, Dubai Marina",
+        created_by=owner.id,
+    )
+    db.add(prop)
+    await db.flush()
+
+    reviews = []
+    for n in range(count):
+        tenant = User(
+            email=f"tenant{n}@example.com", first_name="Tess", last_name="Tenant", role="tenant"
+        )
+        db.add(tenant)
+        await db.flush()
+        tenancy = TenancyRecord(
+            tenant_id=tenant.id,
+            property_id=prop.id,
+            move_in_date=date(2024, 1, 1),
+            move_out_date=date(2025, 1, 1),
+            verification_status="verified",
+        )
+        db.add(tenancy)
+        await db.flush()
+        reviews.append(
+            PropertyReview(
+                property_id=prop.id,
+                tenant_id=tenant.id,
+                tenancy_record_id=tenancy.id,
+                overall_rating=4,
+                rating_plumbing=4,
+                review_text=f"Review {n} of the flat, plumbing was fine.",
+                status="published",
+            )
+        )
+    db.add_all(reviews)
+    await db.flush()
+    return prop, reviews
+
+
+async def _add_buyer(db: AsyncSession, credits: int) -> User:
+    buyer = User(email="buyer@example.com", first_name="Bea", last_name="Buyer", role="lead")
+    db.add(buyer)
+    await db.flush()
+    db.add(Wallet(user_id=buyer.id, balance_credits=credits))
+    await db.flush()
+    return buyer
+
+
+# ---------------------------------------------------------------------------
+# Wallet debits
+# ---------------------------------------------------------------------------
+
+
+class TestWalletDebits:
+    async def test_unlock_debits_with_one_conditional_update(self, db_session: AsyncSession):
+        _, reviews = await _seed_reviews(db_session, 1)
+        buyer = await _add_buyer(db_session, 100)
+        await db_session.commit()
+
+        statements = []
+
+        def capture(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(Engine, "before_cursor_execute", capture)
+        try:
+            _, charged, balance = await payment_service.purchase_unlock(
+                buyer, reviews[0].id, UnlockTier.DETAILED, db_session
+            )
+        finally:
+            event.remove(Engine, "before_cursor_execute", capture)
+        # Existing unlocks, conditional debit, unlock insert, ledger insert
+        assert len(statements) == 4
+        assert "balance_credits >=" in statements[1]
+        assert (charged, balance) == (settings.CREDIT_PRICE_UNLOCK_DETAILED, 100 - charged)
+
+    async def test_insufficient_balance_leaves_wallet_untouched(self, db_session: AsyncSession):
+        _, reviews = await _seed_reviews(db_session, 1)
+        buyer = await _add_buyer(db_session, 3)
+
+        with pytest.raises(BadRequestError, match="Need 15, have 3"):
+            await payment_service.purchase_unlock(
+                buyer, reviews[0].id, UnlockTier.DETAILED, db_session
+            )
+        assert await db_session.scalar(select(func.count()).select_from(Unlock)) == 0
+        assert await db_session.scalar(select(Wallet.balance_credits)) == 3
+
+    async def test_parallel_purchases_never_overdraw(self, db_session: AsyncSession):
+        price = settings.CREDIT_PRICE_UNLOCK_DETAILED
+        affordable, attempts = 6, 15
+        _, reviews = await _seed_reviews(db_session, attempts)
+        buyer = await _add_buyer(db_session, price * affordable + price // 2)
+        await db_session.commit()
+
+        sessions = [conftest.test_session_factory() for _ in range(attempts)]
+        try:
+            results = await asyncio.gather(
+                *(
+                    payment_service.purchase_unlock(buyer, review.id, UnlockTier.DETAILED, session)
+                    for session, review in zip(sessions, reviews)
+                ),
+                return_exceptions=True,
+            )
+            for session in sessions:
+                await session.commit()
+        finally:
+            for session in sessions:
+                await session.close()
+
+        succeeded = [r for r in results if not isinstance(r, Exception)]
+        assert all(isinstance(r, BadRequestError) for r in results if isinstance(r, Exception))
+        assert len(succeeded) == affordable
+        assert min(balance for _, _, balance in succeeded) == price // 2
+
+        db_session.expire_all()
+        assert await db_session.scalar(select(Wallet.balance_credits)) == price // 2
+        assert await db_session.scalar(select(func.count()).select_from(Unlock)) == affordable
+        assert await db_session.scalar(select(func.sum(LedgerEntry.amount))) == -price * affordable
+
+    async def test_contact_request_refund_restores_balance(
+        self, client: AsyncClient, db_session: AsyncSession, auth_headers
+    ):
+        prop, reviews = await _seed_reviews(db_session, 1)
+        buyer = await _add_buyer(db_session, 40)
+        await db_session.commit()
+
+        response = await client.post(
+            f"{PAYMENTS_URL}/contact-request",
+            json={"tenant_id": str(reviews[0].tenant_id), "property_id": str(prop.id)},
+            headers=auth_headers(buyer),
+        )
+        body = response.json()
+        assert body["new_balance"] == 40 - settings.CREDIT_PRICE_CONTACT_REQUEST
+
+        await payment_service.refund_contact_request(
+            UUID(body["contact_request_id"]), buyer.id, db_session
+        )
+        assert await db_session.scalar(select(Wallet.balance_credits)) == 40
+
+
+# ---------------------------------------------------------------------------
+# Batch unlocks
+# ---------------------------------------------------------------------------
+
+
+class TestBatchUnlock:
+    async def test_cart_priced_with_upgrade_differences(
+        self, client: AsyncClient, db_session: AsyncSession, auth_headers
+    ):
+        _, reviews = await _seed_reviews(db_session, 3)
+        buyer = await _add_buyer(db_session, 100)
+        db_session.add(Unlock(user_id=buyer.id, review_id=reviews[0].id, tier="summary"))
+        await db_session.commit()
+
+        response = await client.post(
+            f"{PAYMENTS_URL}/unlock/batch",
+            json={
+                "items": [
+                    {"review_id": str(reviews[0].id), "tier": "detailed"},
+                    {"review_id": str(reviews[1].id), "tier": "detailed"},
+                    {"review_id": str(reviews[2].id), "tier": "full"},
+                ]
+            },
+            headers=auth_headers(buyer),
+        )
+        body = response.json()
+        expected = [
+            settings.CREDIT_PRICE_UNLOCK_DETAILED - settings.CREDIT_PRICE_UNLOCK_SUMMARY,
+            settings.CREDIT_PRICE_UNLOCK_DETAILED,
+            settings.CREDIT_PRICE_UNLOCK_FULL,
+        ]
+        assert [line["credits_charged"] for line in body["unlocks"]] == expected
+        assert body["credits_charged"] == sum(expected)
+        assert body["new_balance"] == 100 - sum(expected)
+        # User lookup, existing unlocks, debit, unlock insert, ledger insert
+        assert response.headers["X-Query-Count"] == "5"
+
+        ledger = (await db_session.execute(select(LedgerEntry))).scalars().all()
+        charged = {UUID(line["unlock_id"]): -line["credits_charged"] for line in body["unlocks"]}
+        assert {e.ref_id: e.amount for e in ledger} == charged
+        assert {e.ref_type for e in ledger} == {"unlock"}
+        tiers = await payment_service.resolve_unlock_tiers(
+            buyer.id, [r.id for r in reviews], db_session
+        )
+        assert tiers == {
+            reviews[0].id: "detailed",
+            reviews[1].id: "detailed",
+            reviews[2].id: "full",
+        }
+
+    async def test_unaffordable_cart_buys_nothing(self, db_session: AsyncSession):
+        _, reviews = await _seed_reviews(db_session, 3)
+        buyer = await _add_buyer(db_session, 40)
+
+        with pytest.raises(BadRequestError, match="Need 45, have 40"):
+            await payment_service.purchase_unlocks(
+                buyer, [(r.id, UnlockTier.DETAILED) for r in reviews], db_session
+            )
+        assert await db_session.scalar(select(func.count()).select_from(Unlock)) == 0
+        assert await db_session.scalar(select(Wallet.balance_credits)) == 40
+
+    async def test_rejects_duplicate_and_already_held_items(
+        self, client: AsyncClient, db_session: AsyncSession, auth_headers
+    ):
+        _, reviews = await _seed_reviews(db_session, 1)
+        buyer = await _add_buyer(db_session, 100)
+        db_session.add(Unlock(user_id=buyer.id, review_id=reviews[0].id, tier="full"))
+        await db_session.commit()
+
+        item = {"review_id": str(reviews[0].id), "tier": "detailed"}
+        duplicate = await client.post(
+            f"{PAYMENTS_URL}/unlock/batch",
+            json={"items": [item, item]},
+            headers=auth_headers(buyer),
+        )
+        held = await client.post(
+            f"{PAYMENTS_URL}/unlock/batch", json={"items": [item]}, headers=auth_headers(buyer)
+        )
+        assert duplicate.status_code == 400
+        assert held.status_code == 409
+
+    async def test_unknown_reviews_fail_the_cart_with_their_ids(
+        self, client: AsyncClient, db_session: AsyncSession, auth_headers
+    ):
+        _, reviews = await _seed_reviews(db_session, 1)
+        buyer = await _add_buyer(db_session, 100)
+        await db_session.commit()
+        missing = uuid4()
+
+        items = [
+            {"review_id": str(reviews[0].id), "tier": "detailed"},
+            {"review_id": str(missing), "tier": "detailed"},
+        ]
+        response = await client.post(
+            f"{PAYMENTS_URL}/unlock/batch", json={"items": items}, headers=auth_headers(buyer)
+        )
+
+        assert response.status_code == 404
+        assert str(missing) in response.json()["detail"]
+        assert str(reviews[0].id) not in response.json()["detail"]
+        assert await db_session.scalar(select(func.count()).select_from(Unlock)) == 0
+        assert await db_session.scalar(select(Wallet.balance_credits)) == 100
+
+    async def test_unaffordable_cart_queues_no_grants(self, db_session: AsyncSession):
+        _, reviews = await _seed_reviews(db_session, 2)
+        buyer = await _add_buyer(db_session, 1)
+        await db_session.commit()
+
+        items = [(review.id, UnlockTier.FULL) for review in reviews]
+        with pytest.raises(BadRequestError, match="Insufficient credits"):
+            await payment_service.purchase_unlocks(buyer, items, db_session)
+        # Committing what is left of the session must not grant the cart
+        await db_session.commit()
+
+        entitlements = await entitlement_service.get_entitlements(buyer.id, db_session)
+        assert entitlements.reviews == {}
+
+
+# ---------------------------------------------------------------------------
+# Property passes
+# ---------------------------------------------------------------------------
+
+
+class TestPropertyPass:
+    async def test_one_row_covers_existing_and_future_reviews(
+        self, client: AsyncClient, db_session: AsyncSession, auth_headers
+    ):
+        prop, reviews = await _seed_reviews(db_session, 2)
+        buyer = await _add_buyer(db_session, 100)
+        await db_session.commit()
+
+        response = await client.post(
+            f"{PAYMENTS_URL}/unlock/property",
+            json={"property_id": str(prop.id), "tier": "detailed"},
+            headers=auth_headers(buyer),
+        )
+        assert response.json()["credits_charged"] == settings.CREDIT_PRICE_PROPERTY_PASS_DETAILED
+
+        later = PropertyReview(
+            property_id=prop.id,
+            tenant_id=buyer.id,
+            tenancy_record_id=reviews[0].tenancy_record_id,
+            overall_rating=2,
+            rating_plumbing=2,
+            review_text="Written after the pass was bought; the boiler broke twice.",
+            status="published",
+        )
+        db_session.add(later)
+        await db_session.commit()
+
+        ids = [r.id for r in reviews] + [later.id]
+        tiers = await payment_service.resolve_unlock_tiers(buyer.id, ids, db_session)
+        assert tiers == dict.fromkeys(ids, "detailed")
+        assert await db_session.scalar(select(func.count()).select_from(Unlock)) == 1
+
+        check = await client.get(
+            f"{PAYMENTS_URL}/unlocks/check",
+            params={"review_id": str(later.id)},
+            headers=auth_headers(buyer),
+        )
+        assert check.json()["highest_tier"] == "detailed"
+
+        search = await client.get(
+            "/api/v1/reviews/search", params={"q": "boiler"}, headers=auth_headers(buyer)
+        )
+        assert [hit["id"] for hit in search.json()["items"]] == [str(later.id)]
+
+    async def test_review_unlocks_respect_the_pass(self, db_session: AsyncSession):
+        prop, reviews = await _seed_reviews(db_session, 1)
+        buyer = await _add_buyer(db_session, 200)
+        await payment_service.purchase_property_pass(
+            buyer, prop.id, UnlockTier.DETAILED, db_session
+        )
+
+        with pytest.raises(ConflictError):
+            await payment_service.purchase_unlock(
+                buyer, reviews[0].id, UnlockTier.DETAILED, db_session
+            )
+        # Going past the pass tier is priced on the review's own unlocks only
+        _, charged, _ = await payment_service.purchase_unlock(
+            buyer, reviews[0].id, UnlockTier.FULL, db_session
+        )
+        assert charged == settings.CREDIT_PRICE_UNLOCK_FULL
+
+    async def test_upgrading_a_pass_charges_the_difference(self, db_session: AsyncSession):
+        prop, _ = await _seed_reviews(db_session, 1)
+        buyer = await _add_buyer(db_session, 200)
+        await payment_service.purchase_property_pass(buyer, prop.id, UnlockTier.SUMMARY, db_session)
+
+        _, charged, balance = await payment_service.purchase_property_pass(
+            buyer, prop.id, UnlockTier.FULL, db_session
+        )
+        assert charged == (
+            settings.CREDIT_PRICE_PROPERTY_PASS_FULL - settings.CREDIT_PRICE_PROPERTY_PASS_SUMMARY
+        )
+        assert balance == 200 - settings.CREDIT_PRICE_PROPERTY_PASS_FULL
+        with pytest.raises(ConflictError):
+            await payment_service.purchase_property_pass(
+                buyer, prop.id, UnlockTier.DETAILED, db_session
+            )
+
+    async def test_unknown_property_is_not_charged(
+        self, client: AsyncClient, db_session: AsyncSession, auth_headers
+    ):
+        buyer = await _add_buyer(db_session, 100)
+        await db_session.commit()
+
+        response = await client.post(
+            f"{PAYMENTS_URL}/unlock/property",
+            json={"property_id": str(uuid4()), "tier": "detailed"},
+            headers=auth_headers(buyer),
+        )
+
+        assert response.status_code == 404
+        assert await db_session.scalar(select(func.count()).select_from(Unlock)) == 0
+        assert await db_session.scalar(select(Wallet.balance_credits)) == 100
+
+
+# ---------------------------------------------------------------------------
+# Entitlement cache
+# ---------------------------------------------------------------------------
+
+
+class TestEntitlementCache:
+    async def test_repeat_checks_and_purchases_cost_no_entitlement_queries(
+        self, client: AsyncClient, db_session: AsyncSession, auth_headers
+    ):
+        _, reviews = await _seed_reviews(db_session, 2)
+        buyer = await _add_buyer(db_session, 100)
+        await db_session.commit()
+
+        async def check(review):
+            return await client.get(
+                f"{PAYMENTS_URL}/unlocks/check",
+                params={"review_id": str(review.id)},
+                headers=auth_headers(buyer),
+            )
+
+        cold = await check(reviews[0])
+        warm = await check(reviews[1])
+        assert cold.headers["X-Query-Count"] == "2"  # user, entitlements
+        assert warm.headers["X-Query-Count"] == "1"  # user only
+
+        await client.post(
+            f"{PAYMENTS_URL}/unlock",
+            json={"review_id": str(reviews[1].id), "tier": "summary"},
+            headers=auth_headers(buyer),
+        )
+        after = await check(reviews[1])
+        assert after.json()["highest_tier"] == "summary"
+        assert after.headers["X-Query-Count"] == "1"
+
+    def test_memory_store_refuses_multiple_workers(self, monkeypatch):
+        monkeypatch.setattr(settings, "ENTITLEMENT_STORE", "memory")
+        monkeypatch.setattr(settings, "WEB_CONCURRENCY", 4)
+        with pytest.raises(RuntimeError, match="WEB_CONCURRENCY=4"):
+            entitlement_service._build_store()
+
+        monkeypatch.setattr(settings, "WEB_CONCURRENCY", 1)
+        store = entitlement_service._build_store()
+        assert isinstance(store, entitlement_service.MemoryEntitlementStore)
+
+    def test_unknown_store_is_a_config_error(self):
+        with pytest.raises(ValidationError, match="ENTITLEMENT_STORE"):
+            Settings(ENTITLEMENT_STORE="memcached")
+
+    async def test_rolled_back_purchase_grants_nothing(self, db_session: AsyncSession):
+        _, reviews = await _seed_reviews(db_session, 1)
+        buyer = await _add_buyer(db_session, 100)
+        await db_session.commit()
+        await entitlement_service.get_entitlements(buyer.id, db_session)
+
+        buyer_id, review_id = buyer.id, reviews[0].id
+        await payment_service.purchase_unlock(buyer, review_id, UnlockTier.FULL, db_session)
+        await db_session.rollback()
+
+        entitlements = await entitlement_service.get_entitlements(buyer_id, db_session)
+        assert entitlements.reviews == {}
+
+    async def test_redis_store_merges_early_grants_into_the_fill(
+        self, db_session: AsyncSession, fake_redis
+    ):
+        prop, reviews = await _seed_reviews(db_session, 2)
+        buyer = await _add_buyer(db_session, 200)
+        await payment_service.purchase_unlock(buyer, reviews[0].id, UnlockTier.SUMMARY, db_session)
+        await db_session.commit()
+
+        await payment_service.purchase_property_pass(
+            buyer, prop.id, UnlockTier.DETAILED, db_session
+        )
+        await db_session.commit()
+        await asyncio.sleep(0)
+        # Grants made before any fill leave an incomplete set behind
+        key = f"entitlements:{buyer.id}"
+        assert len(fake_redis.sets[key]) == 2
+        assert entitlement_service.COMPLETE not in fake_redis.sets[key]
+
+        tiers = await payment_service.resolve_unlock_tiers(
+            buyer.id, [r.id for r in reviews], db_session
+        )
+        assert tiers == {reviews[0].id: "detailed", reviews[1].id: "detailed"}
+        assert entitlement_service.COMPLETE in fake_redis.sets[key]
+        assert fake_redis.ttls[key] == 60
+
+    async def test_purchase_response_waits_for_the_grant(
+        self, client: AsyncClient, db_session: AsyncSession, fake_redis, auth_headers
+    ):
+        _, reviews = await _seed_reviews(db_session, 1)
+        buyer = await _add_buyer(db_session, 100)
+        await db_session.commit()
+        url = f"{PAYMENTS_URL}/unlocks/check"
+        params = {"review_id": str(reviews[0].id)}
+        before = await client.get(url, params=params, headers=auth_headers(buyer))
+        assert before.json()["highest_tier"] is None
+
+        fake_redis.latency = 0.05
+        await client.post(
+            f"{PAYMENTS_URL}/unlock",
+            json={"review_id": str(reviews[0].id), "tier": "detailed"},
+            headers=auth_headers(buyer),
+        )
+        after = await client.get(url, params=params, headers=auth_headers(buyer))
+        assert after.json()["highest_tier"] == "detailed"
+
+    async def test_redis_outage_falls_back_to_the_database(
+        self, client: AsyncClient, db_session: AsyncSession, fake_redis, auth_headers
+    ):
+        _, reviews = await _seed_reviews(db_session, 1)
+        buyer = await _add_buyer(db_session, 100)
+        await db_session.commit()
+        fake_redis.down = True
+
+        bought = await client.post(
+            f"{PAYMENTS_URL}/unlock",
+            json={"review_id": str(reviews[0].id), "tier": "summary"},
+            headers=auth_headers(buyer),
+        )
+        check = await client.get(
+            f"{PAYMENTS_URL}/unlocks/check",
+            params={"review_id": str(reviews[0].id)},
+            headers=auth_headers(buyer),
+        )
+
+        assert bought.status_code == 200
+        assert check.json()["highest_tier"] == "summary"
+        listing = await client.get(
+            f"/api/v1/reviews/property/{reviews[0].property_id}", headers=auth_headers(buyer)
+        )
+        assert listing.status_code == 200
+
+
+# ---------------------------------------------------------------------------
+# Top-up checkout
+# ---------------------------------------------------------------------------
+
+
+class TestTopupCheckout:
+    async def test_checkout_creation_does_not_block_the_loop(
+        self, fake_stripe: conftest.FakeStripe
+    ):
+        fake_stripe.latency = 0.2
+        gaps = []
+
+        async def ticker():
+            last = time.perf_counter()
+            while True:
+                await asyncio.sleep(0.01)
+                now = time.perf_counter()
+                gaps.append(now - last)
+                last = now
+
+        ticking = asyncio.create_task(ticker())
+        start = time.perf_counter()
+        sessions = await asyncio.gather(
+            *(
+                stripe_service.create_checkout_session(
+                    {"mode": "payment", "client_reference_id": str(n)}
+                )
+                for n in range(10)
+            )
+        )
+        elapsed = time.perf_counter() - start
+        ticking.cancel()
+
+        assert sorted(s.client_reference_id for s in sessions) == sorted(str(n) for n in range(10))
+        # Ten 200 ms Stripe round-trips overlap instead of queueing behind each other
+        assert elapsed < 1.0
+        assert max(gaps) < 0.15
+
+    async def test_retries_server_errors(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        fake_stripe: conftest.FakeStripe,
+        auth_headers,
+    ):
+        buyer = await _add_buyer(db_session, 0)
+        await db_session.commit()
+        fake_stripe.fail_next = 1
+
+        response = await client.post(
+            f"{PAYMENTS_URL}/topup", json={"tier": "small"}, headers=auth_headers(buyer)
+        )
+
+        assert response.status_code == 200
+        topup = await db_session.scalar(select(StripeTopup))
+        assert (
+            response.json()["checkout_url"]
+            == f"https://checkout.stripe.test/{topup.stripe_checkout_session_id}"
+        )
+        assert fake_stripe.requests[0]["client_reference_id"] == str(topup.id)
+        assert fake_stripe.requests[0]["line_items[0][price_data][unit_amount]"] == str(
+            settings.CREDIT_TOPUP_SMALL_CENTS
+        )
+
+
+# ---------------------------------------------------------------------------
+# Webhook inbox
+# ---------------------------------------------------------------------------
+
+WEBHOOK_SECRET = "whsec_test"
+
+
+async def _add_topup(db: AsyncSession, buyer: User) -> StripeTopup:
+    topup = StripeTopup(
+        user_id=buyer.id,
+        credits_amount=settings.CREDIT_TOPUP_SMALL_CREDITS,
+        amount_cents=settings.CREDIT_TOPUP_SMALL_CENTS,
+        status="pending",
+    )
+    db.add(topup)
+    await db.flush()
+    return topup
+
+
+def _completed_event(event_id: str, topup_id) -> dict:
+    return {
+        "id": event_id,
+        "object": "event",
+        "type": "checkout.session.completed",
+        "data": {"object": {"metadata": {"topup_id": str(topup_id)}, "payment_intent": "pi_test"}},
+    }
+
+
+async def _deliver(client: AsyncClient, event: dict):
+    payload = json.dumps(event)
+    timestamp = int(time.time())
+    signature = hmac.new(
+        WEBHOOK_SECRET.encode(), f"{timestamp}.{payload}".encode(), hashlib.sha256
+    ).hexdigest()
+    return await client.post(
+        f"{PAYMENTS_URL}/webhook",
+        content=payload,
+        headers={"stripe-signature": f"t={timestamp},v1={signature}"},
+    )
+
+
+class TestWebhookInbox:
+    @pytest.fixture(autouse=True)
+    def _webhook_secret(self, monkeypatch):
+        monkeypatch.setattr(settings, "STRIPE_WEBHOOK_SECRET", WEBHOOK_SECRET)
+
+    async def test_acknowledges_without_applying_and_dedupes_by_event_id(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        buyer = await _add_buyer(db_session, 0)
+        topup = await _add_topup(db_session, buyer)
+        await db_session.commit()
+
+        for _ in range(2):
+            response = await _deliver(client, _completed_event("evt_1", topup.id))
+            assert response.status_code == 200
+
+        assert await db_session.scalar(select(func.count()).select_from(WebhookEvent)) == 1
+        assert await db_session.scalar(select(Wallet.balance_credits)) == 0
+
+        assert await webhook_service.process_batch(db_session) == 1
+        db_session.expire_all()
+        assert (
+            await db_session.scalar(select(Wallet.balance_credits))
+            == settings.CREDIT_TOPUP_SMALL_CREDITS
+        )
+        assert await db_session.scalar(select(WebhookEvent.status)) == "processed"
+        assert await webhook_service.process_batch(db_session) == 0
+
+    async def test_rejects_bad_signature(self, client: AsyncClient, db_session: AsyncSession):
+        response = await client.post(
+            f"{PAYMENTS_URL}/webhook",
+            content=json.dumps(_completed_event("evt_1", "x")),
+            headers={"stripe-signature": "t=1,v1=bad"},
+        )
+        assert response.status_code == 400
+        assert await db_session.scalar(select(func.count()).select_from(WebhookEvent)) == 0
+
+    async def test_credits_a_topup_once_across_events(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        buyer = await _add_buyer(db_session, 0)
+        topup = await _add_topup(db_session, buyer)
+        await db_session.commit()
+
+        for event_id in ("evt_1", "evt_2"):
+            await _deliver(client, _completed_event(event_id, topup.id))
+        await webhook_service.process_batch(db_session)
+
+        db_session.expire_all()
+        assert (
+            await db_session.scalar(select(Wallet.balance_credits))
+            == settings.CREDIT_TOPUP_SMALL_CREDITS
+        )
+        assert await db_session.scalar(select(func.count()).select_from(LedgerEntry)) == 1
+        statuses = await db_session.scalars(select(WebhookEvent.status))
+        assert set(statuses) == {"processed"}
+
+    async def test_failing_event_is_isolated_and_retried(
+        self, client: AsyncClient, db_session: AsyncSession, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "WEBHOOK_MAX_ATTEMPTS", 2)
+        buyer = await _add_buyer(db_session, 0)
+        topup = await _add_topup(db_session, buyer)
+        await db_session.commit()
+
+        await _deliver(client, _completed_event("evt_bad", "not-a-uuid"))
+        await _deliver(client, _completed_event("evt_good", topup.id))
+
+        await webhook_service.process_batch(db_session)
+        bad = await db_session.get(WebhookEvent, "evt_bad")
+        assert (bad.status, bad.attempts) == ("pending", 1)
+        assert bad.last_error.startswith("ValueError")
+        assert (
+            await db_session.scalar(select(Wallet.balance_credits))
+            == settings.CREDIT_TOPUP_SMALL_CREDITS
+        )
+
+        await webhook_service.process_batch(db_session)
+        assert (bad.status, bad.attempts) == ("failed", 2)
+        assert await webhook_service.process_batch(db_session) == 0
+
+    async def test_worker_drains_the_inbox_when_woken(
+        self, client: AsyncClient, db_session: AsyncSession, monkeypatch
+    ):
+        monkeypatch.setattr(webhook_service, "async_session_factory", conftest.test_session_factory)
+        monkeypatch.setattr(settings, "WEBHOOK_POLL_INTERVAL_SECONDS", 60)
+        buyer = await _add_buyer(db_session, 0)
+        topup = await _add_topup(db_session, buyer)
+        await db_session.commit()
+
+        batches: asyncio.Queue[int] = asyncio.Queue()
+        process_batch = webhook_service.process_batch
+
+        async def recording_process_batch(db):
+            claimed = await process_batch(db)
+            batches.put_nowait(claimed)
+            return claimed
+
+        monkeypatch.setattr(webhook_service, "process_batch", recording_process_batch)
+        worker = asyncio.create_task(webhook_service.run_worker())
+        try:
+            assert await asyncio.wait_for(batches.get(), 1) == 0  # Empty inbox, now sleeping
+            await _deliver(client, _completed_event("evt_1", topup.id))
+            # Woken well before the 60 s poll interval
+            assert await asyncio.wait_for(batches.get(), 1) == 1
+        finally:
+            worker.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await worker
+
+        assert (
+            await db_session.scalar(select(Wallet.balance_credits))
+            == settings.CREDIT_TOPUP_SMALL_CREDITS
+        )
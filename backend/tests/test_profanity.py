@@ -0,0 +1,133 @@
+"""Tests for the profanity and contact-detail filter."""
+
+import time
+
+import pytest
+
+from app.utils.profanity import (
+    EMAIL_PLACEHOLDER,
+    PHONE_PLACEHOLDER,
+    censor_keeping_original,
+    censor_profanity,
+    censor_text,
+    check_profanity,
+    find_violations,
+)
+
+
+class TestModerationFilter:
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "what the fuck",
+            "F.U.C.K off",
+            "sh1t",
+            "fuuuuck",
+            "b!tch",
+            "you @ss",
+            "assholes",
+            "Idiot!",
+        ],
+    )
+    def test_catches_profanity_and_obfuscations(self, text: str):
+        assert check_profanity(text)
+
+    @pytest.mark.parametrize(
+        "text",
+        ["class assessment passed", "Scunthorpe", "as soon as possible", "dickens", "passage"],
+    )
+    def test_ignores_words_that_merely_contain_a_term(self, text: str):
+        assert not check_profanity(text)
+
+    def test_censors_in_place(self):
+        assert censor_text("Damn, the sh1t AC!") == "****, the **** AC!"
+
+    def test_masks_contact_details(self):
+        text = (
+            "Call +971 50 123 4567 or email jane.doe+flat@example.co.uk, "
+            "or jane (at) mail (dot) com"
+        )
+        assert find_violations(text) == {"email", "phone"}
+        assert censor_text(text) == (
+            f"Call {PHONE_PLACEHOLDER} or email {EMAIL_PLACEHOLDER}, or {EMAIL_PLACEHOLDER}"
+        )
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Moved in 2024-01-15",
+            "Paid on 2025.01.15",
+            "Lease ends 01.02.2026",
+            "Invoice 12345678",
+            "DEWA account 2001234567",
+            "Account 0123456789",
+            "Version 100.200.300",
+            "The a s s ignment was late",
+        ],
+    )
+    def test_leaves_dates_numbers_and_spaced_words(self, text: str):
+        assert find_violations(text) == set()
+        assert censor_text(text) == text
+
+    @pytest.mark.parametrize(
+        "phone", ["+971501234567", "04-123-4567", "(+971) 4 123 4567", "+44 (0)20 7946 0958"]
+    )
+    def test_masks_phone_formats(self, phone: str):
+        assert censor_text(f"ring {phone} today") == f"ring {PHONE_PLACEHOLDER} today"
+
+    def test_keeps_the_original_only_when_masked(self):
+        assert censor_keeping_original("call 050 123 4567") == (
+            f"call {PHONE_PLACEHOLDER}",
+            "call 050 123 4567",
+        )
+        assert censor_keeping_original("all good") == ("all good", None)
+
+    def test_leaves_prices_and_years(self):
+        text = "Rent went from 120000 to 135,000 AED between 2024 and 2025."
+        assert censor_text(text) == text
+
+    def test_censor_profanity_keeps_contact_details(self):
+        assert censor_profanity("crap, mail me at a@b.com") == "****, mail me at a@b.com"
+
+
+class TestThroughput:
+    def test_censors_long_texts(self):
+        base = (
+            "The AC leaked every summer and the landlord took weeks to fix it. "
+            "Call 050 123 4567 about the deposit, it was a damn mess. "
+        )
+        texts = [(f"Flat {n}. " + base * 50)[:5000] for n in range(200)]
+
+        start = time.perf_counter()
+        censored = [censor_text(text) for text in texts]
+        elapsed = time.perf_counter() - start
+
+        assert all(PHONE_PLACEHOLDER in text and "damn" not in text for text in censored)
+        # ~1.5 ms per text locally; the bound only catches pathological backtracking
+        assert elapsed < 5.0
+
+    def test_long_digit_runs_do_not_backtrack(self):
+        text = ("0" + "1" * 60 + " ") * 80
+        start = time.perf_counter()
+        assert censor_text(text) == text
+        assert time.perf_counter() - start < 0.05
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "$" * 5000,
+            "@" * 5000,
+            "!" * 5000,
+            "|" * 5000,
+            "a@" * 2500,
+            "i|" * 2500,
+            "a" + "s" * 5000 + "x",
+            "fu" + "u.u" * 1666 + "x",
+        ],
+        ids=["dollars", "ats", "bangs", "pipes", "a@", "i|", "ass...x", "fu.u...x"],
+    )
+    def test_look_alike_runs_do_not_backtrack(self, text: str):
+        # Quadratic backtracking took 0.5-10 s on these; normal text takes ~2 ms
+        start = time.perf_counter()
+        censor_text(text)
+        assert time.perf_counter() - start < 0.1
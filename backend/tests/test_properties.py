@@ -0,0 +1,366 @@
+"""Tests for the property search endpoints."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.location import City, Community, Country
+from app.models.property import Property
+from app.models.user import User
+from app.services import property_service
+from app.services.location_service import gazetteer
+from app.utils.search import text_search
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+SEARCH_URL = "/api/v1/properties"
+
+
+async def _seed_properties(db: AsyncSession, count: int) -> list[Community]:
+    country = Country(name="United Arab Emirates", code="AE", currency_code="AED")
+    city = City(country=country, name="Dubai")
+    communities = [
+        Community(city=city, name=name, slug=name.lower().replace(" ", "-"))
+        for name in ("Dubai Marina", "Jumeirah Park", "Al Barsha")
+    ]
+    user = User(email="seed@example.com", first_name="Seed", last_name="User", role="tenant")
+    db.add_all([country, city, user, *communities])
+    await db.flush()
+
+    # Groups of four share a timestamp so keyset paging must break ties on id.
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for i in range(count):
+        db.add(
+            Property(
+                community_id=communities[i % len(communities)].id,
+                property_type="apartment",
+                bedrooms=i % 4,
+                address_line=f"Unit {i}, Tower {i % 7}",
+                created_by=user.id,
+                created_at=base - timedelta(minutes=i // 4),
+                # A north-south line of units about 1.1 km apart
+                latitude=25.08 + i * 0.01,
+                longitude=55.14,
+            )
+        )
+    await db.commit()
+    return communities
+
+
+# ---------------------------------------------------------------------------
+# Search
+# ---------------------------------------------------------------------------
+
+
+class TestSearchProperties:
+    async def test_search_enriches_location_names(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        await _seed_properties(db_session, 6)
+
+        response = await client.get(SEARCH_URL, params={"page_size": 6})
+        assert response.status_code == 200
+
+        body = response.json()
+        assert body["total"] == 6
+        assert {item["city_name"] for item in body["items"]} == {"Dubai"}
+        assert {item["community_name"] for item in body["items"]} == {
+            "Dubai Marina", "Jumeirah Park", "Al Barsha",
+        }
+
+    @pytest.mark.parametrize("page_size", [5, 50])
+    async def test_query_count_is_flat_in_page_size(
+        self, client: AsyncClient, db_session: AsyncSession, page_size: int
+    ):
+        await _seed_properties(db_session, 60)
+
+        await client.get(SEARCH_URL)  # warm the gazetteer
+        small = await client.get(SEARCH_URL, params={"page_size": 1})
+        response = await client.get(SEARCH_URL, params={"page_size": page_size})
+        assert response.status_code == 200
+        assert len(response.json()["items"]) == page_size
+        assert int(response.headers["X-Query-Count"]) > 0
+        assert response.headers["X-Query-Count"] == small.headers["X-Query-Count"]
+
+    async def test_cursor_pagination_walks_every_row_once(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        await _seed_properties(db_session, 23)
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"page_size": 5, "include_total": "false"}
+            if cursor:
+                params["cursor"] = cursor
+            body = (await client.get(SEARCH_URL, params=params)).json()
+            assert body["total"] is None
+            seen.extend(item["id"] for item in body["items"])
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+
+        assert len(seen) == 23
+        assert len(set(seen)) == 23
+
+        offset_ids = []
+        for page in range(1, 6):
+            body = (await client.get(SEARCH_URL, params={"page_size": 5, "page": page})).json()
+            assert body["total"] == 23
+            offset_ids.extend(item["id"] for item in body["items"])
+        assert offset_ids == seen
+
+    async def test_cursor_pagination_keeps_relevance_order(
+        self, client: AsyncClient, db_session: AsyncSession, monkeypatch
+    ):
+        await _seed_properties(db_session, 23)
+
+        # SQLite has no relevance rank; stand in one that disagrees with recency
+        def ranked_text_search(db, term, column, vector=None):
+            match, _ = text_search(db, term, column, vector)
+            return match, (func.length(Property.address_line) * 7) % 5
+
+        monkeypatch.setattr(property_service, "text_search", ranked_text_search)
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"q": "unit", "page_size": 5}
+            if cursor:
+                params["cursor"] = cursor
+            body = (await client.get(SEARCH_URL, params=params)).json()
+            seen.extend(item["id"] for item in body["items"])
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+
+        assert len(set(seen)) == len(seen) == 23
+        offset_ids = []
+        for page in range(1, 6):
+            params = {"q": "unit", "page_size": 5, "page": page}
+            body = (await client.get(SEARCH_URL, params=params)).json()
+            offset_ids.extend(item["id"] for item in body["items"])
+        assert offset_ids == seen
+
+    async def test_invalid_cursor_returns_400(self, client: AsyncClient):
+        response = await client.get(SEARCH_URL, params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
+
+    async def test_text_filter_falls_back_to_substring_match(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        await _seed_properties(db_session, 14)
+
+        body = (await client.get(SEARCH_URL, params={"q": "tower 3"})).json()
+        assert body["total"] == 2
+        assert all("Tower 3" in item["address_line"] for item in body["items"])
+
+    async def test_facets_counted_under_active_filters(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        await _seed_properties(db_session, 12)
+
+        response = await client.get(SEARCH_URL, params={"facets": "true", "bedrooms_min": 2})
+        assert response.status_code == 200
+
+        facets = response.json()["facets"]
+        assert facets["property_type"] == [{"value": "apartment", "count": 6}]
+        assert facets["bedrooms"] == [{"value": "2", "count": 3}, {"value": "3", "count": 3}]
+        assert [(f["label"], f["count"]) for f in facets["city"]] == [("Dubai", 6)]
+
+    async def test_facets_are_cached_briefly(self, client: AsyncClient, db_session: AsyncSession):
+        await _seed_properties(db_session, 4)
+
+        await client.get(SEARCH_URL)  # warm the gazetteer
+        first = await client.get(SEARCH_URL, params={"facets": "true"})
+        second = await client.get(SEARCH_URL, params={"facets": "true"})
+        assert second.json()["facets"] == first.json()["facets"]
+        assert int(second.headers["X-Query-Count"]) == int(first.headers["X-Query-Count"]) - 1
+
+
+class TestGeoSearch:
+    async def test_nearby_returns_nearest_first_within_radius(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        await _seed_properties(db_session, 10)
+
+        response = await client.get(
+            f"{SEARCH_URL}/nearby", params={"lat": 25.08, "lng": 55.14, "radius_km": 3}
+        )
+        assert response.status_code == 200
+
+        items = response.json()
+        assert [item["address_line"] for item in items] == [
+            "Unit 0, Tower 0", "Unit 1, Tower 1", "Unit 2, Tower 2",
+        ]
+        assert items[0]["distance_km"] == 0
+        assert 1.0 < items[1]["distance_km"] < 1.2
+        assert items[0]["community_name"] == "Dubai Marina"
+
+    async def test_nearby_reads_a_bounded_candidate_set(self, db_session: AsyncSession):
+        await _seed_properties(db_session, 40)
+
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, *args):
+            statements.append((statement, parameters))
+
+        event.listen(Engine, "before_cursor_execute", capture)
+        try:
+            hits = await property_service.search_nearby(25.201, 55.14, 50, 3, db_session)
+        finally:
+            event.remove(Engine, "before_cursor_execute", capture)
+
+        assert [prop.address_line for prop, _ in hits] == [
+            "Unit 12, Tower 5", "Unit 13, Tower 6", "Unit 11, Tower 4",
+        ]
+        [(statement, parameters)] = statements
+        assert "LIMIT" in statement
+        assert 6 in parameters
+
+    async def test_within_bounds(self, client: AsyncClient, db_session: AsyncSession):
+        await _seed_properties(db_session, 10)
+
+        params = {"min_lat": 25.095, "max_lat": 25.125, "min_lng": 55.0, "max_lng": 55.2}
+        response = await client.get(f"{SEARCH_URL}/within", params=params)
+        assert response.status_code == 200
+        assert sorted(item["address_line"] for item in response.json()) == [
+            "Unit 2, Tower 2", "Unit 3, Tower 3", "Unit 4, Tower 4",
+        ]
+
+        inverted = {**params, "min_lat": 26.0}
+        assert (await client.get(f"{SEARCH_URL}/within", params=inverted)).status_code == 400
+
+    async def test_within_a_large_box_returns_the_most_reviewed(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        await _seed_properties(db_session, 40)
+        for prop in (await db_session.execute(select(Property))).scalars():
+            prop.review_count = int(prop.address_line.split()[1].rstrip(","))
+        await db_session.commit()
+
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, *args):
+            statements.append((statement, parameters))
+
+        event.listen(Engine, "before_cursor_execute", capture)
+        try:
+            hits = await property_service.search_within_bounds(-90, 90, -180, 180, 3, db_session)
+        finally:
+            event.remove(Engine, "before_cursor_execute", capture)
+
+        assert [prop.address_line for prop in hits] == [
+            "Unit 39, Tower 4", "Unit 38, Tower 3", "Unit 37, Tower 2",
+        ]
+        # The LIMIT is in SQL, so ix_properties_review_count_id stops the scan after three rows
+        [(statement, parameters)] = statements
+        assert "ORDER BY properties.review_count DESC" in statement
+        assert "LIMIT" in statement
+        assert 3 in parameters
+
+    async def test_within_a_box_across_the_antimeridian(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        communities = await _seed_properties(db_session, 3)
+        user_id = (await db_session.execute(select(User.id))).scalar_one()
+        for address, lng in (("Suva", 178.4), ("Apia", -171.8), ("Honolulu", -157.9)):
+            db_session.add(
+                Property(
+                    community_id=communities[0].id, property_type="villa", address_line=address,
+                    created_by=user_id, latitude=-15.0, longitude=lng,
+                )
+            )
+        await db_session.commit()
+
+        params = {"min_lat": -20, "max_lat": -10, "min_lng": 170, "max_lng": -170}
+        response = await client.get(f"{SEARCH_URL}/within", params=params)
+        assert response.status_code == 200
+        assert sorted(item["address_line"] for item in response.json()) == ["Apia", "Suva"]
+
+
+class TestCommunitySearch:
+    async def test_search_communities_by_name(self, client: AsyncClient, db_session: AsyncSession):
+        await _seed_properties(db_session, 0)
+
+        url = f"{SEARCH_URL}/locations/communities/search"
+        response = await client.get(url, params={"q": "jume"})
+        assert response.status_code == 200
+        assert [c["name"] for c in response.json()] == ["Jumeirah Park"]
+
+    async def test_autocomplete_matches_word_prefixes_without_queries(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        await _seed_properties(db_session, 0)
+        url = f"{SEARCH_URL}/locations/communities/search"
+
+        await client.get(url, params={"q": "du"})  # warm the gazetteer
+        response = await client.get(url, params={"q": "MARINA"})
+        assert [(c["name"], c["city_name"]) for c in response.json()] == [("Dubai Marina", "Dubai")]
+        assert response.headers["X-Query-Count"] == "0"
+
+    async def test_falls_back_to_sql_match_when_no_prefix_matches(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        await _seed_properties(db_session, 0)
+        url = f"{SEARCH_URL}/locations/communities/search"
+
+        await client.get(url, params={"q": "du"})  # warm the gazetteer
+        # Not a word prefix; trigram similarity on PostgreSQL, substring here
+        response = await client.get(url, params={"q": "arsha"})
+        assert [c["name"] for c in response.json()] == ["Al Barsha"]
+        assert response.headers["X-Query-Count"] == "1"
+
+    async def test_load_overlapping_an_invalidation_is_not_kept(self, db_session: AsyncSession):
+        await _seed_properties(db_session, 0)
+
+        invalidations = []
+
+        def invalidate_once(*args):
+            if not invalidations:
+                invalidations.append(True)
+                gazetteer.invalidate()  # A location commit lands mid-load
+
+        event.listen(Engine, "before_cursor_execute", invalidate_once)
+        try:
+            index = await gazetteer.get_index(db_session)
+        finally:
+            event.remove(Engine, "before_cursor_execute", invalidate_once)
+
+        assert index.by_slug["al-barsha"].name == "Al Barsha"
+        assert gazetteer.is_stale()
+        await gazetteer.get_index(db_session)
+        assert not gazetteer.is_stale()
+
+    async def test_gazetteer_refreshes_after_location_commit(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        communities = await _seed_properties(db_session, 0)
+        url = f"{SEARCH_URL}/locations/communities/search"
+        assert (await client.get(url, params={"q": "palm"})).json() == []
+
+        db_session.add(
+            Community(city_id=communities[0].city_id, name="Palm Jumeirah", slug="palm-jumeirah")
+        )
+        await db_session.commit()
+
+        response = await client.get(url, params={"q": "palm"})
+        assert [c["name"] for c in response.json()] == ["Palm Jumeirah"]
+
+    async def test_community_by_slug_includes_parent_chain(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        await _seed_properties(db_session, 0)
+
+        response = await client.get(f"{SEARCH_URL}/locations/communities/al-barsha")
+        assert response.status_code == 200
+        assert [(p["kind"], p["name"]) for p in response.json()["parents"]] == [
+            ("city", "Dubai"), ("country", "United Arab Emirates"),
+        ]
+        assert (await client.get(f"{SEARCH_URL}/locations/communities/nowhere")).status_code == 404
@@ -0,0 +1,731 @@
+"""Tests for review listing, summaries and access tiers."""
+
+from datetime import date, datetime, timedelta, timezone
+from uuid import uuid4
+
+import numpy as np
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.constants import ReviewType
+from app.models.location import City, Community, Country
+from app.models.payment import Unlock
+from app.models.property import Property
+from app.models.review import PropertyReview, PropertyReviewPhoto, ReviewLshBand
+from app.models.stats import PropertyRatingMonthly
+from app.models.user import User
+from app.models.verification import TenancyRecord, VerificationDocument
+from app.schemas.review import LandlordReviewCreateRequest, PropertyReviewCreateRequest
+from app.services import (
+    dispute_service,
+    duplicate_service,
+    entitlement_service,
+    review_service,
+    verification_service,
+)
+from app.utils import minhash
+from app.utils.cache import clear_all_caches
+from app.utils.histogram import distribution_stats
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+REVIEWS_URL = "/api/v1/reviews"
+
+REVIEW_TEXT = "The AC leaked every summer and the landlord took weeks to fix it. " * 5
+
+DISTINCT_TEXTS = [
+    "Quiet building with a great gym, but parking was always full after seven in the evening.",
+    "Water pressure on the upper floors dropped every morning and maintenance never came.",
+    "The owner answered messages within an hour and returned the deposit on the last day.",
+]
+
+
+async def _seed_property(db: AsyncSession) -> Property:
+    country = Country(name="United Arab Emirates", code="AE", currency_code="AED")
+    city = City(country=country, name="Dubai")
+    community = Community(city=city, name="Dubai Marina", slug="dubai-marina")
+    owner = User(email="owner@example.com", first_name="Olive", last_name="Owner", role="landlord")
+    db.add_all([country, city, community, owner])
+    await db.flush()
+
+    prop = Property(
+        community_id=community.id,
+        property_type="apartment",
+        address_line="Marina Gate 1, Dubai Marina",
+        created_by=owner.id,
+    )
+    db.add(prop)
+    await db.flush()
+    return prop
+
+
+async def _add_tenant(db: AsyncSession, prop: Property, n: int) -> tuple[User, TenancyRecord]:
+    tenant = User(
+        email=f"tenant{n}@example.com", first_name="Tess", last_name=f"Tenant{n}", role="tenant"
+    )
+    db.add(tenant)
+    await db.flush()
+    tenancy = TenancyRecord(
+        tenant_id=tenant.id,
+        property_id=prop.id,
+        move_in_date=date(2024, 1, 1),
+        move_out_date=date(2025, 1, 1),
+        verification_status="verified",
+    )
+    db.add(tenancy)
+    await db.flush()
+    return tenant, tenancy
+
+
+async def _add_review(
+    db: AsyncSession, prop: Property, n: int, status: str = "published", **ratings
+) -> PropertyReview:
+    tenant, tenancy = await _add_tenant(db, prop, n)
+    ratings = ratings or {"rating_plumbing": 4, "rating_hvac": 2}
+    review = PropertyReview(
+        property_id=prop.id,
+        tenant_id=tenant.id,
+        tenancy_record_id=tenancy.id,
+        overall_rating=sum(ratings.values()) / len(ratings),
+        review_text=f"Review {n}. {REVIEW_TEXT}",
+        public_excerpt=f"Excerpt {n}",
+        status=status,
+        verification_status="verified",
+        published_at=datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(days=n),
+        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(days=n),
+        **ratings,
+    )
+    db.add(review)
+    await db.flush()
+    return review
+
+
+async def _create_review(db: AsyncSession, prop: Property, n: int, text: str) -> PropertyReview:
+    """A review submitted through the service by a verified tenant."""
+    tenant, tenancy = await _add_tenant(db, prop, n)
+    data = PropertyReviewCreateRequest(
+        property_id=prop.id,
+        tenancy_record_id=tenancy.id,
+        rating_plumbing=3,
+        review_text=text,
+    )
+    return await review_service.create_property_review(data, tenant, db)
+
+
+async def _add_viewer(db: AsyncSession) -> User:
+    viewer = User(email="viewer@example.com", first_name="Vic", last_name="Viewer", role="lead")
+    db.add(viewer)
+    await db.flush()
+    return viewer
+
+
+# ---------------------------------------------------------------------------
+# Listing
+# ---------------------------------------------------------------------------
+
+
+class TestPropertyReviewListing:
+    async def test_items_follow_each_review_unlock_tier(
+        self, client: AsyncClient, db_session: AsyncSession, auth_headers
+    ):
+        prop = await _seed_property(db_session)
+        reviews = [await _add_review(db_session, prop, n) for n in range(4)]
+        viewer = await _add_viewer(db_session)
+        db_session.add_all(
+            [
+                Unlock(user_id=viewer.id, review_id=reviews[3].id, tier="summary"),
+                Unlock(user_id=viewer.id, review_id=reviews[2].id, tier="summary"),
+                Unlock(user_id=viewer.id, review_id=reviews[2].id, tier="detailed"),
+                Unlock(user_id=viewer.id, review_id=reviews[1].id, tier="full"),
+            ]
+        )
+        db_session.add_all(
+            [
+                PropertyReviewPhoto(review_id=r.id, file_url=f"/u/{r.id}.jpg", file_name="ac.jpg")
+                for r in (reviews[1], reviews[2])
+            ]
+        )
+        await db_session.commit()
+
+        response = await client.get(
+            f"{REVIEWS_URL}/property/{prop.id}", headers=auth_headers(viewer)
+        )
+        assert response.status_code == 200
+
+        # Newest first: reviews[3] (summary), [2] (detailed), [1] (full), [0] (locked)
+        summary, detailed, full, locked = response.json()["items"]
+        assert summary["review_text"].endswith("...") and len(summary["review_text"]) == 203
+        assert summary["rating_plumbing"] is None
+        assert detailed["rating_plumbing"] == 4
+        assert detailed["review_text"] == reviews[2].review_text
+        assert full["review_text"] == reviews[1].review_text
+        assert [p["file_name"] for p in full["photos"]] == ["ac.jpg"]
+        assert detailed["photos"] == [] and summary["photos"] == []
+        assert "review_text" not in locked and locked["public_excerpt"] == "Excerpt 0"
+
+    async def test_anonymous_sees_snippets_only(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        prop = await _seed_property(db_session)
+        await _add_review(db_session, prop, 0)
+        await db_session.commit()
+
+        body = (await client.get(f"{REVIEWS_URL}/property/{prop.id}")).json()
+        assert body["total"] == 1
+        assert set(body["items"][0]) == {
+            "id",
+            "property_id",
+            "overall_rating",
+            "public_excerpt",
+            "status",
+            "verification_status",
+            "created_at",
+            "landlord_response",
+        }
+
+    async def test_landlord_replies_are_batched_with_the_page(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        prop = await _seed_property(db_session)
+        reviews = [await _add_review(db_session, prop, n) for n in range(6)]
+        await db_session.commit()
+        for review in reviews[::2]:
+            await dispute_service.create_landlord_response(
+                prop.created_by,
+                f"Fixed the AC after review {review.id}",
+                property_review_id=review.id,
+                db=db_session,
+            )
+        await db_session.commit()
+
+        url = f"{REVIEWS_URL}/property/{prop.id}"
+        one = await client.get(url, params={"page_size": 1})
+        clear_all_caches()
+        page = await client.get(url, params={"page_size": 6})
+        assert page.headers["X-Query-Count"] == one.headers["X-Query-Count"]
+
+        replies = {i["id"]: i["landlord_response"] for i in page.json()["items"]}
+        assert replies[str(reviews[0].id)]["response_text"].startswith("Fixed the AC")
+        assert replies[str(reviews[1].id)] is None
+
+    async def test_my_reviews_include_photos(
+        self, client: AsyncClient, db_session: AsyncSession, auth_headers
+    ):
+        prop = await _seed_property(db_session)
+        review = await _add_review(db_session, prop, 0)
+        db_session.add(
+            PropertyReviewPhoto(review_id=review.id, file_url="/u/1.jpg", file_name="a.jpg")
+        )
+        await db_session.commit()
+
+        tenant = await db_session.get(User, review.tenant_id)
+        response = await client.get(f"{REVIEWS_URL}/my", headers=auth_headers(tenant))
+        assert response.status_code == 200
+        assert response.json()["property_reviews"][0]["photos"][0]["file_name"] == "a.jpg"
+
+    async def test_snippet_tier_never_reads_review_text(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        prop = await _seed_property(db_session)
+        await _add_review(db_session, prop, 0)
+        await db_session.commit()
+
+        statements = []
+
+        def capture(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(Engine, "before_cursor_execute", capture)
+        try:
+            response = await client.get(f"{REVIEWS_URL}/property/{prop.id}")
+        finally:
+            event.remove(Engine, "before_cursor_execute", capture)
+        assert response.json()["items"][0]["overall_rating"] == 3.0
+        assert statements and not any("review_text" in s for s in statements)
+
+    async def test_rendered_items_are_cached_until_status_changes(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        prop = await _seed_property(db_session)
+        review = await _add_review(db_session, prop, 0)
+        await db_session.commit()
+
+        url = f"{REVIEWS_URL}/property/{prop.id}"
+        cold = await client.get(url)
+        warm = await client.get(url)
+        assert warm.json() == cold.json()
+        # count + page ids only; the item comes from the fragment cache
+        assert warm.headers["X-Query-Count"] == "2"
+
+        dispute = await dispute_service.create_dispute(
+            prop.created_by, "Fake", property_review_id=review.id, db=db_session
+        )
+        await dispute_service.resolve_dispute(
+            dispute.id, "rejected", prop.created_by, None, db_session
+        )
+        await db_session.commit()
+        restored = await client.get(url)
+        assert restored.headers["X-Query-Count"] == "4"  # + snippet and reply lookups
+
+    @pytest.mark.parametrize("page_size", [2, 10])
+    async def test_unlock_lookup_is_one_query_per_page(
+        self, client: AsyncClient, db_session: AsyncSession, page_size: int, auth_headers
+    ):
+        prop = await _seed_property(db_session)
+        reviews = [await _add_review(db_session, prop, n) for n in range(10)]
+        viewer = await _add_viewer(db_session)
+        db_session.add_all(
+            [Unlock(user_id=viewer.id, review_id=r.id, tier="detailed") for r in reviews]
+        )
+        await db_session.commit()
+
+        # Loaded once per user, then served from the cache (see test_payments)
+        await entitlement_service.get_entitlements(viewer.id, db_session)
+
+        url = f"{REVIEWS_URL}/property/{prop.id}"
+        one = await client.get(url, params={"page_size": 1}, headers=auth_headers(viewer))
+        many = await client.get(url, params={"page_size": page_size}, headers=auth_headers(viewer))
+        assert len(many.json()["items"]) == page_size
+        assert many.headers["X-Query-Count"] == one.headers["X-Query-Count"]
+
+
+class TestReviewSearch:
+    async def test_locked_viewers_only_match_the_excerpt(
+        self, client: AsyncClient, db_session: AsyncSession, auth_headers
+    ):
+        prop = await _seed_property(db_session)
+        in_excerpt = await _add_review(db_session, prop, 0)
+        in_excerpt.public_excerpt = "Black mould in the bathroom"
+        in_text = await _add_review(db_session, prop, 1)
+        in_text.review_text = REVIEW_TEXT + " Later we found mould behind the wardrobe."
+        viewer = await _add_viewer(db_session)
+        await db_session.commit()
+
+        params = {"q": "mould", "property_id": str(prop.id)}
+        anonymous = (await client.get(f"{REVIEWS_URL}/search", params=params)).json()
+        assert anonymous["total"] == 1
+        assert anonymous["items"][0]["id"] == str(in_excerpt.id)
+        assert anonymous["items"][0]["highlight"] == "Black <b>mould</b> in the bathroom"
+
+        # Past the summary cut-off, so a summary unlock is not enough
+        db_session.add(Unlock(user_id=viewer.id, review_id=in_text.id, tier="summary"))
+        await db_session.commit()
+        summary = await client.get(
+            f"{REVIEWS_URL}/search", params=params, headers=auth_headers(viewer)
+        )
+        assert summary.json()["total"] == 1
+
+        db_session.add(Unlock(user_id=viewer.id, review_id=in_text.id, tier="detailed"))
+        await db_session.commit()
+        detailed = await client.get(
+            f"{REVIEWS_URL}/search", params=params, headers=auth_headers(viewer)
+        )
+        hit = next(h for h in detailed.json()["items"] if h["id"] == str(in_text.id))
+        assert "<b>mould</b> behind the wardrobe" in hit["highlight"]
+
+    async def test_search_scoped_to_city(self, client: AsyncClient, db_session: AsyncSession):
+        prop = await _seed_property(db_session)
+        review = await _add_review(db_session, prop, 0)
+        review.public_excerpt = "Sewage smell every evening"
+        await db_session.commit()
+
+        community = await db_session.get(Community, prop.community_id)
+        elsewhere = {"q": "sewage", "city_id": str(uuid4())}
+        here = {"q": "sewage", "city_id": str(community.city_id)}
+        assert (await client.get(f"{REVIEWS_URL}/search", params=elsewhere)).json()["total"] == 0
+        assert (await client.get(f"{REVIEWS_URL}/search", params=here)).json()["total"] == 1
+
+
+class TestRatingStats:
+    async def test_summary_follows_status_transitions(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        prop = await _seed_property(db_session)
+        first = await _add_review(
+            db_session, prop, 0, status="submitted", rating_plumbing=5, rating_hvac=3
+        )
+        second = await _add_review(db_session, prop, 1, status="submitted", rating_plumbing=1)
+        await review_service.publish_review(first.id, db_session)
+        await review_service.publish_review(second.id, db_session)
+        await db_session.commit()
+
+        url = f"{REVIEWS_URL}/property/{prop.id}/summary"
+        summary = (await client.get(url)).json()
+        assert summary["review_count"] == 2
+        assert summary["avg_overall"] == 2.5
+        assert summary["avg_plumbing"] == 3.0
+        assert summary["avg_hvac"] == 3.0
+        assert summary["avg_water"] == 0.0
+
+        dispute = await dispute_service.create_dispute(
+            prop.created_by, "Not a tenant here", property_review_id=second.id, db=db_session
+        )
+        await db_session.commit()
+        summary = (await client.get(url)).json()
+        assert summary["review_count"] == 1 and summary["avg_plumbing"] == 5.0
+
+        await dispute_service.resolve_dispute(
+            dispute.id, "rejected", prop.created_by, None, db_session
+        )
+        await db_session.commit()
+        summary = (await client.get(url)).json()
+        assert summary["review_count"] == 2 and summary["avg_plumbing"] == 3.0
+
+        await db_session.refresh(prop)
+        assert prop.review_count == 2 and float(prop.avg_property_rating) == 2.5
+
+    async def test_summary_returns_histograms(self, client: AsyncClient, db_session: AsyncSession):
+        prop = await _seed_property(db_session)
+        reviews = []
+        for n, plumbing in enumerate([5, 1, 1, 4]):
+            review = await _add_review(
+                db_session, prop, n, status="submitted", rating_plumbing=plumbing
+            )
+            await review_service.publish_review(review.id, db_session)
+            reviews.append(review)
+        await dispute_service.create_dispute(
+            prop.created_by, "Fake", property_review_id=reviews[3].id, db=db_session
+        )
+        await db_session.commit()
+
+        body = (await client.get(f"{REVIEWS_URL}/property/{prop.id}/summary")).json()
+        plumbing = body["distributions"]["plumbing"]
+        assert plumbing["histogram"] == [2, 0, 0, 0, 1]
+        assert plumbing["count"] == 3 and plumbing["median"] == 1.0
+        assert 1.0 <= plumbing["ci_low"] < 7 / 3 < plumbing["ci_high"] <= 5.0
+        assert body["distributions"]["hvac"] == {
+            "histogram": [0, 0, 0, 0, 0],
+            "count": 0,
+            "median": None,
+            "ci_low": None,
+            "ci_high": None,
+        }
+
+    def test_even_count_median_is_midpoint(self):
+        hist = np.array([[0, 1, 0, 1, 0], [0, 0, 2, 0, 0]], dtype=np.int32)
+        even, constant = distribution_stats(hist)
+        assert even["median"] == 3.0
+        assert constant["median"] == 3.0 and constant["ci_low"] == constant["ci_high"] == 3.0
+
+    async def test_summary_is_one_query(self, client: AsyncClient, db_session: AsyncSession):
+        prop = await _seed_property(db_session)
+        for n in range(5):
+            review = await _add_review(db_session, prop, n, status="submitted")
+            await review_service.publish_review(review.id, db_session)
+        await db_session.commit()
+
+        response = await client.get(f"{REVIEWS_URL}/property/{prop.id}/summary")
+        assert response.json()["review_count"] == 5
+        assert response.headers["X-Query-Count"] == "1"
+
+
+class TestPropertyTrend:
+    async def test_publish_and_dispute_net_out_in_the_publication_month(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        prop = await _seed_property(db_session)
+        reviews = []
+        for n, hvac in [(0, 1), (1, 3), (2, 5)]:
+            # Created in January, published now
+            review = await _add_review(db_session, prop, n, status="submitted", rating_hvac=hvac)
+            review.published_at = None
+            reviews.append(review)
+        for review in reviews:
+            await review_service.publish_review(review.id, db_session)
+        await dispute_service.create_dispute(
+            prop.created_by, "Fake", property_review_id=reviews[0].id, db=db_session
+        )
+        await db_session.commit()
+
+        rows = await db_session.execute(
+            select(PropertyRatingMonthly.month, PropertyRatingMonthly.review_count)
+        )
+        this_month = date.today().replace(day=1)
+        assert rows.all() == [(this_month, 2)]
+
+        url = f"{REVIEWS_URL}/property/{prop.id}/trend"
+        response = await client.get(url, params={"months": 1})
+        assert response.headers["X-Query-Count"] == "1"
+        assert [
+            (p["month"], p["review_count"], p["avg_hvac"]) for p in response.json()["points"]
+        ] == [
+            (this_month.isoformat(), 2, 4.0),
+        ]
+
+
+class TestCityHeatmap:
+    async def test_heatmap_lists_each_community(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        marina = await _seed_property(db_session)
+        community = await db_session.get(Community, marina.community_id)
+        barsha = Community(city_id=community.city_id, name="Al Barsha", slug="al-barsha")
+        db_session.add(barsha)
+        await db_session.flush()
+        villa = Property(
+            community_id=barsha.id,
+            property_type="villa",
+            address_line="Villa 3, Al Barsha",
+            created_by=marina.created_by,
+        )
+        db_session.add(villa)
+        await db_session.flush()
+
+        for n, (prop, dust) in enumerate([(marina, 2), (marina, 4), (villa, 5)]):
+            review = await _add_review(
+                db_session, prop, n, status="submitted", rating_health_dust=dust
+            )
+            await review_service.publish_review(review.id, db_session)
+        await db_session.commit()
+
+        response = await client.get(f"{REVIEWS_URL}/city/{community.city_id}/heatmap")
+        assert response.headers["X-Query-Count"] == "2"
+        body = response.json()
+        assert body["review_count"] == 3
+        assert body["avg_health_dust"] == pytest.approx(11 / 3)
+        by_name = {c["name"]: c for c in body["communities"]}
+        assert by_name["Dubai Marina"]["avg_health_dust"] == 3.0
+        assert by_name["Al Barsha"]["review_count"] == 1
+        assert by_name["Al Barsha"]["avg_health_dust"] == 5.0
+
+
+class TestBulkModeration:
+    async def test_bulk_publish_reports_each_outcome(
+        self, client: AsyncClient, db_session: AsyncSession, auth_headers
+    ):
+        prop = await _seed_property(db_session)
+        submitted = [
+            await _add_review(db_session, prop, n, status="submitted", rating_plumbing=n + 1)
+            for n in range(3)
+        ]
+        published = await _add_review(db_session, prop, 3)
+        admin = User(email="admin@example.com", first_name="Ada", last_name="Admin", role="admin")
+        db_session.add(admin)
+        await db_session.commit()
+
+        missing = uuid4()
+        ids = [r.id for r in submitted] + [published.id, missing]
+        response = await client.post(
+            "/api/v1/admin/reviews/bulk",
+            json={"review_ids": [str(i) for i in ids], "action": "publish"},
+            headers=auth_headers(admin),
+        )
+        body = response.json()
+        assert body["updated"] == 3
+        assert [r["outcome"] for r in body["results"]] == [
+            "published",
+            "published",
+            "published",
+            "not_submitted",
+            "not_found",
+        ]
+
+        # `published` was inserted directly, so the stats only hold the bulk batch
+        summary = (await client.get(f"{REVIEWS_URL}/property/{prop.id}/summary")).json()
+        assert summary["review_count"] == 3 and summary["avg_plumbing"] == 2.0
+
+    @pytest.mark.parametrize("count", [2, 20])
+    async def test_aggregates_applied_once_per_property(
+        self, client: AsyncClient, db_session: AsyncSession, count: int, auth_headers
+    ):
+        prop = await _seed_property(db_session)
+        reviews = [await _add_review(db_session, prop, n, status="submitted") for n in range(count)]
+        admin = User(email="admin@example.com", first_name="Ada", last_name="Admin", role="admin")
+        db_session.add(admin)
+        await db_session.commit()
+
+        response = await client.post(
+            "/api/v1/admin/reviews/bulk",
+            json={"review_ids": [str(r.id) for r in reviews], "action": "publish"},
+            headers=auth_headers(admin),
+        )
+        assert response.json()["updated"] == count
+        # user lookup, UPDATE ... RETURNING, stats upsert, histogram and property
+        # updates, monthly upsert, then the community lookup and area upserts
+        assert response.headers["X-Query-Count"] == "9"
+
+
+class TestLandlordScorecard:
+    async def test_scorecard_rolls_up_whole_portfolio(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        first = await _seed_property(db_session)
+        second = Property(
+            community_id=first.community_id,
+            property_type="villa",
+            address_line="Villa 9, Dubai Marina",
+            created_by=first.created_by,
+        )
+        db_session.add(second)
+        await db_session.flush()
+
+        reviews = []
+        for n, (prop, responsiveness) in enumerate([(first, 5), (second, 2), (second, 2)]):
+            tenant, tenancy = await _add_tenant(db_session, prop, n)
+            data = LandlordReviewCreateRequest(
+                landlord_id=prop.created_by,
+                property_id=prop.id,
+                tenancy_record_id=tenancy.id,
+                rating_responsiveness=responsiveness,
+                rating_demeanor=4,
+                review_text=DISTINCT_TEXTS[n],
+            )
+            reviews.append(await review_service.create_landlord_review(data, tenant, db_session))
+        await dispute_service.create_dispute(
+            first.created_by, "Never rented", landlord_review_id=reviews[2].id, db=db_session
+        )
+        await db_session.commit()
+
+        response = await client.get(f"{REVIEWS_URL}/landlord/{first.created_by}/summary")
+        body = response.json()
+        assert response.headers["X-Query-Count"] == "1"
+        assert body["review_count"] == 2
+        assert body["avg_responsiveness"] == 3.5
+        assert body["avg_demeanor"] == 4.0
+        assert body["avg_availability"] == 0.0
+        assert body["last_review_at"] is not None
+
+        await db_session.refresh(second)
+        assert float(second.avg_landlord_rating) == 3.0
+
+
+class TestUnlockCheck:
+    async def test_check_reports_highest_tier(
+        self, client: AsyncClient, db_session: AsyncSession, auth_headers
+    ):
+        prop = await _seed_property(db_session)
+        review = await _add_review(db_session, prop, 0)
+        viewer = await _add_viewer(db_session)
+        db_session.add_all(
+            [
+                Unlock(user_id=viewer.id, review_id=review.id, tier="summary"),
+                Unlock(user_id=viewer.id, review_id=review.id, tier="detailed"),
+            ]
+        )
+        await db_session.commit()
+
+        response = await client.get(
+            "/api/v1/payments/unlocks/check",
+            params={"review_id": str(review.id)},
+            headers=auth_headers(viewer),
+        )
+        assert response.json() == {
+            "has_summary": True,
+            "has_detailed": True,
+            "has_full": False,
+            "highest_tier": "detailed",
+        }
+
+
+# ---------------------------------------------------------------------------
+# Near-duplicate detection
+# ---------------------------------------------------------------------------
+
+
+class TestNearDuplicates:
+    def test_similarity_estimates_jaccard(self):
+        base = " ".join(f"word{i}" for i in range(200))
+        edited = base.replace("word50 ", "changed ")
+        a, b = minhash.signature(base), minhash.signature(edited)
+        assert minhash.similarity(a, a) == 1.0
+        assert minhash.similarity(a, b) > 0.9
+        assert minhash.similarity(a, minhash.signature(DISTINCT_TEXTS[0])) < 0.1
+        assert len(minhash.band_hashes(a)) == minhash.BANDS
+
+    async def test_lightly_edited_copy_is_flagged_and_held(self, db_session: AsyncSession):
+        prop = await _seed_property(db_session)
+        text = " ".join(DISTINCT_TEXTS)
+        original = await _create_review(db_session, prop, 0, text)
+        copy = await _create_review(db_session, prop, 1, text.replace("gym", "pool") + " Avoid!")
+        unrelated = await _create_review(db_session, prop, 2, REVIEW_TEXT)
+
+        assert (original.is_flagged, original.status) == (False, "published")
+        assert (copy.is_flagged, copy.status) == (True, "submitted")
+        assert copy.published_at is None
+        assert (unrelated.is_flagged, unrelated.status) == (False, "published")
+
+        matches = await duplicate_service.find_near_duplicates(
+            ReviewType.PROPERTY, text, db_session
+        )
+        assert next(review_id for review_id, _ in matches) == original.id
+        assert {review_id for review_id, _ in matches} == {original.id, copy.id}
+
+    async def test_verification_leaves_flagged_copy_unpublished(self, db_session: AsyncSession):
+        prop = await _seed_property(db_session)
+        text = " ".join(DISTINCT_TEXTS)
+        await _create_review(db_session, prop, 0, text)
+        tenant, tenancy = await _add_tenant(db_session, prop, 1)
+        tenancy.verification_status = "pending"
+        copy = await review_service.create_property_review(
+            PropertyReviewCreateRequest(
+                property_id=prop.id,
+                tenancy_record_id=tenancy.id,
+                rating_plumbing=3,
+                review_text=text.replace("gym", "pool"),
+            ),
+            tenant,
+            db_session,
+        )
+        doc = VerificationDocument(
+            user_id=tenant.id,
+            tenancy_record_id=tenancy.id,
+            document_type="tenancy_contract",
+            file_url="/uploads/contract.pdf",
+            file_name="contract.pdf",
+            file_size_bytes=1024,
+            mime_type="application/pdf",
+        )
+        db_session.add(doc)
+        await db_session.flush()
+
+        await verification_service.admin_review_verification(
+            doc.id, "verified", prop.created_by, None, db_session
+        )
+
+        assert (copy.verification_status, copy.is_flagged) == ("verified", True)
+        assert (copy.status, copy.published_at) == ("submitted", None)
+
+    async def test_probe_reads_only_matching_bands(self, db_session: AsyncSession):
+        prop = await _seed_property(db_session)
+        for n, text in enumerate(DISTINCT_TEXTS):
+            await _create_review(db_session, prop, n, text)
+        band_rows = await db_session.scalar(select(func.count()).select_from(ReviewLshBand))
+        assert band_rows == len(DISTINCT_TEXTS) * minhash.BANDS
+
+        statements = []
+
+        def capture(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(Engine, "before_cursor_execute", capture)
+        try:
+            matches = await duplicate_service.find_near_duplicates(
+                ReviewType.PROPERTY, DISTINCT_TEXTS[1], db_session
+            )
+        finally:
+            event.remove(Engine, "before_cursor_execute", capture)
+        assert len(statements) == 1
+        assert len(matches) == 1
+
+
+class TestReviewCensoring:
+    async def test_submitted_text_is_censored(self, db_session: AsyncSession):
+        prop = await _seed_property(db_session)
+        review = await _create_review(
+            db_session, prop, 0, "The landlord is a m0ron, text him on 050 123 4567 anyway."
+        )
+        assert review.review_text == "The landlord is a *****, text him on [phone removed] anyway."
+        assert review.public_excerpt == review.review_text
+        assert review.review_text_raw == "The landlord is a m0ron, text him on 050 123 4567 anyway."
+        assert review.public_excerpt_raw is None
+
+    async def test_unmasked_text_stores_no_copy(self, db_session: AsyncSession):
+        prop = await _seed_property(db_session)
+        text = "Moved in on 2024-01-15, DEWA account 2001234567 was transferred the same week."
+        review = await _create_review(db_session, prop, 0, text)
+        assert (review.review_text, review.review_text_raw) == (text, None)